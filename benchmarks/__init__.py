@@ -0,0 +1,10 @@
+"""
+Benchmarks de los caminos críticos del juego (FOV, generación, turnos,
+renderizado y guardado).
+
+Se ejecutan sin ventana (driver SDL "dummy") y escriben los resultados en
+JSON para compararlos entre revisiones:
+
+    python benchmarks/run.py -o base.json
+    python benchmarks/run.py -o nuevo.json --compare base.json
+"""
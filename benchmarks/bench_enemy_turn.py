@@ -0,0 +1,34 @@
+"""
+Benchmark de un turno de enemigos completo con N monstruos.
+"""
+from __future__ import annotations
+from typing import Dict
+
+from .common import get_game, measure
+
+
+MONSTER_COUNTS = (10, 50, 100, 200)
+
+
+def run(quick: bool = False) -> Dict[str, Dict[str, float]]:
+    """Mide Game._enemy_turn en un piso poblado con N monstruos."""
+    from roguelike.config import GameState
+    from roguelike.systems.stress import STRESS_DEFAULTS, populate_stress
+
+    game = get_game()
+    repeat = 10 if quick else 50
+
+    results: Dict[str, Dict[str, float]] = {}
+    for count in MONSTER_COUNTS:
+        options = dict(STRESS_DEFAULTS, monsters=count, items=0, blood=0, doors=0, turns=0)
+        populate_stress(game, options)
+        game.state = GameState.PLAYING
+        player = game.player
+        player.fighter.max_hp = 10 ** 9
+
+        def reset() -> None:
+            player.fighter.hp = player.fighter.max_hp
+            game.animation_manager.clear()
+
+        results[f"enemy_turn.m{count}"] = measure(game._enemy_turn, repeat, setup=reset)
+    return results
@@ -0,0 +1,29 @@
+"""
+Benchmark de FOV.compute a distintos radios.
+"""
+from __future__ import annotations
+from typing import Dict
+
+from .common import measure, new_dungeon
+
+
+RADII = (4, 8, 10, 16, 24)
+
+
+def run(quick: bool = False) -> Dict[str, Dict[str, float]]:
+    """Mide FOV.compute y Dungeon.update_fov desde el inicio del piso 5."""
+    from roguelike.config import FOV_RADIUS
+    from roguelike.systems.fov import FOV
+
+    repeat = 50 if quick else 300
+    dungeon, (x, y) = new_dungeon(5)
+
+    results: Dict[str, Dict[str, float]] = {}
+    for radius in RADII:
+        results[f"fov.compute.r{radius}"] = measure(
+            lambda: FOV.compute(dungeon, x, y, radius), repeat
+        )
+    results[f"fov.update_fov.r{FOV_RADIUS}"] = measure(
+        lambda: dungeon.update_fov(x, y, FOV_RADIUS), repeat
+    )
+    return results
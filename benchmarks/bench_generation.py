@@ -0,0 +1,42 @@
+"""
+Benchmark de Dungeon.generate por piso y de los motores para mapas grandes.
+"""
+from __future__ import annotations
+from typing import Dict
+
+from .common import get_game, measure
+
+
+def run(quick: bool = False) -> Dict[str, Dict[str, float]]:
+    """Mide la generación completa (mapa, puertas y población) de cada piso."""
+    from roguelike.config import MAP_WIDTH, MAP_HEIGHT, MAX_DUNGEON_LEVEL
+    from roguelike.world.dungeon import Dungeon
+    from roguelike.world.generators import GENERATOR_ENGINES
+    from roguelike.systems.rng import rng
+
+    get_game()
+    repeat = 5 if quick else 30
+
+    results: Dict[str, Dict[str, float]] = {}
+    for floor in range(1, MAX_DUNGEON_LEVEL + 1):
+        seeds = iter(range(10 ** 6))
+        results[f"generate.floor{floor}"] = measure(
+            lambda: Dungeon(MAP_WIDTH, MAP_HEIGHT, floor).generate(),
+            repeat,
+            setup=lambda: rng.reseed(next(seeds)),
+        )
+
+    # Motores NumPy a 500×500: solo el motor y la generación completa
+    for name, engine in GENERATOR_ENGINES.items():
+        seeds = iter(range(10 ** 6))
+        results[f"engine.{name}500"] = measure(
+            lambda: engine.generate(500, 500, 5, rng.generation),
+            repeat,
+            setup=lambda: rng.reseed(next(seeds)),
+        )
+        results[f"generate.{name}500"] = measure(
+            lambda: Dungeon(500, 500, 5, engine=name).generate(),
+            max(3, repeat // 5),
+            setup=lambda: rng.reseed(next(seeds)),
+        )
+    return results
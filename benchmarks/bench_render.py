@@ -0,0 +1,38 @@
+"""
+Benchmark de un frame de Renderer.render en cada GameState.
+"""
+from __future__ import annotations
+from typing import Dict
+
+from .common import get_game, measure
+
+
+def run(quick: bool = False) -> Dict[str, Dict[str, float]]:
+    """Mide un frame completo (con flip) en cada estado con overlay propio."""
+    from roguelike.config import GameState
+    from roguelike.systems.dialog_manager import dialog_manager
+    from roguelike.systems.shop import get_merchant_shop
+    from roguelike.systems.stress import STRESS_DEFAULTS, populate_stress
+    from roguelike.systems.text import TextContent
+
+    game = get_game()
+    repeat = 20 if quick else 120
+
+    populate_stress(game, dict(STRESS_DEFAULTS, turns=0))
+    game.current_shop = get_merchant_shop()
+    if not dialog_manager.is_active():
+        dialog_manager.start_text(TextContent.from_string("Benchmark de diálogo.", title=""))
+
+    states = (
+        GameState.PLAYING, GameState.INVENTORY, GameState.DEAD, GameState.VICTORY,
+        GameState.PAUSED, GameState.OPTIONS, GameState.DIALOG, GameState.CONSOLE,
+        GameState.SAVE_MENU, GameState.SHOP, GameState.DONATION,
+    )
+
+    results: Dict[str, Dict[str, float]] = {}
+    for state in states:
+        game.state = state
+        results[f"render.{state}"] = measure(game._render_frame, repeat)
+
+    game.state = GameState.PLAYING
+    return results
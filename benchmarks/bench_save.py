@@ -0,0 +1,52 @@
+"""
+Benchmark de SaveManager.save_game / load_game con 1-10 pisos en caché.
+"""
+from __future__ import annotations
+from typing import Dict
+import os
+import tempfile
+
+from .common import get_game, measure, new_dungeon
+
+
+FLOOR_COUNTS = (1, 2, 5, 10)
+
+
+def run(quick: bool = False) -> Dict[str, Dict[str, float]]:
+    """Mide guardar, leer el archivo y restaurar la partida completa."""
+    from roguelike.systems.save_manager import save_manager
+
+    game = get_game()
+    repeat = 3 if quick else 10
+
+    floors = {}
+    for floor in range(1, max(FLOOR_COUNTS) + 1):
+        floors[floor], _ = new_dungeon(floor, seed=floor)
+
+    results: Dict[str, Dict[str, float]] = {}
+    previous_dir = save_manager.save_dir
+    with tempfile.TemporaryDirectory(prefix="bench_save_") as save_dir:
+        save_manager.save_dir = save_dir
+        try:
+            for count in FLOOR_COUNTS:
+                game.dungeons = {floor: floors[floor] for floor in range(1, count + 1)}
+                game.dungeon = game.dungeons[count]
+                game.player.current_floor = count
+
+                results[f"save.floors{count}"] = measure(
+                    lambda: save_manager.save_game(1, game.player, game.dungeon, game.dungeons),
+                    repeat
+                )
+                results[f"load_file.floors{count}"] = measure(
+                    lambda: save_manager.load_game(1), repeat
+                )
+                results[f"load_game.floors{count}"] = measure(
+                    lambda: game._load_game_from_slot(1), repeat
+                )
+                results[f"save.floors{count}"]["size_kib"] = (
+                    os.path.getsize(save_manager.get_save_file_path(1)) / 1024
+                )
+        finally:
+            save_manager.save_dir = previous_dir
+            save_manager.refresh_slots()
+    return results
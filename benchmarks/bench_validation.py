@@ -0,0 +1,49 @@
+"""
+Barrido de semillas con el validador de alcanzabilidad.
+
+Genera muchos pisos (piso = semilla % MAX + 1) y, en cada uno, mide
+validate_dungeon() y cuenta los que no pasan la validación.
+"""
+from __future__ import annotations
+from typing import Any, Dict, List
+import time
+
+from .common import get_game, summarize
+
+
+def run(quick: bool = False) -> Dict[str, Dict[str, Any]]:
+    """Valida 10.000 semillas (500 con --quick) y mide el validador."""
+    from roguelike.config import MAP_WIDTH, MAP_HEIGHT, MAX_DUNGEON_LEVEL
+    from roguelike.world.dungeon import Dungeon
+    from roguelike.world.validator import validate_dungeon
+    from roguelike.systems.rng import rng
+
+    get_game()
+    seeds = 500 if quick else 10_000
+
+    samples: List[float] = []
+    failures: List[int] = []
+    paths: List[int] = []
+    for seed in range(seeds):
+        rng.reseed(seed)
+        dungeon = Dungeon(MAP_WIDTH, MAP_HEIGHT, seed % MAX_DUNGEON_LEVEL + 1)
+        dungeon.generate()
+
+        start = time.perf_counter()
+        report = validate_dungeon(dungeon)
+        samples.append((time.perf_counter() - start) * 1000)
+
+        if not report["ok"]:
+            failures.append(seed)
+        if report["stairs_path"] is not None:
+            paths.append(report["stairs_path"])
+
+    stats: Dict[str, Any] = summarize(samples)
+    stats["extra"] = {
+        "seeds": seeds,
+        "failures": len(failures),
+        "failed_seeds": failures[:20],
+        "stairs_path_mean": round(sum(paths) / len(paths), 1) if paths else None,
+        "stairs_path_max": max(paths) if paths else None,
+    }
+    return {"validate.sweep": stats}
@@ -0,0 +1,110 @@
+"""
+Utilidades compartidas por los benchmarks.
+"""
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Optional
+import os
+import time
+
+# El driver dummy debe fijarse antes de inicializar pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+_game = None
+
+
+def get_game():
+    """
+    Devuelve una partida headless compartida (se crea la primera vez).
+
+    Crear el Game inicializa pygame y la ventana dummy, necesarias para
+    cargar sprites al generar mazmorras.
+    """
+    global _game
+    if _game is None:
+        from roguelike.game import Game
+        from roguelike.systems.rng import rng
+        from roguelike.ui.sprite_manager import sprite_manager
+
+        rng.reseed(0)
+        _game = Game()
+        sprite_manager.load_sprites()
+        _game._new_game()
+    return _game
+
+
+def new_dungeon(floor: int, seed: int = 0):
+    """
+    Genera una mazmorra determinista para un piso.
+
+    Args:
+        floor: Número de piso
+        seed: Semilla de los flujos aleatorios
+
+    Returns:
+        Tupla (dungeon, posición inicial)
+    """
+    from roguelike.config import MAP_WIDTH, MAP_HEIGHT
+    from roguelike.world.dungeon import Dungeon
+    from roguelike.systems.rng import rng
+
+    get_game()
+    rng.reseed(seed)
+    dungeon = Dungeon(MAP_WIDTH, MAP_HEIGHT, floor)
+    start = dungeon.generate()
+    return dungeon, start
+
+
+def measure(
+    func: Callable[[], Any],
+    repeat: int,
+    warmup: int = 1,
+    setup: Optional[Callable[[], Any]] = None
+) -> Dict[str, float]:
+    """
+    Mide el tiempo de una función varias veces.
+
+    Args:
+        func: Función a medir (sin argumentos)
+        repeat: Número de mediciones
+        warmup: Ejecuciones previas no medidas
+        setup: Función opcional ejecutada (sin medir) antes de cada llamada
+
+    Returns:
+        Estadísticas en milisegundos (runs, mean, min, median, p95, max)
+    """
+    for _ in range(warmup):
+        if setup:
+            setup()
+        func()
+
+    samples: List[float] = []
+    for _ in range(max(1, repeat)):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples)
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    Calcula las estadísticas de una lista de tiempos.
+
+    Args:
+        samples: Tiempos en milisegundos (al menos uno)
+
+    Returns:
+        Estadísticas en milisegundos (runs, mean, min, median, p95, max)
+    """
+    samples = sorted(samples)
+    return {
+        "runs": len(samples),
+        "mean_ms": sum(samples) / len(samples),
+        "min_ms": samples[0],
+        "median_ms": samples[len(samples) // 2],
+        "p95_ms": samples[min(len(samples) - 1, int(round(0.95 * (len(samples) - 1))))],
+        "max_ms": samples[-1],
+    }
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Ejecuta los benchmarks y guarda los resultados en JSON.
+
+Uso:
+    python benchmarks/run.py [-o resultados.json] [--only fov,render]
+                             [--quick] [--compare base.json]
+"""
+from __future__ import annotations
+from typing import Any, Dict
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+# Asegurar que el directorio padre del paquete está en el path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from roguelike.benchmarks import common  # noqa: E402,F401  (fija el driver SDL dummy)
+from roguelike.benchmarks import (  # noqa: E402
+    bench_fov, bench_generation, bench_enemy_turn, bench_render, bench_save,
+    bench_validation,
+)
+
+
+# Suites disponibles (nombre → módulo con run(quick) -> Dict)
+SUITES = {
+    "fov": bench_fov,
+    "generation": bench_generation,
+    "enemy_turn": bench_enemy_turn,
+    "render": bench_render,
+    "save": bench_save,
+    "validation": bench_validation,
+}
+
+
+def _git_revision() -> str:
+    """Devuelve el commit actual (o "desconocido" fuera de git)."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "desconocido"
+
+
+def _print_comparison(results: Dict[str, Any], baseline_path: str) -> None:
+    """Imprime la media actual frente a la de un JSON anterior."""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+
+    print(f"\nComparación con {baseline_path} (media):")
+    for name, stats in results.items():
+        base = baseline.get(name)
+        if not base or not base.get("mean_ms"):
+            print(f"  {name:32} {stats['mean_ms']:9.3f}ms  (nuevo)")
+            continue
+        ratio = stats["mean_ms"] / base["mean_ms"]
+        print(f"  {name:32} {base['mean_ms']:9.3f}ms → {stats['mean_ms']:9.3f}ms  x{ratio:.2f}")
+
+
+def main() -> None:
+    """Punto de entrada de los benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmarks de La Mansión de Ámbar")
+    parser.add_argument("-o", "--output", default="bench_results.json",
+                        help="Archivo JSON de salida")
+    parser.add_argument("--only", default="",
+                        help=f"Suites a ejecutar separadas por comas ({', '.join(SUITES)})")
+    parser.add_argument("--quick", action="store_true",
+                        help="Menos repeticiones (para comprobar que todo funciona)")
+    parser.add_argument("--compare", metavar="JSON",
+                        help="Compara con un resultado anterior")
+    args = parser.parse_args()
+
+    selected = [name.strip() for name in args.only.split(",") if name.strip()] or list(SUITES)
+    unknown = [name for name in selected if name not in SUITES]
+    if unknown:
+        parser.error(f"Suites desconocidas: {', '.join(unknown)}")
+
+    results: Dict[str, Any] = {}
+    for name in selected:
+        print(f"[{name}]")
+        suite_results = SUITES[name].run(quick=args.quick)
+        for case, stats in suite_results.items():
+            extra = "".join(f"  {key} {value}" for key, value in stats.get("extra", {}).items())
+            print(f"  {case:32} media {stats['mean_ms']:9.3f}ms  p95 {stats['p95_ms']:9.3f}ms{extra}")
+        results.update(suite_results)
+
+    import pygame
+    report = {
+        "meta": {
+            "revision": _git_revision(),
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\nResultados guardados en {args.output}")
+
+    if args.compare:
+        _print_comparison(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,12 @@ WINDOW_HEIGHT: int = 800
 GAME_TITLE: str = "La Mansión de Ámbar"
 FPS: int = 60
 
+# Modo reposo: sin animaciones ni entrada pendiente, el loop espera eventos
+# (pygame.event.wait) en vez de repintar a FPS fijos
+IDLE_RENDERING: bool = True
+IDLE_MAX_WAIT_MS: int = 1000   # Espera máxima sin eventos ni animaciones
+BACKGROUND_FPS: int = 10       # Tope de FPS con la ventana sin foco
+
 # ============================================================================
 # CONFIGURACIÓN DE TILES ASCII
 # ============================================================================
@@ -68,6 +74,12 @@ FLOOR_MAP_MARGIN: Dict[int, Tuple[int, int]] = {
 }
 FLOOR_MAP_MARGIN_DEFAULT: Tuple[int, int] = (0, 0)  # Sin margen extra
 
+# --- Motor de generación por planta (ver world/generators.py) ---
+# "classic" (salas aleatorias), "bsp" o "caves". Los dos últimos usan
+# NumPy y están pensados para mapas grandes; sin NumPy se usa "classic".
+FLOOR_GENERATOR: Dict[int, str] = {}
+FLOOR_GENERATOR_DEFAULT: str = "classic"
+
 # --- Probabilidad base de spawn por pool ---
 # Primer filtro: ¿aparece esta pool en esta planta?
 # Valor fijo por ahora. Preparado para extender a per-piso/eventos.
@@ -23,7 +23,7 @@ NOTAS:
   - El sistema de spawn pareado (spawn_near_npc) garantiza que Hermes
     aparezca siempre junto al Bibliotecario.
 """
-import random
+from roguelike.systems.rng import rng
 from roguelike.systems.text import DialogTree, DialogNode, DialogOption, InteractiveText
 from roguelike.systems.music import music_manager
 
@@ -313,7 +313,7 @@ def _librarian_dungeon_spawn_condition(floor, event_manager) -> bool:
     # 4. 50% de probabilidad (100% si dev force activo)
     if _dev_force_spawn:
         return True
-    return random.random() < 0.5
+    return rng.generation.random() < 0.5
 
 
 def _hermes_dungeon_spawn_condition(floor, event_manager) -> bool:
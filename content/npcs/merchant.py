@@ -15,7 +15,7 @@ NOTAS:
   - Sus items se pueden modificar desde cualquier parte del código
     usando get_merchant_shop().add_item() / remove_item() / etc.
 """
-import random
+from roguelike.systems.rng import rng
 from roguelike.systems.text import DialogTree, DialogNode, DialogOption, InteractiveText
 
 # Flag DEV: fuerza aparición 100% en pares (solo memoria, NO se guarda)
@@ -137,7 +137,7 @@ def _merchant_spawn_condition(floor, event_manager) -> bool:
         return False
     
     # 3. 50% de probabilidad
-    return random.random() < 0.5
+    return rng.generation.random() < 0.5
 
 
 # ============================================================================
@@ -338,7 +338,7 @@ def register_npc_states(manager) -> None:
     """
     from roguelike.systems.npc_states import NPCStateConfig, StateTransition
     from roguelike.systems.events import event_manager
-    import random
+    from roguelike.systems.rng import rng
     
     # Estado "found" - Dungeon, primera vez que la encuentras
     def nieta_found_spawn_condition(floor: int, evt_mgr) -> bool:  # noqa: ARG001
@@ -348,7 +348,7 @@ def register_npc_states(manager) -> None:
         if not evt_mgr.is_event_triggered("stranger_help_accepted"):
             return False
         # 40% de probabilidad
-        return random.random() <= 0.4
+        return rng.generation.random() <= 0.4
     
     manager.register_npc_state("nieta", NPCStateConfig(
         state_id="found",
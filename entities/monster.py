@@ -3,9 +3,8 @@ Clase Monster - Enemigos del juego.
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
-import random
-
 from .entity import Entity, Fighter
+from ..systems.rng import rng
 from ..config import MONSTER_DATA, COLORS
 
 if TYPE_CHECKING:
@@ -276,9 +275,9 @@ class Monster(Entity):
     
     def _wander(self) -> None:
         """Movimiento aleatorio cuando está idle."""
-        if random.random() < 0.3:  # 30% de probabilidad de moverse
-            dx = random.randint(-1, 1)
-            dy = random.randint(-1, 1)
+        if rng.ai.random() < 0.3:  # 30% de probabilidad de moverse
+            dx = rng.ai.randint(-1, 1)
+            dy = rng.ai.randint(-1, 1)
             if dx != 0 or dy != 0:
                 self._try_move(dx, dy)
     
@@ -389,18 +388,9 @@ def create_monster_for_floor(floor: int, x: int, y: int, dungeon: Optional[Dunge
     Returns:
         Un monstruo apropiado para el nivel
     """
-    # Filtrar monstruos válidos para este piso
-    valid_monsters = []
-    for monster_type, data in MONSTER_DATA.items():
-        if data["min_level"] <= floor <= data["max_level"]:
-            if not data.get("is_boss", False):  # No incluir jefes normalmente
-                valid_monsters.append(monster_type)
-    
-    if not valid_monsters:
-        valid_monsters = ["rat"]  # Fallback
+    from ..systems.spawn_tables import spawn_tables
     
-    # Elegir uno aleatorio con peso hacia los más débiles
-    weights = [1.0 / (i + 1) for i in range(len(valid_monsters))]
-    monster_type = random.choices(valid_monsters, weights=weights)[0]
+    # Tabla precompilada del piso (peso hacia los más débiles, sin jefes)
+    monster_type = spawn_tables.table("monster", floor).sample(rng.generation)
     
     return Monster(x, y, monster_type, dungeon)
@@ -3,13 +3,15 @@ Clase Game - Gestiona el loop principal y el estado del juego.
 """
 from __future__ import annotations
 from typing import Dict, Any, Optional, Set, Tuple, List
+import time
 import pygame
 
 from .config import (
     FPS, FOV_RADIUS, GameState,
-    MAP_WIDTH, MAP_HEIGHT
+    MAP_WIDTH, MAP_HEIGHT, MAX_DUNGEON_LEVEL,
+    IDLE_RENDERING, IDLE_MAX_WAIT_MS, BACKGROUND_FPS
 )
-from .world.dungeon import Dungeon
+from .world.dungeon import Dungeon, FloorRestoreError
 from .world.lobby import Lobby
 from .entities.player import Player
 from .ui.renderer import Renderer
@@ -24,6 +26,10 @@ from .systems.events import event_manager
 from .systems.dev_commands import dev_command_manager
 from .systems.save_manager import save_manager
 from .systems.shop import Shop, get_merchant_shop, reset_merchant_shop
+from .systems.replay import InputRecorder
+from .systems.profiler import frame_profiler
+from .systems.telemetry import telemetry
+from .systems.pregen import floor_pregenerator
 
 
 class Game:
@@ -59,6 +65,11 @@ class Game:
         
         self.state = GameState.MAIN_MENU
         self.running = True
+        
+        # Modo reposo (ver _wait_or_tick): evento recibido mientras se
+        # esperaba y si el próximo frame hay que pintarlo
+        self._pending_events: List[pygame.event.Event] = []
+        self._render_due = True
         self.visible_tiles: Set[Tuple[int, int]] = set()
         
         # Modos de inventario
@@ -113,6 +124,12 @@ class Game:
         self.options_menu_cursor: int = 0  # 0=Volumen, 1=Volver
         self.options_return_state: str = GameState.PAUSED  # Estado al que volver
         
+        # Contador de turnos de la sesión (para replays y métricas)
+        self.turn_count: int = 0
+        
+        # Grabador de entradas (None = no se graba)
+        self.recorder: Optional[InputRecorder] = None
+        
         # Configurar controles
         self._setup_controls()
         
@@ -158,11 +175,15 @@ class Game:
         # Pantalla de splash: carga assets y espera input del jugador
         self.renderer.show_splash_and_load()
         
-        while self.running:
-            if self.state == GameState.MAIN_MENU:
-                self._handle_main_menu()
-            else:
-                self._handle_game_loop()
+        try:
+            while self.running:
+                if self.state == GameState.MAIN_MENU:
+                    self._handle_main_menu()
+                else:
+                    self._handle_game_loop()
+        finally:
+            if self.recorder:
+                self.recorder.close(self)
         
         # Detener todos los sonidos antes de cerrar
         music_manager.stop_all()
@@ -170,79 +191,163 @@ class Game:
     
     def _handle_main_menu(self) -> None:
         """Maneja el menú principal (ahora muestra directamente los slots de guardado)."""
-        # Actualizar información de slots
-        save_manager.refresh_slots()
-        
-        # Renderizar menú de slots
-        self.renderer.render_save_menu_only(self.save_menu_selected, "select")
+        if self._render_due:
+            # Actualizar información de slots
+            save_manager.refresh_slots()
+            
+            # Renderizar menú de slots
+            self.renderer.render_save_menu_only(self.save_menu_selected, "select")
         
-        for event in pygame.event.get():
+        events = self._take_events()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
+                if self.recorder:
+                    self.recorder.record_key(event.key)
                 self._handle_save_menu_input(event.key)
         
-        self.renderer.tick(FPS)
+        self._render_due = self._wait_or_tick(bool(events))
     
     def _handle_game_loop(self) -> None:
         """Loop principal cuando se está jugando."""
+        profiling = frame_profiler.begin("frames")
+        frame_start = time.perf_counter() if telemetry.enabled else 0.0
+        
         # Actualizar animaciones
         self.animation_manager.update()
         
         # Procesar eventos (pero no durante animaciones para que se vean)
+        events = self._take_events()
         if not self.animation_manager.has_active_animations():
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     if self.player and self.dungeon and self.current_save_slot:
                         self._save_game(self.current_save_slot, silent=True)
                     self.running = False
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    # La ventana se volvió a mostrar: repintarla entera
+                    self.renderer.dirty.mark_full()
                 elif event.type == pygame.KEYDOWN:
+                    if self.recorder:
+                        self.recorder.record_key(event.key)
                     self._handle_input(event.key)
                 elif event.type == pygame.TEXTINPUT and self.state == GameState.CONSOLE:
+                    if self.recorder:
+                        self.recorder.record_text(event.text)
                     self.console_input += event.text
                 elif event.type == pygame.MOUSEWHEEL:
+                    if self.recorder:
+                        self.recorder.record_mouse("wheel", event.y)
                     self._handle_mousewheel(event.y)
                 # ── Eventos de ratón para inventario grid ──
                 elif event.type == pygame.MOUSEBUTTONDOWN and self.state == GameState.INVENTORY:
+                    if self.recorder:
+                        self.recorder.record_mouse("down", event.button, *event.pos)
                     self._handle_inventory_mouse_down(event.button, event.pos)
                 elif event.type == pygame.MOUSEBUTTONUP and self.state == GameState.INVENTORY:
+                    if self.recorder:
+                        self.recorder.record_mouse("up", event.button, *event.pos)
                     self._handle_inventory_mouse_up(event.button, event.pos)
                 elif event.type == pygame.MOUSEMOTION and self.state == GameState.INVENTORY:
+                    if self.recorder:
+                        self.recorder.record_mouse("move", *event.pos)
                     self._handle_inventory_mouse_motion(event.pos)
         else:
             # Durante animaciones, solo procesar quit
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     if self.player and self.dungeon and self.current_save_slot:
                         self._save_game(self.current_save_slot, silent=True)
                     self.running = False
         
-        # Renderizar
-        if self.dungeon and self.player:
-            self.renderer.render(
-                self.dungeon,
-                self.player,
-                self.visible_tiles,
-                self.message_log,
-                self.state,
-                self.inventory_mode,
-                self.inventory_cursor,
-                self.inventory_scroll,
-                self.animation_manager,
-                self.console_input,
-                shop=self.current_shop,
-                shop_cursor=self.shop_cursor,
-                pause_cursor=self.pause_menu_cursor,
-                options_cursor=self.options_menu_cursor,
-                donation_amount=self.donation_amount,
-                donation_digit=self.donation_digit,
-                inv_drag_item=self._inv_drag_item if self._inv_dragging else None,
-                inv_drag_mouse_pos=self._inv_drag_mouse_pos,
-                inv_context_menu=self._inv_context_menu,
-                inv_hover_item=self._inv_hover_item,
-            )
+        # Renderizar (en reposo, solo si hubo eventos o toca un cambio visual)
+        if self._render_due or events:
+            self._render_frame()
+        
+        if telemetry.enabled:
+            telemetry.record("frame", time.perf_counter() - frame_start)
+            telemetry.count("frames")
+        
+        # El paso perfilado se cierra antes de la espera: en reposo bloquea
+        # hasta un segundo y no es trabajo del frame
+        reported = self._end_profile_step() if profiling else False
+        
+        self._render_due = self._wait_or_tick(bool(events) or reported)
+    
+    def _take_events(self) -> List[pygame.event.Event]:
+        """Devuelve los eventos pendientes (incluido el recibido en la espera)."""
+        events = self._pending_events + pygame.event.get()
+        self._pending_events = []
+        return events
+    
+    def _wait_or_tick(self, had_events: bool) -> bool:
+        """
+        Espera hasta el siguiente frame.
         
-        self.renderer.tick(FPS)
+        Con animaciones en curso (o justo después de procesar entrada)
+        limita a FPS, o a BACKGROUND_FPS si la ventana no tiene el foco. En
+        reposo bloquea en pygame.event.wait hasta que llega un evento o
+        toca un cambio visual (hoguera, relámpago...), así que no consume
+        CPU. Minimizada, solo la despierta un evento.
+        
+        Args:
+            had_events: Si este frame se procesó algún evento
+            
+        Returns:
+            True si hay que pintar el siguiente frame
+        """
+        focused = pygame.key.get_focused()
+        fps = FPS if focused else BACKGROUND_FPS
+        if not IDLE_RENDERING or had_events or self.animation_manager.has_active_animations():
+            self.renderer.tick(fps)
+            return True
+        
+        timeout = self.renderer.idle_timeout() if self.state != GameState.MAIN_MENU else None
+        if not pygame.display.get_active():
+            timeout = None
+        elif timeout is not None and not focused:
+            timeout = max(timeout, 1.0 / BACKGROUND_FPS)
+        if timeout == 0:
+            self.renderer.tick(fps)
+            return True
+        
+        wait_ms = IDLE_MAX_WAIT_MS if timeout is None else min(IDLE_MAX_WAIT_MS, int(timeout * 1000) + 1)
+        with telemetry.timer("idle.wait"):
+            event = pygame.event.wait(wait_ms)
+        if event.type != pygame.NOEVENT:
+            self._pending_events.append(event)
+            return True
+        # Sin eventos: solo se pinta si venció el cambio visual programado
+        return timeout is not None and wait_ms >= timeout * 1000
+    
+    def _render_frame(self) -> None:
+        """Renderiza un frame del estado actual (si hay partida en curso)."""
+        if self.dungeon and self.player:
+            with telemetry.timer("render"):
+                self.renderer.render(
+                    self.dungeon,
+                    self.player,
+                    self.visible_tiles,
+                    self.message_log,
+                    self.state,
+                    self.inventory_mode,
+                    self.inventory_cursor,
+                    self.inventory_scroll,
+                    self.animation_manager,
+                    self.console_input,
+                    shop=self.current_shop,
+                    shop_cursor=self.shop_cursor,
+                    pause_cursor=self.pause_menu_cursor,
+                    options_cursor=self.options_menu_cursor,
+                    donation_amount=self.donation_amount,
+                    donation_digit=self.donation_digit,
+                    inv_drag_item=self._inv_drag_item if self._inv_dragging else None,
+                    inv_drag_mouse_pos=self._inv_drag_mouse_pos,
+                    inv_context_menu=self._inv_context_menu,
+                    inv_hover_item=self._inv_hover_item,
+                    turn=self.turn_count,
+                )
     
     def _handle_input(self, key: int) -> None:
         """
@@ -289,6 +394,7 @@ class Game:
     def _handle_playing_input(self, key: int) -> None:
         """Maneja la entrada durante el juego."""
         player_acted = False
+        turn_start = time.perf_counter() if telemetry.enabled else 0.0
         
         # Movimiento
         direction = None
@@ -337,13 +443,22 @@ class Game:
             self.player.update()
             
             # Verificar eventos automáticos después de acciones del jugador
-            triggered = event_manager.check_and_trigger_events(self.player, self.dungeon)
+            with telemetry.timer("turn.events"):
+                triggered = event_manager.check_and_trigger_events(self.player, self.dungeon)
             if triggered:
                 # Si algún evento se activó, mostrar mensaje
                 for event_id in triggered:
                     event = event_manager.events.get(event_id)
                     if event:
                         self.message_log.add(f"Evento: {event.name}", "message_important")
+            
+            # Relanzar la pre-generación si cambió algo de lo que depende
+            # (ej: un diálogo desbloqueó el botín); si no, no hace nada
+            self._schedule_pregen()
+            
+            if telemetry.enabled:
+                telemetry.record("turn", time.perf_counter() - turn_start)
+                telemetry.count("turns")
     
     def _handle_inventory_input(self, key: int) -> None:
         """Maneja la entrada de teclado en el inventario (solo ESC/I para cerrar)."""
@@ -1647,8 +1762,7 @@ class Game:
                     if new_dungeon.stairs_up:
                         self.player.x, self.player.y = new_dungeon.stairs_up
                 else:
-                    new_dungeon = Dungeon(MAP_WIDTH, MAP_HEIGHT, 1)
-                    start_pos = new_dungeon.generate()
+                    new_dungeon, start_pos = self._generate_floor(1)
                     self.dungeons[1] = new_dungeon
                     self.dungeon = new_dungeon
                     self.player.x, self.player.y = start_pos
@@ -1665,6 +1779,7 @@ class Game:
 
                 self.message_log.add("Desciendes a la mazmorra...", "message_important")
                 self._update_fov()
+                self._schedule_pregen()
                 
                 # Auto-guardar al entrar a la mazmorra
                 if self.current_save_slot:
@@ -1738,6 +1853,7 @@ class Game:
                     
                     self.message_log.add("Has vuelto al lobby.", "message_important")
                     self._update_fov()
+                    self._schedule_pregen()
                     
                     # Auto-guardar al volver al lobby
                     if self.current_save_slot:
@@ -1775,8 +1891,7 @@ class Game:
                 if self.dungeon.stairs_down:
                     self.player.x, self.player.y = self.dungeon.stairs_down
         else:
-            new_dungeon = Dungeon(MAP_WIDTH, MAP_HEIGHT, new_floor)
-            start_pos = new_dungeon.generate()
+            new_dungeon, start_pos = self._generate_floor(new_floor)
             self.player.x, self.player.y = start_pos
             self.dungeons[new_floor] = new_dungeon
             self.dungeon = new_dungeon
@@ -1786,49 +1901,94 @@ class Game:
         
         self.message_log.add(f"Entras al piso {new_floor}.", "message_important")
         self._update_fov()
+        self._schedule_pregen()
         
         # Auto-guardar al cambiar de piso
         if self.current_save_slot:
             self._save_game(self.current_save_slot, silent=True)
     
+    def _generate_floor(self, floor: int) -> Tuple[Dungeon, Tuple[int, int]]:
+        """
+        Obtiene un piso nuevo: el pre-generado si es válido, o lo genera.
+        
+        Args:
+            floor: Número de piso
+            
+        Returns:
+            Tupla (mazmorra, posición inicial del jugador)
+        """
+        with telemetry.timer("floor.generate"):
+            pregenerated = floor_pregenerator.take(floor, MAP_WIDTH, MAP_HEIGHT)
+            if pregenerated:
+                return pregenerated
+            dungeon = Dungeon(MAP_WIDTH, MAP_HEIGHT, floor)
+            return dungeon, dungeon.generate()
+    
+    def _schedule_pregen(self) -> None:
+        """Lanza en segundo plano la generación del piso inferior al actual."""
+        next_floor = self.player.current_floor + 1
+        if next_floor <= MAX_DUNGEON_LEVEL and next_floor not in self.dungeons:
+            floor_pregenerator.start(next_floor, MAP_WIDTH, MAP_HEIGHT)
+    
     def _enemy_turn(self) -> None:
         """Ejecuta el turno de todos los enemigos."""
-        for entity in self.dungeon.entities:
-            if hasattr(entity, 'fighter') and entity.fighter is not None and not entity.fighter.is_dead:
-                # Guardar posición antes del update para detectar ataques
-                was_adjacent = entity.distance_to(self.player) < 1.5
-                
-                messages = entity.update(self.player, self.visible_tiles, self.animation_manager)
-                
-                # Si estaba adyacente y hay mensaje de golpe, añadir animación
-                attack_happened = any("golpea" in msg.lower() for msg in messages)
-                if was_adjacent and attack_happened:
-                    self.animation_manager.add_attack_animation(
-                        attacker_id=id(entity),
-                        attacker_x=entity.x,
-                        attacker_y=entity.y,
-                        target_x=self.player.x,
-                        target_y=self.player.y
-                    )
-                
-                for msg in messages:
-                    if "golpea" in msg.lower():
-                        self.message_log.add(msg, "message_damage")
-                    else:
-                        self.message_log.add(msg)
+        self.turn_count += 1
+        profiling = frame_profiler.begin("turns")
+        
+        with telemetry.timer("turn.enemies"):
+            for entity in self.dungeon.entities:
+                if hasattr(entity, 'fighter') and entity.fighter is not None and not entity.fighter.is_dead:
+                    # Guardar posición antes del update para detectar ataques
+                    was_adjacent = entity.distance_to(self.player) < 1.5
+                    
+                    messages = entity.update(self.player, self.visible_tiles, self.animation_manager)
+                    
+                    # Si estaba adyacente y hay mensaje de golpe, añadir animación
+                    attack_happened = any("golpea" in msg.lower() for msg in messages)
+                    if was_adjacent and attack_happened:
+                        self.animation_manager.add_attack_animation(
+                            attacker_id=id(entity),
+                            attacker_x=entity.x,
+                            attacker_y=entity.y,
+                            target_x=self.player.x,
+                            target_y=self.player.y
+                        )
+                    
+                    for msg in messages:
+                        if "golpea" in msg.lower():
+                            self.message_log.add(msg, "message_damage")
+                        else:
+                            self.message_log.add(msg)
         
         # Verificar si el jugador murió
         if self.player.fighter.is_dead:
             self._handle_player_death()
             self.message_log.add("¡Has muerto!", "message_death")
+        
+        if profiling:
+            self._end_profile_step()
+    
+    def _end_profile_step(self) -> bool:
+        """
+        Cierra un paso perfilado y muestra el informe si la sesión terminó.
+        
+        Returns:
+            True si se añadió el informe al log (hay que repintar)
+        """
+        report = frame_profiler.end()
+        if report:
+            for line in report:
+                self.message_log.add(line, "message_important")
+        return bool(report)
     
     def _update_fov(self) -> None:
         """Actualiza el campo de visión."""
-        self.visible_tiles = self.dungeon.update_fov(
-            self.player.x,
-            self.player.y,
-            FOV_RADIUS
-        )
+        with telemetry.timer("fov"):
+            self.visible_tiles = self.dungeon.update_fov(
+                self.player.x,
+                self.player.y,
+                FOV_RADIUS
+            )
     
     def _start_in_lobby(self) -> None:
         """
@@ -1872,6 +2032,9 @@ class Game:
         # Mostrar mensaje de bienvenida del lobby (solo la primera vez por save)
         self._show_lobby_welcome_message()
         
+        # Ir generando el piso 1 mientras el jugador está en el lobby
+        self._schedule_pregen()
+        
         # Solo establecer PLAYING si no hay un diálogo activo
         if not dialog_manager.is_active():
             self.state = GameState.PLAYING
@@ -1913,9 +2076,8 @@ class Game:
         # Restockear la tienda del comerciante para la nueva run
         reset_merchant_shop()
         
-        # Resetear flag DEV de forzar merchant (solo en memoria, nunca guardado)
-        from .content.npcs import merchant as _merchant_module
-        _merchant_module._dev_force_spawn = False
+        # Resetear flags DEV (solo en memoria, nunca guardados)
+        dev_command_manager.reset_flags()
         
         self._start_in_lobby()
         
@@ -1941,13 +2103,16 @@ class Game:
             return
         
         # Calcular tiempo de juego
-        import time
         current_play_time = 0
         if self.play_time_start:
             current_play_time = int(time.time() - self.play_time_start)
         total_time = self.total_play_time + current_play_time
         
-        if save_manager.save_game(slot_id, self.player, self.dungeon, self.dungeons, total_time):
+        with telemetry.timer("save"):
+            saved = save_manager.save_game(slot_id, self.player, self.dungeon, self.dungeons, total_time)
+        telemetry.count("saves")
+        
+        if saved:
             self.current_save_slot = slot_id  # Recordar el slot actual
             if not silent:
                 self.message_log.add(f"Partida guardada en Slot {slot_id}.", "message_important")
@@ -2003,13 +2168,20 @@ class Game:
             # ============================================================
             
             # Restaurar mazmorras
+            # Un piso que ya no se puede regenerar igual se descarta solo:
+            # se volverá a generar al entrar en él
             self.dungeons = {}
+            lost_floors = []
             for floor, dungeon_data in save_data.get("dungeons", {}).items():
-                self.dungeons[int(floor)] = Dungeon.from_dict(dungeon_data)
+                try:
+                    self.dungeons[int(floor)] = Dungeon.from_dict(dungeon_data)
+                except FloorRestoreError as e:
+                    lost_floors.append(f"{e}; se generará de nuevo.")
             
             # Restaurar zona actual (lobby o mazmorra)
             in_lobby = save_data.get("in_lobby", False)
             current_floor = save_data.get("current_floor", 0)
+            start_pos = None
             
             if in_lobby and "lobby" in save_data:
                 self.dungeon = Lobby.from_dict(save_data["lobby"])
@@ -2019,8 +2191,14 @@ class Game:
                 if "lobby" in save_data:
                     self._lobby = Lobby.from_dict(save_data["lobby"])
             else:
-                self.dungeon = Lobby(MAP_WIDTH, MAP_HEIGHT)
-                self.dungeon.generate()
+                # La zona guardada no se pudo restaurar: empezar en el lobby
+                # (el guardado, si lo hay)
+                if "lobby" in save_data:
+                    self.dungeon = Lobby.from_dict(save_data["lobby"])
+                    start_pos = self.dungeon.player_start
+                else:
+                    self.dungeon = Lobby(MAP_WIDTH, MAP_HEIGHT)
+                    start_pos = self.dungeon.generate()
                 self._lobby = self.dungeon
                 current_floor = 0
             
@@ -2030,13 +2208,15 @@ class Game:
             
             self.player = Player.from_dict(save_data["player"], self.dungeon)
             self.player.current_floor = current_floor
+            if start_pos:
+                self.player.x, self.player.y = start_pos
             
             self.total_play_time = save_data.get("play_time", 0)
-            import time
             self.play_time_start = time.time()
             
             # Actualizar FOV
             self._update_fov()
+            self._schedule_pregen()
             
             # Restaurar música según la zona
             if isinstance(self.dungeon, Lobby):
@@ -2051,6 +2231,8 @@ class Game:
                     music_manager.play(loops=-1, fade_ms=1500)
             
             self.message_log.add(f"Partida cargada desde Slot {slot_id}.", "message_important")
+            for message in lost_floors:
+                self.message_log.add(message, "message_damage")
             return True
         except Exception as e:
             self.message_log.add(f"Error al cargar: {e}", "message_damage")
@@ -3,9 +3,8 @@ Clase base Item y funciones de creación de items.
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING, Dict, Any, List, Tuple, Optional
-import random
-
 from ..config import SYMBOLS, POTION_DATA, WEAPON_DATA, ARMOR_DATA
+from ..systems.rng import rng
 
 if TYPE_CHECKING:
     from ..entities.player import Player
@@ -336,7 +335,8 @@ def _create_random_equipment(floor: int, x: int, y: int) -> Item:
     Crea un item de equipo aleatorio (arma o armadura) apropiado para el piso.
     
     Combina WEAPON_DATA y ARMOR_DATA en una sola pool candidata,
-    filtra por min_level <= floor, y selecciona por rarity (peso).
+    filtra por min_level <= floor, y selecciona por rarity (peso)
+    usando la tabla precompilada del piso (ver systems/spawn_tables.py).
     
     Args:
         floor: Número de piso (filtra por min_level)
@@ -346,73 +346,46 @@ def _create_random_equipment(floor: int, x: int, y: int) -> Item:
     Returns:
         Un arma o armadura apropiada para el piso
     """
-    candidates = []
-    weights = []
-    
-    for key, data in WEAPON_DATA.items():
-        if data["min_level"] <= floor:
-            candidates.append(key)
-            weights.append(data["rarity"])
+    from ..systems.spawn_tables import spawn_tables
     
-    for key, data in ARMOR_DATA.items():
-        if data["min_level"] <= floor:
-            candidates.append(key)
-            weights.append(data["rarity"])
-    
-    if not candidates:
+    table = spawn_tables.table("equipment", floor)
+    if table is None:
         # Fallback: primera arma del diccionario
         first_key = next(iter(WEAPON_DATA))
         return create_item(first_key, x, y)
     
-    chosen_key = random.choices(candidates, weights=weights)[0]
-    return create_item(chosen_key, x, y)
+    return create_item(table.sample(rng.loot), x, y)
 
 
 def _create_random_potion(x: int, y: int) -> Item:
     """Crea una poción aleatoria basada en rareza."""
-    # Seleccionar tipo basado en rareza
-    potions = list(POTION_DATA.items())
-    weights = [data["rarity"] for _, data in potions]
-    potion_key, _ = random.choices(potions, weights=weights)[0]
+    from ..systems.spawn_tables import spawn_tables
     
-    return create_item(potion_key, x, y)
+    # Seleccionar tipo basado en rareza
+    return create_item(spawn_tables.potions.sample(rng.loot), x, y)
 
 
 def _create_random_weapon(floor: int, x: int, y: int) -> Item:
     """Crea un arma aleatoria apropiada para el piso."""
-    # Filtrar armas por nivel mínimo
-    valid_weapons = [
-        (key, data) for key, data in WEAPON_DATA.items()
-        if data["min_level"] <= floor
-    ]
+    from ..systems.spawn_tables import spawn_tables
     
-    if not valid_weapons:
+    table = spawn_tables.table("weapon", floor)
+    if table is None:
         # Fallback: primera arma del diccionario
-        first_key = next(iter(WEAPON_DATA))
-        valid_weapons = [(first_key, WEAPON_DATA[first_key])]
+        return create_item(next(iter(WEAPON_DATA)), x, y)
     
     # Seleccionar basado en rareza
-    weights = [data["rarity"] for _, data in valid_weapons]
-    weapon_key, _ = random.choices(valid_weapons, weights=weights)[0]
-    
-    return create_item(weapon_key, x, y)
+    return create_item(table.sample(rng.loot), x, y)
 
 
 def _create_random_armor(floor: int, x: int, y: int) -> Item:
     """Crea una armadura aleatoria apropiada para el piso."""
-    # Filtrar armaduras por nivel mínimo
-    valid_armors = [
-        (key, data) for key, data in ARMOR_DATA.items()
-        if data["min_level"] <= floor
-    ]
+    from ..systems.spawn_tables import spawn_tables
     
-    if not valid_armors:
+    table = spawn_tables.table("armor", floor)
+    if table is None:
         # Fallback: primera armadura del diccionario
-        first_key = next(iter(ARMOR_DATA))
-        valid_armors = [(first_key, ARMOR_DATA[first_key])]
+        return create_item(next(iter(ARMOR_DATA)), x, y)
     
     # Seleccionar basado en rareza
-    weights = [data["rarity"] for _, data in valid_armors]
-    armor_key, _ = random.choices(valid_armors, weights=weights)[0]
-    
-    return create_item(armor_key, x, y)
+    return create_item(table.sample(rng.loot), x, y)
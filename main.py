@@ -17,6 +17,7 @@ Controles:
 Versión: 1.0.0
 """
 
+import argparse
 import sys
 import os
 
@@ -26,10 +27,121 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from roguelike.game import Game
 
 
-def main() -> None:
-    """Punto de entrada principal del juego."""
+def _parse_args() -> argparse.Namespace:
+    """Parsea los argumentos de línea de comandos."""
+    parser = argparse.ArgumentParser(description="La Mansión de Ámbar")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Semilla de los flujos aleatorios (por defecto, aleatoria)")
+    parser.add_argument("--record", metavar="ARCHIVO",
+                        help="Graba la semilla y todas las entradas en ARCHIVO")
+    parser.add_argument("--replay", metavar="ARCHIVO",
+                        help="Reproduce una grabación sin ventana y a máxima velocidad")
+    parser.add_argument("--until-turn", type=int, default=None,
+                        help="Con --replay: detenerse al llegar a este turno")
+    parser.add_argument("--render", action="store_true",
+                        help="Con --replay: renderizar cada frame (traza de rendimiento)")
+    parser.add_argument("--stress", metavar="SPEC", nargs="?", const="",
+                        help='Escenario de estrés sin ventana (ej: "monsters=300 turns=100 size=160x80")')
+    parser.add_argument("--balance", metavar="SPEC", nargs="?", const="",
+                        help='Matriz de balance monstruo × arma (ej: "level=3 armor=chain_mail")')
+    parser.add_argument("--fuzz", metavar="SPEC", nargs="?", const="",
+                        help='Fuzzer de entradas sin ventana (ej: "actions=20000 threshold=50 seed=1")')
+    parser.add_argument("--scenarios", metavar="NOMBRES", nargs="?", const="",
+                        help="Ejecuta los escenarios de test sin ventana (por defecto, todos)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Con --scenarios: procesos simultáneos (por defecto, uno por CPU)")
+    parser.add_argument("--runs", type=int, default=0,
+                        help="Con --scenarios: runs extra a completar tras aplicar cada escenario")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Con --scenarios: mostrar transiciones y NPCs por zona")
+    parser.add_argument("--telemetry", action="store_true",
+                        help="Activa la telemetría de tiempos desde el inicio")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="Sirve las métricas en texto plano en este puerto local")
+    parser.add_argument("--metrics-csv", metavar="ARCHIVO",
+                        help="Exporta las métricas a CSV al salir")
+    return parser.parse_args()
+
+
+def _run_replay(args: argparse.Namespace) -> None:
+    """Reproduce una grabación e imprime el resumen."""
+    from roguelike.systems.replay import run_replay
+    
+    result = run_replay(args.replay, until_turn=args.until_turn, render=args.render)
+    print(f"Entradas: {result['inputs']}/{result['total_inputs']}  "
+          f"Turnos: {result['turns']}  Tiempo: {result['elapsed']:.3f}s")
+    print(f"Estado final: {result['fingerprint']}")
+    if result["matches"] is False:
+        print(f"¡Divergencia! Esperado: {result['expected']}")
+        sys.exit(1)
+
+
+def _run_stress(args: argparse.Namespace) -> None:
+    """Ejecuta un escenario de estrés sin ventana e imprime el informe."""
+    from roguelike.systems.stress import parse_stress_spec, run_headless, format_stress_report
+    
+    options = parse_stress_spec(args.stress.split())
+    for line in format_stress_report(run_headless(options)):
+        print(line)
+
+
+def _run_balance(args: argparse.Namespace) -> None:
+    """Imprime la matriz de balance monstruo × arma (cálculo exacto)."""
+    from roguelike.systems.damage import parse_balance_spec, balance_table, format_balance_table
+    
+    options = parse_balance_spec(args.balance.split())
+    rows = balance_table(options["level"], options["armor"])
+    for line in format_balance_table(rows, options["level"], options["armor"]):
+        print(line)
+
+
+def _run_fuzz(args: argparse.Namespace) -> None:
+    """Ejecuta el fuzzer de entradas e imprime el informe."""
+    from roguelike.systems.fuzzer import parse_fuzz_spec, run_fuzz, format_fuzz_report
+    
+    result = run_fuzz(parse_fuzz_spec(args.fuzz.split()))
+    for line in format_fuzz_report(result):
+        print(line)
+    if result["failures"]:
+        sys.exit(1)
+
+
+def _run_scenarios(args: argparse.Namespace) -> None:
+    """Ejecuta los escenarios de test en paralelo e imprime el informe."""
+    import time
+    from roguelike.systems.scenarios import run_scenarios, format_scenario_report
+    
+    start = time.perf_counter()
+    results = run_scenarios(
+        args.scenarios.split() or None,
+        workers=args.workers,
+        runs=args.runs,
+        seed=args.seed or 0,
+    )
+    for line in format_scenario_report(results, verbose=args.verbose):
+        print(line)
+    print(f"Tiempo total: {time.perf_counter() - start:.2f}s")
+    if any(result["outcome"] != "ok" for result in results):
+        sys.exit(1)
+
+
+def _run_game(args: argparse.Namespace) -> None:
+    """Arranca el juego normal (opcionalmente grabando la partida)."""
     try:
+        from roguelike.systems.rng import rng
+        rng.reseed(args.seed)
+        
         game = Game()
+        if args.record:
+            from roguelike.systems.replay import InputRecorder
+            from roguelike.systems.save_manager import save_manager
+            
+            save_paths = [
+                save_manager.get_save_file_path(slot.slot_id)
+                for slot in save_manager.slots
+            ]
+            game.recorder = InputRecorder(args.record, rng.seed, save_paths)
+            print(f"Grabando partida en {args.record} (semilla {rng.seed})")
         game.run()
     except KeyboardInterrupt:
         print("\nJuego interrumpido.")
@@ -38,5 +150,36 @@ def main() -> None:
         raise
 
 
+def main() -> None:
+    """Punto de entrada principal del juego."""
+    args = _parse_args()
+    
+    from roguelike.systems.telemetry import telemetry
+    if args.telemetry or args.metrics_port is not None or args.metrics_csv:
+        telemetry.enabled = True
+    if args.metrics_port is not None:
+        port = telemetry.start_server(args.metrics_port)
+        print(f"Métricas en http://127.0.0.1:{port}/metrics")
+    
+    try:
+        if args.replay:
+            _run_replay(args)
+        elif args.stress is not None:
+            _run_stress(args)
+        elif args.balance is not None:
+            _run_balance(args)
+        elif args.fuzz is not None:
+            _run_fuzz(args)
+        elif args.scenarios is not None:
+            _run_scenarios(args)
+        else:
+            _run_game(args)
+    finally:
+        if args.metrics_csv:
+            telemetry.export_csv(args.metrics_csv)
+            print(f"Métricas exportadas a {args.metrics_csv}")
+        telemetry.stop_server()
+
+
 if __name__ == "__main__":
     main()
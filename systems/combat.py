@@ -3,7 +3,8 @@ Sistema de combate del juego.
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING, List, Tuple
-import random
+
+from .rng import rng
 
 if TYPE_CHECKING:
     from ..entities.entity import Entity
@@ -11,6 +12,13 @@ if TYPE_CHECKING:
     from ..entities.monster import Monster
 
 
+# Parámetros de la tirada de daño (compartidos con systems/damage.py)
+DAMAGE_VARIANCE = 0.2     # Variación aleatoria (±20% del daño base)
+CRIT_CHANCE = 0.1         # Probabilidad de crítico
+CRIT_MULTIPLIER = 1.5     # Multiplicador de daño crítico
+MISS_CHANCE = 0.05        # Probabilidad de fallo
+
+
 class Combat:
     """
     Sistema de combate por turnos.
@@ -40,19 +48,19 @@ class Combat:
         base_damage = attack_power - defense_power // 2
         
         # Añadir variación aleatoria (±20%)
-        variance = max(1, int(base_damage * 0.2))
-        damage = base_damage + random.randint(-variance, variance)
+        variance = max(1, int(base_damage * DAMAGE_VARIANCE))
+        damage = base_damage + rng.combat.randint(-variance, variance)
         
         # Mínimo 1 de daño si el ataque conecta
         damage = max(1, damage)
         
         # Probabilidad de crítico (10%)
-        is_critical = random.random() < 0.1
+        is_critical = rng.combat.random() < CRIT_CHANCE
         if is_critical:
-            damage = int(damage * 1.5)
+            damage = int(damage * CRIT_MULTIPLIER)
         
         # Probabilidad de fallo (5%)
-        is_miss = random.random() < 0.05
+        is_miss = rng.combat.random() < MISS_CHANCE
         
         if is_miss:
             messages.append(f"{attacker.name} falla el ataque contra {defender.name}.")
@@ -64,7 +72,7 @@ class Combat:
             if defender.dungeon and hasattr(defender.dungeon, 'decorations'):
                 pos = (defender.x, defender.y)
                 if pos not in defender.dungeon.decorations:
-                    angle = random.choice([0, 90, 180, 270])
+                    angle = rng.combat.choice([0, 90, 180, 270])
                     defender.dungeon.decorations[pos] = ("blood", angle)
             
             # Añadir número de daño flotante si hay animation_manager
@@ -231,7 +239,7 @@ class Combat:
     @staticmethod
     def calculate_damage_preview(attacker: Entity, defender: Entity) -> Tuple[int, int]:
         """
-        Calcula el rango de daño esperado.
+        Calcula el rango exacto de daño de un golpe que conecta.
         
         Args:
             attacker: Entidad atacante
@@ -240,13 +248,12 @@ class Combat:
         Returns:
             Tupla (daño_mínimo, daño_máximo)
         """
+        from .damage import damage_distribution
+        
         attack_power = Combat._get_attack(attacker)
         defense_power = Combat._get_defense(defender)
         
-        base_damage = max(1, attack_power - defense_power // 2)
-        variance = max(1, int(base_damage * 0.2))
-        
-        min_damage = max(1, base_damage - variance)
-        max_damage = int((base_damage + variance) * 1.5)  # Con crítico
+        # Daños posibles de un golpe que conecta (incluye crítico)
+        hits = [damage for damage in damage_distribution(attack_power, defense_power) if damage > 0]
         
-        return (min_damage, max_damage)
+        return (min(hits), max(hits))
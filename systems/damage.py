@@ -0,0 +1,451 @@
+"""
+Cálculo exacto de distribuciones de daño.
+
+Reproduce de forma analítica la tirada de `Combat.attack` (variación del
+±20%, crítico y fallo) para obtener la probabilidad exacta de cada
+cantidad de daño por ataque y del número de golpes necesarios para
+matar, sin simular miles de ataques. Tiene en cuenta el desgaste del
+equipo: un arma o armadura que se rompe deja de sumar su bono.
+
+Lo usan el tooltip del inventario, el comando `balance` de la consola y
+el informe de balance (`python main.py --balance "level=3"`).
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .combat import Combat, DAMAGE_VARIANCE, CRIT_CHANCE, CRIT_MULTIPLIER, MISS_CHANCE
+
+if TYPE_CHECKING:
+    from ..entities.entity import Entity
+    from ..entities.player import Player
+    from ..items.item import Item
+
+
+# Límite de ataques considerados al calcular golpes para matar
+MAX_ATTACKS = 500
+
+# Probabilidad restante por debajo de la cual se da el cálculo por cerrado
+TAIL_EPSILON = 1e-9
+
+
+@lru_cache(maxsize=4096)
+def _hit_distribution(attack: int, defense: int) -> Tuple[Tuple[int, float], ...]:
+    """Distribución de un ataque como tupla ordenada (daño, probabilidad)."""
+    base_damage = attack - defense // 2
+    variance = max(1, int(base_damage * DAMAGE_VARIANCE))
+    roll_chance = (1 - MISS_CHANCE) / (2 * variance + 1)
+
+    distribution: Dict[int, float] = {0: MISS_CHANCE}
+    for roll in range(-variance, variance + 1):
+        damage = max(1, base_damage + roll)
+        critical = int(damage * CRIT_MULTIPLIER)
+        distribution[damage] = distribution.get(damage, 0.0) + roll_chance * (1 - CRIT_CHANCE)
+        distribution[critical] = distribution.get(critical, 0.0) + roll_chance * CRIT_CHANCE
+    return tuple(sorted(distribution.items()))
+
+
+def damage_distribution(attack: int, defense: int) -> Dict[int, float]:
+    """
+    Probabilidad exacta de cada cantidad de daño en un ataque.
+
+    Args:
+        attack: Ataque total del atacante
+        defense: Defensa total del defensor
+
+    Returns:
+        Diccionario {daño: probabilidad} (daño 0 = fallo)
+    """
+    return dict(_hit_distribution(attack, defense))
+
+
+def expected_damage(attack: int, defense: int) -> float:
+    """
+    Daño medio por ataque (incluyendo fallos y críticos).
+
+    Args:
+        attack: Ataque total del atacante
+        defense: Defensa total del defensor
+
+    Returns:
+        Esperanza del daño por ataque
+    """
+    return sum(damage * chance for damage, chance in _hit_distribution(attack, defense))
+
+
+@lru_cache(maxsize=4096)
+def _confirmed_hit_table(attack: int, defense: int) -> Tuple[Tuple[int, float], ...]:
+    """Distribución del daño condicionada a que el ataque conecte."""
+    return tuple(
+        (damage, chance / (1 - MISS_CHANCE))
+        for damage, chance in _hit_distribution(attack, defense)
+        if damage > 0
+    )
+
+
+@lru_cache(maxsize=4096)
+def _hits_to_kill(attack: int, defense: int, hp: int,
+                  wear: Optional[Tuple[int, int, int]]) -> Tuple[Tuple[int, float], ...]:
+    """
+    Probabilidad de necesitar N golpes confirmados para matar.
+
+    Cada paso es un golpe confirmado, así que el desgaste del equipo
+    depende solo del número de paso. Se corta en MAX_ATTACKS golpes (como
+    _kill_distribution): la masa restante queda sin resolver y la trata
+    turns_to_kill. Los estados que ya no pueden morir antes del corte se
+    descartan, así que el coste no crece con la vida (p. ej. 10^9 HP).
+    """
+    intact = _confirmed_hit_table(attack, defense)
+    worn = _confirmed_hit_table(wear[1], wear[2]) if wear and wear[0] > 0 else intact
+    wear_hits = wear[0] if wear and wear[0] > 0 else hp
+    max_damage = max(damage for damage, _ in intact + worn)
+
+    alive: Dict[int, float] = {hp: 1.0}
+    pmf: List[Tuple[int, float]] = []
+    hits = 0
+    while alive and hits < MAX_ATTACKS:
+        table = intact if hits < wear_hits else worn
+        hits += 1
+        next_alive: Dict[int, float] = {}
+        killed = 0.0
+        for remaining, chance in alive.items():
+            for damage, damage_chance in table:
+                if damage >= remaining:
+                    killed += chance * damage_chance
+                else:
+                    left = remaining - damage
+                    next_alive[left] = next_alive.get(left, 0.0) + chance * damage_chance
+        pmf.append((hits, killed))
+        reachable = (MAX_ATTACKS - hits) * max_damage
+        alive = {left: chance for left, chance in next_alive.items() if left <= reachable}
+    return tuple(pmf)
+
+
+@lru_cache(maxsize=4096)
+def _kill_distribution(attack: int, defense: int, hp: int,
+                       wear: Optional[Tuple[int, int, int]]) -> Tuple[Tuple[int, float], ...]:
+    """
+    Versión cacheada de kill_distribution (argumentos hashables).
+
+    Los fallos no cambian el estado, así que los ataques necesarios para
+    H golpes confirmados siguen una binomial negativa: se mezclan las
+    binomiales negativas de cada H con su probabilidad.
+    """
+    if hp <= 0:
+        return ((0, 1.0),)
+
+    hit_chance = 1 - MISS_CHANCE
+    attacks_pmf: Dict[int, float] = {}
+    for hits, hits_chance in _hits_to_kill(attack, defense, hp, wear):
+        if not hits_chance:
+            continue
+        # P(A = hits) = hit_chance^hits; P(A = a + 1) = P(A = a) * a / (a - hits + 1) * MISS
+        chance = hit_chance ** hits
+        covered = 0.0
+        for attacks in range(hits, MAX_ATTACKS + 1):
+            attacks_pmf[attacks] = attacks_pmf.get(attacks, 0.0) + hits_chance * chance
+            covered += chance
+            if covered > 1.0 - TAIL_EPSILON or not MISS_CHANCE:
+                break
+            chance *= attacks / (attacks - hits + 1) * MISS_CHANCE
+    return tuple(sorted(attacks_pmf.items()))
+
+
+def kill_distribution(attack: int, defense: int, hp: int,
+                      wear: Optional[Tuple[int, int, int]] = None) -> Dict[int, float]:
+    """
+    Probabilidad exacta de necesitar N ataques para matar.
+
+    Args:
+        attack: Ataque total del atacante
+        defense: Defensa total del defensor
+        hp: Vida actual del defensor
+        wear: Equipo que se rompe: (golpes confirmados hasta romperse,
+              ataque tras romperse, defensa tras romperse)
+
+    Returns:
+        Diccionario {ataques: probabilidad}
+    """
+    return dict(_kill_distribution(attack, defense, hp, wear))
+
+
+def turns_to_kill(attack: int, defense: int, hp: int,
+                  wear: Optional[Tuple[int, int, int]] = None) -> Dict[str, float]:
+    """
+    Resume cuántos ataques hacen falta para matar (un ataque por turno).
+
+    Args:
+        attack: Ataque total del atacante
+        defense: Defensa total del defensor
+        hp: Vida actual del defensor
+        wear: Ver kill_distribution()
+
+    Returns:
+        Diccionario con expected, p50, p90 y one_shot (probabilidad de
+        matar de un golpe)
+    """
+    pmf = _kill_distribution(attack, defense, hp, wear)
+    expected = sum(attacks * chance for attacks, chance in pmf)
+    # Masa no resuelta en MAX_ATTACKS (solo con stats degenerados)
+    expected += (1.0 - sum(chance for _, chance in pmf)) * MAX_ATTACKS
+
+    def percentile(q: float) -> float:
+        cumulative = 0.0
+        for attacks, chance in pmf:
+            cumulative += chance
+            if cumulative >= q:
+                return float(attacks)
+        return float(MAX_ATTACKS)
+
+    return {
+        "expected": expected,
+        "p50": percentile(0.5),
+        "p90": percentile(0.9),
+        "one_shot": dict(pmf).get(1, 0.0),
+    }
+
+
+def _weapon_wear(attacker: 'Entity', attack: int, defense: int) -> Optional[Tuple[int, int, int]]:
+    """Desgaste del arma del atacante (solo el jugador gasta el arma)."""
+    equipped = getattr(attacker, "equipped", None)
+    weapon = equipped.get("weapon") if equipped else None
+    if weapon is None or weapon.is_broken():
+        return None
+    return (weapon.durability, attack - weapon.get_effective_attack(), defense)
+
+
+def _armor_wear(defender: 'Entity', attack: int, defense: int) -> Optional[Tuple[int, int, int]]:
+    """Desgaste de la armadura del defensor (solo el jugador gasta la armadura)."""
+    equipped = getattr(defender, "equipped", None)
+    armor = equipped.get("armor") if equipped else None
+    if armor is None or armor.is_broken():
+        return None
+    return (armor.durability, attack, defense - armor.get_effective_defense())
+
+
+def matchup(attacker: 'Entity', defender: 'Entity') -> Dict[str, Any]:
+    """
+    Analiza un ataque entre dos entidades con su equipo actual.
+
+    Args:
+        attacker: Entidad atacante
+        defender: Entidad defensora
+
+    Returns:
+        Diccionario con attack, defense, distribution, expected_damage,
+        min_damage, max_damage y kill (ver turns_to_kill)
+    """
+    attack = Combat._get_attack(attacker)
+    defense = Combat._get_defense(defender)
+    distribution = damage_distribution(attack, defense)
+    hits = [damage for damage in distribution if damage > 0]
+    wear = _weapon_wear(attacker, attack, defense) or _armor_wear(defender, attack, defense)
+
+    return {
+        "attack": attack,
+        "defense": defense,
+        "distribution": distribution,
+        "expected_damage": expected_damage(attack, defense),
+        "min_damage": min(hits),
+        "max_damage": max(hits),
+        "kill": turns_to_kill(attack, defense, defender.fighter.hp, wear),
+    }
+
+
+def _nearest_monster(player: 'Player') -> Optional['Entity']:
+    """Devuelve el monstruo vivo más cercano al jugador en su zona."""
+    from ..entities.monster import Monster
+
+    zone = getattr(player, "dungeon", None)
+    if zone is None:
+        return None
+    monsters = [
+        entity for entity in zone.entities
+        if isinstance(entity, Monster) and not entity.fighter.is_dead
+    ]
+    if not monsters:
+        return None
+    return min(monsters, key=lambda monster: abs(monster.x - player.x) + abs(monster.y - player.y))
+
+
+def item_tooltip(player: 'Player', item: 'Item') -> Optional[str]:
+    """
+    Texto de combate para el tooltip de un arma o armadura.
+
+    Compara el objeto contra el monstruo más cercano del piso como si el
+    jugador lo llevara equipado en lugar de lo que lleve ahora.
+
+    Args:
+        player: Jugador
+        item: Objeto bajo el cursor
+
+    Returns:
+        Texto corto, o None si no aplica (sin monstruos o no es equipo)
+    """
+    monster = _nearest_monster(player)
+    if monster is None:
+        return None
+
+    if getattr(item, "attack_bonus", 0):
+        bonus = item.get_effective_attack()
+        attack = player.fighter.attack + bonus
+        defense = monster.fighter.defense
+        wear = (item.durability, attack - bonus, defense) if bonus else None
+        kill = turns_to_kill(attack, defense, monster.fighter.hp, wear)
+        return (f"vs {monster.name}: {expected_damage(attack, defense):.1f} daño/golpe, "
+                f"{kill['expected']:.1f} golpes")
+
+    if getattr(item, "defense_bonus", 0):
+        bonus = item.get_effective_defense()
+        attack = monster.fighter.attack
+        defense = player.fighter.defense + bonus
+        wear = (item.durability, attack, defense - bonus) if bonus else None
+        kill = turns_to_kill(attack, defense, player.fighter.hp, wear)
+        return f"{monster.name} te mata en {kill['expected']:.1f} golpes"
+
+    return None
+
+
+def player_balance_lines(player: 'Player') -> List[str]:
+    """
+    Enfrenta al jugador actual (con su equipo) a cada monstruo del juego.
+
+    Args:
+        player: Jugador
+
+    Returns:
+        Líneas: daño medio, golpes para matar (media y p90) y golpes que
+        necesita el monstruo para matar al jugador
+    """
+    from ..config import MONSTER_DATA
+
+    attack = Combat._get_attack(player)
+    defense = Combat._get_defense(player)
+    lines = [
+        f"[BALANCE] ATK {attack}, DEF {defense}, HP {player.fighter.hp}",
+        f"  {'monstruo':16} {'daño':>5} {'golpes':>7} {'p90':>4} {'te mata':>8}",
+    ]
+    for data in MONSTER_DATA.values():
+        player_wear = _weapon_wear(player, attack, data["defense"])
+        monster_wear = _armor_wear(player, data["attack"], defense)
+        dealt = turns_to_kill(attack, data["defense"], data["hp"], player_wear)
+        taken = turns_to_kill(data["attack"], defense, player.fighter.hp, monster_wear)
+        lines.append(
+            f"  {data['name']:16} {expected_damage(attack, data['defense']):>5.1f} "
+            f"{dealt['expected']:>7.1f} {dealt['p90']:>4.0f} {taken['expected']:>8.1f}"
+        )
+    return lines
+
+
+def balance_table(level: int = 1, armor_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Calcula todos los enfrentamientos MONSTER_DATA × WEAPON_DATA.
+
+    El jugador se modela con sus stats base al nivel indicado, vida
+    completa, el arma de cada columna (nueva) y la armadura opcional.
+
+    Args:
+        level: Nivel del jugador
+        armor_id: Armadura equipada (clave de ARMOR_DATA) o None
+
+    Returns:
+        Filas con monster, weapon, player_hits (golpes del jugador para
+        matar), player_p90 y monster_hits (golpes del monstruo para matar)
+    """
+    from ..config import (
+        MONSTER_DATA, WEAPON_DATA, ARMOR_DATA,
+        PLAYER_BASE_HP, PLAYER_BASE_ATTACK, PLAYER_BASE_DEFENSE,
+        PLAYER_HP_PER_LEVEL, PLAYER_ATTACK_PER_LEVEL, PLAYER_DEFENSE_PER_LEVEL,
+    )
+
+    base_attack = PLAYER_BASE_ATTACK + (level - 1) * PLAYER_ATTACK_PER_LEVEL
+    base_defense = PLAYER_BASE_DEFENSE + (level - 1) * PLAYER_DEFENSE_PER_LEVEL
+    player_hp = PLAYER_BASE_HP + (level - 1) * PLAYER_HP_PER_LEVEL
+    armor = ARMOR_DATA[armor_id] if armor_id else None
+    defense = base_defense + (armor["defense_bonus"] if armor else 0)
+
+    weapons = [("sin_arma", 0, 0)] + [
+        (weapon_id, data["attack_bonus"], data["durability"])
+        for weapon_id, data in WEAPON_DATA.items()
+    ]
+
+    rows = []
+    for monster_id, monster in MONSTER_DATA.items():
+        monster_wear = (armor["durability"], monster["attack"], base_defense) if armor else None
+        taken = turns_to_kill(monster["attack"], defense, player_hp, monster_wear)
+        for weapon_id, bonus, durability in weapons:
+            attack = base_attack + bonus
+            wear = (durability, base_attack, monster["defense"]) if bonus else None
+            dealt = turns_to_kill(attack, monster["defense"], monster["hp"], wear)
+            rows.append({
+                "monster": monster_id,
+                "weapon": weapon_id,
+                "player_hits": dealt["expected"],
+                "player_p90": dealt["p90"],
+                "monster_hits": taken["expected"],
+            })
+    return rows
+
+
+def format_balance_table(rows: List[Dict[str, Any]], level: int = 1,
+                         armor_id: Optional[str] = None) -> List[str]:
+    """
+    Formatea balance_table() como matriz monstruo × arma.
+
+    Args:
+        rows: Resultado de balance_table()
+        level: Nivel usado (para la cabecera)
+        armor_id: Armadura usada (para la cabecera)
+
+    Returns:
+        Líneas: golpes esperados del jugador para matar a cada monstruo
+        con cada arma, y golpes que necesita el monstruo para matarle
+    """
+    weapons = list(dict.fromkeys(row["weapon"] for row in rows))
+    monsters = list(dict.fromkeys(row["monster"] for row in rows))
+    cells = {(row["monster"], row["weapon"]): row for row in rows}
+
+    lines = [
+        f"[BALANCE] Nivel {level}, armadura: {armor_id or 'ninguna'} "
+        f"(golpes esperados para matar)",
+        f"{'monstruo':15} {'te mata':>7} | " + " ".join(f"{weapon[:8]:>8}" for weapon in weapons),
+    ]
+    for monster in monsters:
+        taken = cells[(monster, weapons[0])]["monster_hits"]
+        lines.append(
+            f"{monster:15} {taken:>7.1f} | "
+            + " ".join(f"{cells[(monster, weapon)]['player_hits']:>8.1f}" for weapon in weapons)
+        )
+    return lines
+
+
+def parse_balance_spec(args: List[str]) -> Dict[str, Any]:
+    """
+    Parsea argumentos "clave=valor" del informe de balance.
+
+    Args:
+        args: Lista de tokens (ej: ["level=3", "armor=chain_mail"])
+
+    Returns:
+        Diccionario con level y armor
+
+    Raises:
+        ValueError: Si una clave o valor no es válido
+    """
+    from ..config import ARMOR_DATA
+
+    options: Dict[str, Any] = {"level": 1, "armor": None}
+    for token in args:
+        if "=" not in token:
+            raise ValueError(f"Argumento inválido: '{token}' (usa clave=valor)")
+        key, value = token.split("=", 1)
+        key = key.strip().lower()
+        if key == "level":
+            options["level"] = max(1, int(value))
+        elif key == "armor":
+            if value not in ARMOR_DATA:
+                raise ValueError(f"Armadura desconocida: '{value}'")
+            options["armor"] = value
+        else:
+            raise ValueError(f"Opción desconocida: '{key}'")
+    return options
@@ -194,6 +194,62 @@ class DevCommandManager:
             self._cmd_scenario
         )
         
+        # Comando: profile <frames|turns> [N]
+        self.register_command(
+            "profile",
+            "Perfila con cProfile los próximos N frames o turnos",
+            "profile frames 120 | profile turns 20 | profile stop",
+            self._cmd_profile
+        )
+        
+        # Comando: telemetry <on|off|stats|reset|csv|serve|stop>
+        self.register_command(
+            "telemetry",
+            "Controla la telemetría de tiempos (turnos, frames, render)",
+            "telemetry on | stats | csv metrics.csv | serve 9108",
+            self._cmd_telemetry
+        )
+        
+        # Comando: mem [start|stop|objects]
+        self.register_command(
+            "mem",
+            "Mide el crecimiento de memoria con tracemalloc (antes/después)",
+            "mem start | mem | mem objects | mem stop",
+            self._cmd_mem
+        )
+        
+        # Comando: stress [clave=valor ...]
+        self.register_command(
+            "stress",
+            "Llena el piso de monstruos/items/puertas/sangre y mide N turnos",
+            "stress monsters=300 items=200 doors=40 blood=500 turns=50 size=160x80",
+            self._cmd_stress
+        )
+        
+        # Comando: balance [level=N] [armor=id]
+        self.register_command(
+            "balance",
+            "Golpes esperados para matar/morir contra cada monstruo (cálculo exacto)",
+            "balance | balance level=3 armor=chain_mail",
+            self._cmd_balance
+        )
+        
+        # Comando: pregen [on|off|check [piso]]
+        self.register_command(
+            "pregen",
+            "Estado de la pre-generación del siguiente piso y comprobación de identidad",
+            "pregen | pregen off | pregen on | pregen check 3",
+            self._cmd_pregen
+        )
+        
+        # Comando: validate
+        self.register_command(
+            "validate",
+            "Comprueba que salas, objetos y escaleras del piso son alcanzables",
+            "validate",
+            self._cmd_validate
+        )
+        
         # Comando: help
         self.register_command(
             "help",
@@ -248,6 +304,19 @@ class DevCommandManager:
         except Exception as e:
             return [f"Error ejecutando comando: {e}"]
     
+    def reset_flags(self) -> None:
+        """
+        Apaga los flags DEV que viven en memoria (nunca se guardan).
+        
+        Los comandos merchant y librarian fuerzan apariciones hasta el final
+        de la run; al empezar otra (o una partida nueva del fuzzer) hay que
+        apagarlos todos aquí, o cambian las tiradas de generación.
+        """
+        from ..content.npcs import merchant as merchant_module
+        from ..content.npcs import librarian as librarian_module
+        merchant_module._dev_force_spawn = False
+        librarian_module._dev_force_spawn = False
+    
     # ============================================================================
     # HANDLERS DE COMANDOS
     # ============================================================================
@@ -1262,6 +1331,192 @@ class DevCommandManager:
         messages.append("Escenario cargado. Cambia de zona para ver los NPCs actualizados.")
         return messages
     
+    def _cmd_profile(self, _game: 'Game', args: List[str]) -> List[str]:
+        """Comando: profile <frames|turns> [N] | profile stop"""
+        from .profiler import frame_profiler, PROFILE_MODES
+        
+        defaults = {"frames": 120, "turns": 20}
+        
+        if not args:
+            status = (
+                f"Activo: {frame_profiler.remaining}/{frame_profiler.total} {frame_profiler.mode} restantes."
+                if frame_profiler.active else "Inactivo."
+            )
+            return [
+                f"[PROFILE] {status}",
+                "Uso: profile <frames|turns> [N]  (por defecto 120 frames / 20 turnos)",
+                "Uso: profile stop para cancelar.",
+            ]
+        
+        mode = args[0].lower()
+        if mode == "stop":
+            if not frame_profiler.active:
+                return ["[PROFILE] No hay ninguna sesión activa."]
+            frame_profiler.cancel()
+            return ["[PROFILE] Sesión cancelada."]
+        
+        if mode not in PROFILE_MODES:
+            return [f"Modo inválido: '{mode}'. Usa 'frames' o 'turns'."]
+        
+        count = defaults[mode]
+        if len(args) > 1:
+            try:
+                count = int(args[1])
+            except ValueError:
+                return ["N debe ser un número entero (ej: profile frames 120)."]
+            if count < 1:
+                return ["N debe ser mayor que 0."]
+        
+        frame_profiler.start(mode, count)
+        return [f"[PROFILE] Perfilando los próximos {count} {mode}..."]
+    
+    def _cmd_telemetry(self, _game: 'Game', args: List[str]) -> List[str]:
+        """Comando: telemetry <on|off|stats|reset|csv [ruta]|serve [puerto]|stop>"""
+        from .telemetry import telemetry, DEFAULT_METRICS_PORT
+        
+        if not args:
+            state = "activada" if telemetry.enabled else "desactivada"
+            return [
+                f"[TELEMETRY] Telemetría {state}.",
+                "Uso: telemetry on|off|stats|reset",
+                "Uso: telemetry csv [ruta] | serve [puerto] | stop",
+            ]
+        
+        action = args[0].lower()
+        if action == "on":
+            telemetry.enabled = True
+            return ["[TELEMETRY] Activada."]
+        if action == "off":
+            telemetry.enabled = False
+            return ["[TELEMETRY] Desactivada."]
+        if action == "reset":
+            telemetry.reset()
+            return ["[TELEMETRY] Métricas borradas."]
+        if action == "stats":
+            lines = telemetry.summary_lines()
+            if len(lines) <= 1:
+                return ["[TELEMETRY] Sin datos todavía (¿está activada?)."]
+            return ["[TELEMETRY]"] + lines
+        if action == "csv":
+            path = args[1] if len(args) > 1 else "metrics.csv"
+            telemetry.export_csv(path)
+            return [f"[TELEMETRY] Exportado a {path}"]
+        if action == "serve":
+            try:
+                port = int(args[1]) if len(args) > 1 else DEFAULT_METRICS_PORT
+            except ValueError:
+                return ["El puerto debe ser un número."]
+            port = telemetry.start_server(port)
+            return [f"[TELEMETRY] Métricas en http://127.0.0.1:{port}/metrics"]
+        if action == "stop":
+            telemetry.stop_server()
+            return ["[TELEMETRY] Endpoint detenido."]
+        
+        return [f"Acción desconocida: '{action}'. Escribe 'telemetry' para ver el uso."]
+    
+    def _cmd_mem(self, _game: 'Game', args: List[str]) -> List[str]:
+        """Comando: mem [start [frames]|stop|objects]"""
+        from .memory import memory_probe, count_objects
+        
+        action = args[0].lower() if args else ""
+        
+        if action == "start" or (not action and not memory_probe.active):
+            try:
+                frames = int(args[1]) if len(args) > 1 else 1
+            except ValueError:
+                return ["La profundidad de traza debe ser un número."]
+            memory_probe.start(frames)
+            return [
+                "[MEM] Instantánea base tomada.",
+                "Juega un rato y escribe 'mem' para ver el crecimiento.",
+            ]
+        
+        if action == "stop":
+            memory_probe.stop()
+            return ["[MEM] tracemalloc detenido."]
+        
+        if action == "objects":
+            return ["[MEM] Objetos vivos:"] + [
+                f"  {name:15} {value:>8}" for name, value in count_objects().items()
+            ]
+        
+        if not action:
+            return memory_probe.report()
+        
+        return [f"Acción desconocida: '{action}'. Usa start, stop u objects."]
+    
+    def _cmd_stress(self, game: 'Game', args: List[str]) -> List[str]:
+        """Comando: stress [monsters=N] [items=N] [doors=N] [blood=N] [turns=N] [floor=N] [size=WxH] [engine=bsp|caves] [render=0|1] [seed=N]"""
+        from .stress import parse_stress_spec, run_stress, format_stress_report
+        
+        try:
+            options = parse_stress_spec(args)
+        except ValueError as e:
+            return [f"[STRESS] {e}"]
+        
+        result = run_stress(game, options)
+        return format_stress_report(result) + [
+            "Piso de estrés descartado: la partida vuelve a su estado anterior.",
+        ]
+    
+    def _cmd_balance(self, game: 'Game', args: List[str]) -> List[str]:
+        """Comando: balance [level=N] [armor=id]"""
+        from .damage import (
+            player_balance_lines, parse_balance_spec, balance_table, format_balance_table
+        )
+        
+        if not args:
+            return player_balance_lines(game.player)
+        
+        try:
+            options = parse_balance_spec(args)
+        except ValueError as e:
+            return [f"[BALANCE] {e}"]
+        
+        lines = format_balance_table(
+            balance_table(options["level"], options["armor"]), options["level"], options["armor"]
+        )
+        for line in lines:
+            print(line)
+        return lines[:1] + ["Matriz completa monstruo × arma impresa en la terminal."]
+    
+    def _cmd_pregen(self, game: 'Game', args: List[str]) -> List[str]:
+        """Comando: pregen [on|off|check [piso]]"""
+        from ..config import MAP_WIDTH, MAP_HEIGHT
+        from .pregen import floor_pregenerator, verify_pregen
+        
+        action = args[0].lower() if args else ""
+        
+        if action in ("on", "off"):
+            floor_pregenerator.enabled = action == "on"
+            if floor_pregenerator.enabled:
+                game._schedule_pregen()
+            else:
+                floor_pregenerator.discard()
+            return floor_pregenerator.status_lines()
+        
+        if action == "check":
+            try:
+                floor = int(args[1]) if len(args) > 1 else game.player.current_floor + 1
+            except ValueError:
+                return [f"Piso inválido: '{args[1]}'"]
+            return verify_pregen(max(1, floor), MAP_WIDTH, MAP_HEIGHT)
+        
+        if not action:
+            return floor_pregenerator.status_lines()
+        
+        return [f"Acción desconocida: '{action}'. Usa on, off o check."]
+    
+    def _cmd_validate(self, game: 'Game', _args: List[str]) -> List[str]:
+        """Comando: validate"""
+        from ..world.validator import validate_dungeon, format_validation
+        
+        if not getattr(game.dungeon, "rooms", None):
+            return ["[VALIDATE] La zona actual no tiene salas que validar."]
+        
+        report = validate_dungeon(game.dungeon)
+        return format_validation(report, game.player.current_floor)
+    
     def _cmd_help(self, _game: 'Game', _args: List[str]) -> List[str]:
         """Comando: help"""
         messages = ["=== COMANDOS DE DESARROLLO ==="]
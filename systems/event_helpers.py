@@ -164,7 +164,7 @@ def action_add_entity_to_zone(
                 pos_x, pos_y = x, y
             else:
                 # Posición aleatoria en el suelo
-                import random
+                from .rng import rng
                 walkable_positions = []
                 for tx in range(target_zone.width):
                     for ty in range(target_zone.height):
@@ -172,7 +172,7 @@ def action_add_entity_to_zone(
                             walkable_positions.append((tx, ty))
                 
                 if walkable_positions:
-                    pos_x, pos_y = random.choice(walkable_positions)
+                    pos_x, pos_y = rng.generation.choice(walkable_positions)
                 else:
                     return
             
@@ -232,7 +232,7 @@ def action_add_item_to_zone(
         if x is not None and y is not None:
             pos_x, pos_y = x, y
         else:
-            import random
+            from .rng import rng
             walkable_positions = []
             for tx in range(zone.width):
                 for ty in range(zone.height):
@@ -240,7 +240,7 @@ def action_add_item_to_zone(
                         walkable_positions.append((tx, ty))
             
             if walkable_positions:
-                pos_x, pos_y = random.choice(walkable_positions)
+                pos_x, pos_y = rng.generation.choice(walkable_positions)
             else:
                 return
         
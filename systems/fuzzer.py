@@ -0,0 +1,482 @@
+"""
+Fuzzer de entradas para detectar excepciones y acciones lentas.
+
+Genera secuencias aleatorias de teclas válidas para el estado actual
+(menú de guardado, juego, inventario, diálogo, tienda, consola...) y las
+aplica directamente a los manejadores del juego, sin ventana ni espera
+entre frames, a miles de acciones por segundo. Las pantallas que solo se
+abren hablando con un NPC se abren de vez en cuando directamente (ver
+OPEN_SCREENS en replay.py).
+
+Cada fallo (excepción o acción que supera el umbral de latencia) se
+reduce a la secuencia mínima que lo reproduce y se guarda como archivo
+de repetición, reproducible con:
+    python main.py --replay fuzz/crash_001.replay
+
+Uso:
+    python main.py --fuzz "actions=20000 threshold=50 seed=1"
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+import os
+import random
+import tempfile
+import time
+import traceback
+
+from .replay import OPEN_SCREENS, InputRecorder, apply_input
+from .rng import rng
+
+if TYPE_CHECKING:
+    from ..game import Game
+
+
+# Valores por defecto de una sesión de fuzzing
+FUZZ_DEFAULTS: Dict[str, Any] = {
+    "actions": 10000,       # Acciones totales
+    "episode": 400,         # Acciones máximas por partida antes de empezar otra
+    "threshold": 50.0,      # Umbral de acción lenta (ms)
+    "seed": 0,
+    "render": False,        # Renderizar tras cada acción (incluye el render en la latencia)
+    "shrink": 200,          # Reproducciones máximas para minimizar cada fallo
+    "output": "fuzz",       # Carpeta de los archivos de repetición
+}
+
+# Textos de consola que puede escribir el fuzzer (sin comandos que abren
+# servidores, escriben archivos o tardan a propósito, como stress/profile)
+CONSOLE_INPUTS = (
+    "help", "heal", "gold 500", "gold -100", "level 5", "xp 300", "goto 2", "goto 6",
+    "give health_potion", "give poison_potion", "teleport 10 10", "killall",
+    "amulet", "clear", "merchant", "librarian", "shop_restock", "runs +1",
+    "npc_state Stranger", "scenario nieta_ayudando", "scenario stranger_contratado",
+    "event stranger_floor5_met", "xyz", " ", "goto", "level abc",
+)
+
+# Probabilidad de abrir directamente una pantalla de OPEN_SCREENS al jugar
+# (tienda, donación y menú de guardado no se alcanzan con teclas al azar)
+OPEN_SCREEN_CHANCE = 0.02
+
+
+def parse_fuzz_spec(args: List[str]) -> Dict[str, Any]:
+    """
+    Parsea argumentos "clave=valor" de una sesión de fuzzing.
+
+    Args:
+        args: Lista de tokens (ej: ["actions=5000", "threshold=30"])
+
+    Returns:
+        Diccionario de opciones completado con FUZZ_DEFAULTS
+
+    Raises:
+        ValueError: Si una clave o valor no es válido
+    """
+    options = dict(FUZZ_DEFAULTS)
+    for token in args:
+        if "=" not in token:
+            raise ValueError(f"Argumento inválido: '{token}' (usa clave=valor)")
+        key, value = token.split("=", 1)
+        key = key.strip().lower()
+        if key not in options:
+            raise ValueError(f"Opción desconocida: '{key}'")
+        if key == "threshold":
+            options[key] = float(value)
+        elif key == "render":
+            options[key] = value.lower() in ("1", "true", "si", "sí", "yes", "on")
+        elif key == "output":
+            options[key] = value
+        else:
+            options[key] = int(value)
+    return options
+
+
+def _state_keys() -> Dict[Any, List[int]]:
+    """
+    Teclas válidas por estado del juego.
+
+    Las teclas repetidas pesan más en la elección (ej: moverse).
+
+    Returns:
+        Diccionario {GameState: lista de teclas}
+    """
+    import pygame
+    from ..config import GameState
+
+    moves = [
+        pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT,
+        pygame.K_KP1, pygame.K_KP2, pygame.K_KP3, pygame.K_KP4,
+        pygame.K_KP6, pygame.K_KP7, pygame.K_KP8, pygame.K_KP9,
+        pygame.K_h, pygame.K_j, pygame.K_k, pygame.K_l,
+        pygame.K_y, pygame.K_u, pygame.K_b, pygame.K_n,
+    ]
+    menu = [pygame.K_UP, pygame.K_DOWN, pygame.K_k, pygame.K_j,
+            pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_SPACE, pygame.K_ESCAPE]
+    return {
+        GameState.MAIN_MENU: [pygame.K_UP, pygame.K_DOWN, pygame.K_RETURN, pygame.K_RETURN],
+        GameState.SAVE_MENU: [pygame.K_UP, pygame.K_DOWN, pygame.K_RETURN, pygame.K_DELETE, pygame.K_ESCAPE],
+        GameState.PLAYING: moves * 3 + [
+            pygame.K_PERIOD, pygame.K_KP5, pygame.K_SPACE, pygame.K_SPACE, pygame.K_SPACE,
+            pygame.K_i, pygame.K_F1, pygame.K_F1, pygame.K_ESCAPE,
+            pygame.K_PAGEUP, pygame.K_PAGEDOWN,
+        ],
+        GameState.INVENTORY: [pygame.K_ESCAPE, pygame.K_i],
+        GameState.DEAD: [pygame.K_r, pygame.K_ESCAPE],
+        GameState.VICTORY: [pygame.K_r, pygame.K_ESCAPE],
+        GameState.PAUSED: menu,
+        GameState.OPTIONS: menu + [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_h, pygame.K_l],
+        GameState.DIALOG: menu,
+        GameState.SHOP: menu,
+        GameState.DONATION: menu + [pygame.K_LEFT, pygame.K_RIGHT],
+        GameState.CONSOLE: [pygame.K_RETURN, pygame.K_RETURN, pygame.K_RETURN,
+                            pygame.K_BACKSPACE, pygame.K_UP, pygame.K_DOWN, pygame.K_ESCAPE],
+    }
+
+
+def _choose_input(game: 'Game', chooser: random.Random, state_keys: Dict[Any, List[int]]) -> Any:
+    """
+    Elige una entrada válida para el estado actual del juego.
+
+    Args:
+        game: Instancia del juego
+        chooser: Generador aleatorio del fuzzer
+        state_keys: Teclas válidas por estado (ver _state_keys)
+
+    Returns:
+        Entrada en formato de repetición (tecla, texto, evento de ratón o
+        apertura de pantalla)
+    """
+    from ..config import GameState, WINDOW_WIDTH, WINDOW_HEIGHT
+
+    if game.state == GameState.CONSOLE and not game.console_input and chooser.random() < 0.7:
+        return chooser.choice(CONSOLE_INPUTS)
+
+    if game.state == GameState.PLAYING and chooser.random() < OPEN_SCREEN_CHANCE:
+        return ["open", chooser.choice(OPEN_SCREENS)]
+
+    if game.state == GameState.INVENTORY and chooser.random() < 0.6:
+        kind = chooser.choice(("down", "up", "move", "move"))
+        x, y = chooser.randrange(WINDOW_WIDTH), chooser.randrange(WINDOW_HEIGHT)
+        if kind == "move":
+            return [kind, x, y]
+        return [kind, chooser.choice((1, 1, 3)), x, y]
+
+    return chooser.choice(state_keys.get(game.state, state_keys[GameState.PLAYING]))
+
+
+def _describe_input(entry: Any) -> str:
+    """Describe una entrada de forma legible (nombre de tecla, texto, ratón o pantalla)."""
+    import pygame
+
+    if isinstance(entry, int):
+        return pygame.key.name(entry) or str(entry)
+    if isinstance(entry, str):
+        return repr(entry)
+    if entry[0] == "open":
+        return f"open {entry[1]}"
+    return "mouse " + " ".join(str(value) for value in entry)
+
+
+def _crash_signature(error: BaseException) -> str:
+    """Identifica una excepción por tipo y línea donde se lanzó."""
+    frame = traceback.extract_tb(error.__traceback__)[-1]
+    return f"{type(error).__name__}@{os.path.basename(frame.filename)}:{frame.lineno}"
+
+
+def _fresh_game(save_dir: str, seed: int) -> 'Game':
+    """
+    Crea una partida como la crearía run_replay() en un proceso nuevo.
+
+    Vacía el directorio de guardado temporal y reinicia los singletons que
+    no reinicia Game() (diálogo activo, tienda del comerciante, flags DEV).
+
+    Args:
+        save_dir: Directorio de guardado temporal
+        seed: Semilla de los flujos aleatorios
+
+    Returns:
+        Juego nuevo en el menú principal
+    """
+    from ..game import Game
+    from .dialog_manager import dialog_manager
+    from .save_manager import save_manager
+    from .shop import reset_merchant_shop
+    from .dev_commands import dev_command_manager
+
+    for filename in os.listdir(save_dir):
+        os.remove(os.path.join(save_dir, filename))
+    save_manager.refresh_slots()
+
+    dialog_manager.clear_queue()
+    if dialog_manager.is_active():
+        dialog_manager.close()
+    reset_merchant_shop()
+    dev_command_manager.reset_flags()
+
+    rng.reseed(seed)
+    return Game()
+
+
+def _play(game: 'Game', inputs: List[Any], render: bool,
+          on_action: Optional[Callable[[int, Any, float], None]] = None) -> Optional[BaseException]:
+    """
+    Aplica una secuencia de entradas y mide cada una.
+
+    Args:
+        game: Instancia del juego
+        inputs: Entradas a aplicar
+        render: Renderizar tras cada entrada
+        on_action: Callback (índice, entrada, segundos) tras cada entrada
+
+    Returns:
+        La excepción que detuvo la secuencia, o None
+    """
+    for index, entry in enumerate(inputs):
+        if not game.running:
+            break
+        start = time.perf_counter()
+        try:
+            apply_input(game, entry)
+            game.animation_manager.clear()
+            if render:
+                game._render_frame()
+        except Exception as e:
+            return e
+        if on_action:
+            on_action(index, entry, time.perf_counter() - start)
+    return None
+
+
+def _reproduces(save_dir: str, seed: int, inputs: List[Any], failure: Dict[str, Any],
+                options: Dict[str, Any]) -> bool:
+    """Indica si la secuencia reproduce el fallo en una partida nueva."""
+    game = _fresh_game(save_dir, seed)
+    threshold = options["threshold"] / 1000
+    slow = []
+
+    def check_latency(_index: int, _entry: Any, seconds: float) -> None:
+        if seconds >= threshold:
+            slow.append(seconds)
+
+    error = _play(game, inputs, options["render"], check_latency)
+    if failure["kind"] == "crash":
+        return error is not None and _crash_signature(error) == failure["signature"]
+    return bool(slow)
+
+
+def _shrink(save_dir: str, seed: int, inputs: List[Any], failure: Dict[str, Any],
+            options: Dict[str, Any]) -> Tuple[List[Any], bool]:
+    """
+    Reduce la secuencia que provoca un fallo (delta debugging simplificado).
+
+    Prueba a quitar bloques de entradas cada vez más pequeños y se queda
+    con cualquier reducción que siga reproduciendo el fallo.
+
+    Args:
+        save_dir: Directorio de guardado temporal
+        seed: Semilla de la partida
+        inputs: Secuencia original (el fallo ocurre en la última entrada)
+        failure: Descripción del fallo (kind, signature)
+        options: Opciones de la sesión (threshold, render, shrink)
+
+    Returns:
+        Tupla (secuencia mínima encontrada, si el fallo se reprodujo)
+    """
+    budget = options["shrink"]
+    if budget <= 0 or not _reproduces(save_dir, seed, inputs, failure, options):
+        return inputs, False
+
+    chunks = 2
+    while len(inputs) >= 2 and budget > 0:
+        size = max(1, len(inputs) // chunks)
+        reduced = False
+        for start in range(0, len(inputs), size):
+            if budget <= 0:
+                break
+            candidate = inputs[:start] + inputs[start + size:]
+            if not candidate:
+                continue
+            budget -= 1
+            if _reproduces(save_dir, seed, candidate, failure, options):
+                inputs = candidate
+                chunks = max(chunks - 1, 2)
+                reduced = True
+                break
+        if not reduced:
+            if size == 1:
+                break
+            chunks = min(len(inputs), chunks * 2)
+    return inputs, True
+
+
+def _write_replay(path: str, seed: int, inputs: List[Any]) -> None:
+    """Guarda una secuencia de entradas como archivo de repetición."""
+    recorder = InputRecorder(path, seed, [])
+    for entry in inputs:
+        if isinstance(entry, int):
+            recorder.record_key(entry)
+        elif isinstance(entry, str):
+            recorder.record_text(entry)
+        elif entry[0] == "open":
+            recorder.record_open(entry[1])
+        else:
+            recorder.record_mouse(*entry)
+    recorder.close()
+
+
+def run_fuzz(options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Ejecuta una sesión de fuzzing sin ventana.
+
+    Los guardados van a un directorio temporal: los slots reales no se
+    tocan. Cada partida empieza en el menú principal con una semilla
+    propia, así que cada fallo se puede reproducir con run_replay().
+
+    Args:
+        options: Opciones de la sesión (ver FUZZ_DEFAULTS)
+
+    Returns:
+        Resultados: acciones, partidas, tiempo, acciones por estado,
+        acciones más lentas y fallos encontrados (con su archivo)
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    from .save_manager import save_manager
+
+    chooser = random.Random(options["seed"])
+    threshold = options["threshold"] / 1000
+    os.makedirs(options["output"], exist_ok=True)
+
+    actions = 0
+    episodes = 0
+    per_state: Dict[str, int] = {}
+    slowest: List[Tuple[float, str, str]] = []
+    failures: List[Dict[str, Any]] = []
+    seen: Dict[str, Dict[str, Any]] = {}
+    elapsed = 0.0
+
+    with tempfile.TemporaryDirectory(prefix="fuzz_") as save_dir:
+        previous_dir = save_manager.save_dir
+        save_manager.save_dir = save_dir
+        try:
+            state_keys: Optional[Dict[Any, List[int]]] = None
+            while actions < options["actions"]:
+                episode_seed = chooser.randrange(2 ** 31)
+                game = _fresh_game(save_dir, episode_seed)
+                if state_keys is None:
+                    state_keys = _state_keys()
+                episodes += 1
+                inputs: List[Any] = []
+                pending: List[Dict[str, Any]] = []
+
+                for _ in range(min(options["episode"], options["actions"] - actions)):
+                    if not game.running:
+                        break
+                    state_name = game.state
+                    entry = _choose_input(game, chooser, state_keys)
+                    inputs.append(entry)
+                    start = time.perf_counter()
+                    error = _play(game, [entry], options["render"])
+                    seconds = time.perf_counter() - start
+                    elapsed += seconds
+                    actions += 1
+                    per_state[state_name] = per_state.get(state_name, 0) + 1
+
+                    slowest.append((seconds, state_name, _describe_input(entry)))
+                    if len(slowest) > 20:
+                        slowest.sort(reverse=True)
+                        del slowest[10:]
+
+                    if error is not None:
+                        pending.append({
+                            "kind": "crash",
+                            "signature": _crash_signature(error),
+                            "state": state_name,
+                            "input": _describe_input(entry),
+                            "detail": "".join(traceback.format_exception_only(type(error), error)).strip(),
+                            "traceback": "".join(
+                                traceback.format_exception(type(error), error, error.__traceback__)),
+                            "inputs": list(inputs),
+                        })
+                        break
+                    if seconds >= threshold:
+                        pending.append({
+                            "kind": "slow",
+                            "signature": f"slow@{state_name}",
+                            "state": state_name,
+                            "input": _describe_input(entry),
+                            "detail": f"{seconds * 1000:.1f}ms",
+                            "inputs": list(inputs),
+                        })
+
+                # Minimizar fuera de la partida (las reproducciones reinician los singletons)
+                for failure in pending:
+                    known = seen.get(failure["signature"])
+                    if known:
+                        known["hits"] += 1
+                        continue
+                    failure["hits"] = 1
+                    failure["seed"] = episode_seed
+                    original = len(failure["inputs"])
+                    failure["inputs"], failure["reproduced"] = _shrink(
+                        save_dir, episode_seed, failure["inputs"], failure, options
+                    )
+                    failure["original_length"] = original
+                    failure["path"] = os.path.join(
+                        options["output"], f"{failure['kind']}_{len(failures) + 1:03}.replay"
+                    )
+                    _write_replay(failure["path"], episode_seed, failure["inputs"])
+                    seen[failure["signature"]] = failure
+                    failures.append(failure)
+        finally:
+            save_manager.save_dir = previous_dir
+            save_manager.refresh_slots()
+
+    slowest.sort(reverse=True)
+    return {
+        "actions": actions,
+        "episodes": episodes,
+        "elapsed": elapsed,
+        "per_state": per_state,
+        "slowest": slowest[:5],
+        "failures": failures,
+        "threshold": options["threshold"],
+    }
+
+
+def format_fuzz_report(result: Dict[str, Any]) -> List[str]:
+    """
+    Formatea los resultados de una sesión de fuzzing.
+
+    Args:
+        result: Resultado de run_fuzz()
+
+    Returns:
+        Líneas legibles
+    """
+    rate = result["actions"] / result["elapsed"] if result["elapsed"] else 0.0
+    lines = [
+        f"[FUZZ] {result['actions']} acciones en {result['episodes']} partidas, "
+        f"{result['elapsed']:.2f}s ({rate:.0f} acciones/s)",
+        "Acciones por estado: " + ", ".join(
+            f"{state}={count}" for state, count in sorted(result["per_state"].items(), key=lambda item: -item[1])
+        ),
+        "Acciones más lentas:",
+    ]
+    for seconds, state, description in result["slowest"]:
+        lines.append(f"  {seconds * 1000:8.2f}ms  {state:10} {description}")
+
+    if not result["failures"]:
+        lines.append(f"Sin fallos (umbral {result['threshold']:.0f}ms).")
+        return lines
+
+    lines.append(f"Fallos ({len(result['failures'])}):")
+    for failure in result["failures"]:
+        lines.append(
+            f"  {failure['kind']:5} {failure['signature']}  x{failure['hits']}  "
+            f"[{failure['state']}: {failure['input']}] {failure['detail']}"
+        )
+        note = "" if failure["reproduced"] else " (no se reprodujo: sin minimizar)"
+        lines.append(
+            f"        {failure['original_length']} → {len(failure['inputs'])} entradas: {failure['path']}{note}"
+        )
+    return lines
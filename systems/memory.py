@@ -0,0 +1,186 @@
+"""
+Sondas de memoria basadas en tracemalloc.
+
+Permite tomar una instantánea "antes", jugar un rato y comparar con una
+instantánea "después" para ver qué sitios del código han crecido,
+agrupados por subsistema del paquete (world, entities, ui, systems...).
+También cuenta instancias vivas de los tipos que más suelen acumularse.
+"""
+from __future__ import annotations
+from typing import Dict, List, Optional, Tuple
+import gc
+import os
+import tracemalloc
+
+
+# Raíz del paquete (para agrupar los sitios de asignación por subsistema)
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Subcarpetas del paquete que se reportan como subsistema propio
+SUBSYSTEMS = ("world", "entities", "items", "ui", "systems", "content")
+
+
+def subsystem_for(filename: str) -> str:
+    """
+    Determina el subsistema al que pertenece un archivo.
+
+    Args:
+        filename: Ruta del archivo de la traza
+
+    Returns:
+        Nombre del subsistema, "game" para módulos raíz o "externo"
+    """
+    path = os.path.abspath(filename)
+    if not path.startswith(_PACKAGE_ROOT + os.sep):
+        return "externo"
+    relative = os.path.relpath(path, _PACKAGE_ROOT)
+    top = relative.split(os.sep, 1)[0]
+    return top if top in SUBSYSTEMS else "game"
+
+
+def count_objects() -> Dict[str, int]:
+    """
+    Cuenta instancias vivas de Tile, Monster, Item y pygame.Surface.
+
+    Las Surface no las rastrea el recolector, y tampoco los dict o tuple
+    que solo contienen str, números y Surface (los caches de sprites y
+    texto): se cuentan recorriendo las referencias desde los objetos
+    rastreados y bajando por esos contenedores no rastreados, cada uno
+    una sola vez (cada Surface se cuenta una vez).
+
+    Returns:
+        Diccionario {nombre de tipo: cantidad}
+    """
+    import pygame
+    from ..world.tile import Tile
+    from ..entities.monster import Monster
+    from ..items.item import Item
+
+    counts = {"Tile": 0, "Monster": 0, "Item": 0, "pygame.Surface": 0}
+    surfaces = set()
+    visited = set()
+
+    pending = gc.get_objects()
+    for obj in pending:
+        if isinstance(obj, Tile):
+            counts["Tile"] += 1
+        elif isinstance(obj, Monster):
+            counts["Monster"] += 1
+        elif isinstance(obj, Item):
+            counts["Item"] += 1
+
+    # Los rastreados ya están en la lista; solo se añaden los no rastreados
+    while pending:
+        for ref in gc.get_referents(pending.pop()):
+            if isinstance(ref, pygame.Surface):
+                surfaces.add(id(ref))
+            elif (isinstance(ref, (dict, tuple)) and not gc.is_tracked(ref)
+                    and id(ref) not in visited):
+                visited.add(id(ref))
+                pending.append(ref)
+
+    counts["pygame.Surface"] = len(surfaces)
+    return counts
+
+
+class MemoryProbe:
+    """
+    Sesión de medición de memoria con instantánea base.
+
+    Attributes:
+        baseline: Instantánea tomada al empezar
+        baseline_counts: Conteo de objetos al empezar
+    """
+
+    def __init__(self) -> None:
+        """Inicializa la sonda (inactiva)."""
+        self.baseline: Optional[tracemalloc.Snapshot] = None
+        self.baseline_counts: Dict[str, int] = {}
+        self._started_tracing = False
+
+    @property
+    def active(self) -> bool:
+        """Indica si hay una instantánea base tomada."""
+        return self.baseline is not None
+
+    def start(self, frames: int = 1) -> None:
+        """
+        Arranca tracemalloc (si hace falta) y toma la instantánea base.
+
+        Args:
+            frames: Profundidad de las trazas guardadas por asignación
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            self._started_tracing = True
+        self.baseline = self._take_snapshot()
+        self.baseline_counts = count_objects()
+
+    def stop(self) -> None:
+        """Descarta la instantánea base y detiene tracemalloc si lo arrancó la sonda."""
+        self.baseline = None
+        self.baseline_counts = {}
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracing = False
+
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        """Toma una instantánea excluyendo el propio tracemalloc e importlib."""
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
+
+    def report(self, top: int = 8) -> List[str]:
+        """
+        Compara el estado actual con la instantánea base.
+
+        Args:
+            top: Número de sitios de asignación a listar
+
+        Returns:
+            Líneas del informe
+        """
+        if self.baseline is None:
+            return ["[MEM] No hay instantánea base (usa 'mem start')."]
+
+        current = self._take_snapshot()
+        diffs = current.compare_to(self.baseline, "lineno")
+
+        by_subsystem: Dict[str, Tuple[int, int]] = {}
+        for stat in diffs:
+            name = subsystem_for(stat.traceback[0].filename)
+            size, count = by_subsystem.get(name, (0, 0))
+            by_subsystem[name] = (size + stat.size_diff, count + stat.count_diff)
+
+        total_diff = sum(stat.size_diff for stat in diffs)
+        traced, peak = tracemalloc.get_traced_memory()
+
+        lines = [
+            f"[MEM] Δ total: {total_diff / 1024:+.1f} KiB  "
+            f"(trazado {traced / 1024 / 1024:.1f} MiB, pico {peak / 1024 / 1024:.1f} MiB)",
+            "Por subsistema:",
+        ]
+        for name, (size, count) in sorted(by_subsystem.items(), key=lambda item: -abs(item[1][0])):
+            lines.append(f"  {name:10} {size / 1024:+9.1f} KiB {count:+8} bloques")
+
+        lines.append("Sitios con más crecimiento:")
+        growing = sorted(diffs, key=lambda stat: stat.size_diff, reverse=True)[:top]
+        for stat in growing:
+            frame = stat.traceback[0]
+            location = os.path.relpath(frame.filename, _PACKAGE_ROOT) \
+                if subsystem_for(frame.filename) != "externo" else os.path.basename(frame.filename)
+            lines.append(f"  {stat.size_diff / 1024:+9.1f} KiB  {location}:{frame.lineno}")
+
+        lines.append("Objetos vivos (ahora / Δ):")
+        for name, value in count_objects().items():
+            delta = value - self.baseline_counts.get(name, 0)
+            lines.append(f"  {name:15} {value:>8} ({delta:+})")
+
+        return lines
+
+
+# Instancia global de la sonda de memoria
+memory_probe = MemoryProbe()
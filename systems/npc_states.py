@@ -400,13 +400,13 @@ class NPCStateManager:
         Returns:
             Tupla (x, y) con la posición o None si no se encuentra
         """
-        import random
+        from .rng import rng
         
         # Para dungeon: usar habitaciones
         if zone.zone_type == "dungeon" and hasattr(zone, 'rooms') and zone.rooms:
             # Elegir habitación (preferir no la primera si hay varias)
             if len(zone.rooms) > 1:
-                spawn_room = random.choice(zone.rooms[1:])
+                spawn_room = rng.generation.choice(zone.rooms[1:])
             else:
                 spawn_room = zone.rooms[0]
             
@@ -416,8 +416,8 @@ class NPCStateManager:
                     pos = zone._get_random_room_position(spawn_room)
                 else:
                     room = spawn_room
-                    px = random.randint(room.x1 + 1, room.x2 - 1)
-                    py = random.randint(room.y1 + 1, room.y2 - 1)
+                    px = rng.generation.randint(room.x1 + 1, room.x2 - 1)
+                    py = rng.generation.randint(room.y1 + 1, room.y2 - 1)
                     pos = (px, py)
                 
                 if not self._is_near_stairs(zone, pos[0], pos[1]):
@@ -436,7 +436,7 @@ class NPCStateManager:
         if not walkable_positions:
             return None
         
-        return random.choice(walkable_positions)
+        return rng.generation.choice(walkable_positions)
     
     def _get_adjacent_position(self, zone: Zone, x: int, y: int) -> Optional[Tuple[int, int]]:
         """
@@ -0,0 +1,251 @@
+"""
+Pre-generación en segundo plano del siguiente piso.
+
+En cuanto el jugador entra en una zona, un hilo genera el piso inferior
+mientras se juega. Al bajar, `take()` entrega ese piso ya construido en
+vez de generarlo en el mismo frame.
+
+El resultado es idéntico al de la generación síncrona:
+- La generación de un piso depende solo de (semilla, piso) y de los
+  eventos que desbloquean el botín; ambos forman la clave del trabajo y
+  se vuelven a comprobar al entregarlo.
+- El hilo usa copias privadas de los flujos "generation" y "loot"
+  (`rng.isolated`), así que no consume tiradas del hilo principal. Al
+  entregar, su estado final se copia a los flujos globales.
+- El spawn de NPCs del FSM modifica estado compartido, así que no se hace
+  en el hilo: se ejecuta en el hilo principal durante la entrega, con los
+  flujos ya en el mismo punto en que los dejaría la generación síncrona.
+  La validación del piso va detrás, igual que en `Dungeon.generate`.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import threading
+
+from .rng import rng
+
+if TYPE_CHECKING:
+    from ..world.dungeon import Dungeon
+
+
+# Eventos que cambian el contenido generado (ver Dungeon._populate)
+PREGEN_EVENT_FLAGS = (
+    "stranger_lobby_weapons_unlocked",
+    "stranger_lobby_potions_unlocked",
+)
+
+
+def _generation_key(floor: int, width: int, height: int) -> Tuple:
+    """
+    Calcula la clave de la que depende el resultado de generar un piso.
+
+    Args:
+        floor: Número de piso
+        width: Ancho del mapa
+        height: Alto del mapa
+
+    Returns:
+        Tupla (semilla, piso, ancho, alto, eventos de botín)
+    """
+    from .events import event_manager
+
+    flags = tuple(event_manager.is_event_triggered(flag) for flag in PREGEN_EVENT_FLAGS)
+    return (rng.seed, floor, width, height, flags)
+
+
+class _PregenJob:
+    """
+    Trabajo de generación de un piso en un hilo.
+
+    Attributes:
+        key: Clave de generación con la que se lanzó
+        dungeon: Piso generado (sin NPCs del FSM ni validación)
+        start_pos: Posición inicial devuelta por generate()
+        states: Estado final de los flujos privados {nombre: estado}
+        error: Excepción del hilo, si la hubo
+    """
+
+    def __init__(self, key: Tuple) -> None:
+        """
+        Lanza el hilo de generación.
+
+        Args:
+            key: Clave de generación (ver _generation_key)
+        """
+        self.key = key
+        self.dungeon: Optional[Dungeon] = None
+        self.start_pos: Optional[Tuple[int, int]] = None
+        self.states: Dict[str, tuple] = {}
+        self.error: Optional[BaseException] = None
+        self.thread = threading.Thread(
+            target=self._run, name=f"pregen-piso{key[1]}", daemon=True
+        )
+        self.thread.start()
+
+    def _run(self) -> None:
+        """Genera el piso con flujos aislados (se ejecuta en el hilo)."""
+        from ..world.dungeon import Dungeon
+
+        seed, floor, width, height, _flags = self.key
+        try:
+            with rng.isolated(seed=seed) as streams:
+                dungeon = Dungeon(width, height, floor)
+                self.start_pos = dungeon.generate(spawn_npcs=False)
+                self.states = {name: stream.getstate() for name, stream in streams.items()}
+            self.dungeon = dungeon
+        except Exception as e:
+            self.error = e
+
+    @property
+    def done(self) -> bool:
+        """True si el hilo ya terminó."""
+        return not self.thread.is_alive()
+
+
+class FloorPregenerator:
+    """
+    Gestiona la pre-generación especulativa del siguiente piso.
+
+    Solo hay un trabajo a la vez: lanzar otro descarta el anterior (su
+    hilo termina por su cuenta y el resultado se ignora).
+
+    Attributes:
+        enabled: Si está desactivado, take() siempre devuelve None
+        hits: Pisos entregados ya generados
+        misses: Bajadas que tuvieron que generar de forma síncrona
+    """
+
+    def __init__(self) -> None:
+        """Inicializa el gestor sin trabajos."""
+        self.enabled: bool = True
+        self.hits: int = 0
+        self.misses: int = 0
+        self._job: Optional[_PregenJob] = None
+
+    def start(self, floor: int, width: int, height: int) -> None:
+        """
+        Lanza la generación de un piso en segundo plano.
+
+        No hace nada si ya hay un trabajo con la misma clave.
+
+        Args:
+            floor: Número de piso a generar
+            width: Ancho del mapa
+            height: Alto del mapa
+        """
+        if not self.enabled:
+            return
+        key = _generation_key(floor, width, height)
+        if self._job and self._job.key == key:
+            return
+        self._job = _PregenJob(key)
+
+    def take(self, floor: int, width: int, height: int) -> Optional[Tuple['Dungeon', Tuple[int, int]]]:
+        """
+        Entrega el piso pre-generado si sigue siendo válido.
+
+        Espera al hilo si aún no terminó, comprueba que la clave coincide
+        con el estado actual, traslada el estado de los flujos y spawnea
+        los NPCs del FSM en el hilo principal.
+
+        Args:
+            floor: Número de piso que se va a entrar
+            width: Ancho del mapa
+            height: Alto del mapa
+
+        Returns:
+            Tupla (piso, posición inicial) o None si hay que generarlo
+            de forma síncrona
+        """
+        from .telemetry import telemetry
+
+        job, self._job = self._job, None
+        if not self.enabled or job is None or job.key != _generation_key(floor, width, height):
+            self.misses += 1
+            telemetry.count("pregen.misses")
+            return None
+
+        with telemetry.timer("pregen.wait"):
+            job.thread.join()
+        if job.error is not None or job.dungeon is None:
+            self.misses += 1
+            telemetry.count("pregen.misses")
+            return None
+
+        rng.adopt(job.states)
+        job.dungeon.spawn_npcs_from_states()
+        job.dungeon.validate()
+        self.hits += 1
+        telemetry.count("pregen.hits")
+        return job.dungeon, job.start_pos
+
+    def discard(self) -> None:
+        """Olvida el trabajo pendiente (su hilo termina por su cuenta)."""
+        self._job = None
+
+    def status_lines(self) -> List[str]:
+        """
+        Describe el estado del pre-generador.
+
+        Returns:
+            Líneas legibles
+        """
+        lines = [
+            f"Pre-generación: {'activada' if self.enabled else 'desactivada'} "
+            f"(aciertos {self.hits}, fallos {self.misses})"
+        ]
+        job = self._job
+        if job is None:
+            lines.append("  Sin trabajo pendiente")
+        elif job.error is not None:
+            lines.append(f"  Piso {job.key[1]}: error {type(job.error).__name__}: {job.error}")
+        else:
+            lines.append(f"  Piso {job.key[1]}: {'listo' if job.done else 'generando...'}")
+        return lines
+
+
+def verify_pregen(floor: int, width: int, height: int) -> List[str]:
+    """
+    Comprueba que la pre-generación coincide con la generación síncrona.
+
+    Genera el piso en un hilo y en el hilo principal (ambos con flujos
+    aislados y sin NPCs, así que no altera la partida) y compara mapa,
+    entidades, objetos y estado final de los flujos.
+
+    Args:
+        floor: Número de piso
+        width: Ancho del mapa
+        height: Alto del mapa
+
+    Returns:
+        Líneas con el resultado (la primera empieza por ✓ o ⚠)
+    """
+    from ..world.dungeon import Dungeon
+
+    job = _PregenJob(_generation_key(floor, width, height))
+    job.thread.join()
+    if job.error is not None or job.dungeon is None:
+        return [f"⚠ Piso {floor}: el hilo falló ({type(job.error).__name__}: {job.error})"]
+
+    with rng.isolated(seed=job.key[0]) as streams:
+        dungeon = Dungeon(width, height, floor)
+        start_pos = dungeon.generate(spawn_npcs=False)
+        states = {name: stream.getstate() for name, stream in streams.items()}
+
+    differences = []
+    if start_pos != job.start_pos:
+        differences.append("posición inicial")
+    threaded, synchronous = job.dungeon.to_dict(compact=False), dungeon.to_dict(compact=False)
+    differences.extend(key for key in synchronous if threaded.get(key) != synchronous[key])
+    if states != job.states:
+        differences.append("estado de los flujos")
+
+    if differences:
+        return [f"⚠ Piso {floor}: difiere en {', '.join(differences)}"]
+    return [
+        f"✓ Piso {floor}: idéntico ({len(dungeon.rooms)} salas, "
+        f"{len(dungeon.entities)} entidades, {len(dungeon.items)} objetos)"
+    ]
+
+
+# Instancia global del pre-generador de pisos
+floor_pregenerator = FloorPregenerator()
@@ -0,0 +1,152 @@
+"""
+Profiler integrado para diagnosticar frames o turnos lentos.
+
+Se arma desde la consola de desarrollo (comando `profile`) y ejecuta
+cProfile solo durante los próximos N frames del game loop o N turnos de
+enemigos. Al terminar vuelca un archivo .prof (compatible con pstats,
+snakeviz, etc.) y devuelve un resumen de las funciones más costosas.
+
+Mientras no está armado, el coste para el juego es una comparación por
+frame.
+"""
+from __future__ import annotations
+from typing import List, Optional
+import cProfile
+import os
+import pstats
+from datetime import datetime
+
+
+# Modos de perfilado disponibles
+PROFILE_MODES = ("frames", "turns")
+
+
+class FrameProfiler:
+    """
+    Ejecuta cProfile sobre un número fijo de frames o turnos.
+
+    Attributes:
+        mode: Modo armado ("frames", "turns") o None si está inactivo
+        remaining: Pasos que faltan por perfilar
+        total: Pasos pedidos en la sesión actual
+        output_dir: Carpeta donde se vuelcan los archivos .prof
+        top_n: Número de funciones a mostrar en el resumen
+    """
+
+    def __init__(self, output_dir: str = "profiles", top_n: int = 12) -> None:
+        """
+        Inicializa el profiler (inactivo).
+
+        Args:
+            output_dir: Carpeta de salida de los .prof
+            top_n: Funciones a incluir en el resumen
+        """
+        self.mode: Optional[str] = None
+        self.remaining = 0
+        self.total = 0
+        self.output_dir = output_dir
+        self.top_n = top_n
+        self._profile: Optional[cProfile.Profile] = None
+        self._running = False
+
+    @property
+    def active(self) -> bool:
+        """Indica si hay una sesión de perfilado armada."""
+        return self.mode is not None
+
+    def start(self, mode: str, count: int) -> None:
+        """
+        Arma una sesión de perfilado.
+
+        Args:
+            mode: "frames" (game loop sin la espera en reposo) o "turns"
+                (turno de enemigos)
+            count: Número de frames/turnos a perfilar
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Modo desconocido: {mode}")
+        self.cancel()
+        self.mode = mode
+        self.remaining = max(1, count)
+        self.total = self.remaining
+        self._profile = cProfile.Profile()
+
+    def cancel(self) -> None:
+        """Descarta la sesión actual sin generar informe."""
+        if self._profile is not None and self._running:
+            self._profile.disable()
+        self.mode = None
+        self.remaining = 0
+        self._profile = None
+        self._running = False
+
+    def begin(self, mode: str) -> bool:
+        """
+        Empieza a medir un paso si la sesión está armada en ese modo.
+
+        Args:
+            mode: Modo del paso que empieza
+
+        Returns:
+            True si se está midiendo (hay que llamar a end() al terminar)
+        """
+        if self.mode != mode or self._running or self._profile is None:
+            return False
+        self._profile.enable()
+        self._running = True
+        return True
+
+    def end(self) -> Optional[List[str]]:
+        """
+        Termina de medir un paso.
+
+        Returns:
+            Líneas del informe si la sesión ha terminado, o None
+        """
+        if self._profile is None or not self._running:
+            return None
+        self._profile.disable()
+        self._running = False
+        self.remaining -= 1
+        if self.remaining > 0:
+            return None
+        return self._finish()
+
+    def _finish(self) -> List[str]:
+        """Vuelca el .prof, genera el resumen y desactiva la sesión."""
+        profile = self._profile
+        mode, total = self.mode, self.total
+        self.cancel()
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.output_dir, f"profile_{mode}_{timestamp}.prof")
+        profile.dump_stats(path)
+
+        stats = pstats.Stats(profile)
+        entries = sorted(
+            stats.stats.items(),  # type: ignore[attr-defined]
+            key=lambda item: item[1][2],  # tottime
+            reverse=True
+        )
+        total_time = sum(data[2] for _, data in entries)
+
+        lines = [
+            f"[PROFILE] {total} {mode}: {total_time * 1000:.1f} ms "
+            f"({total_time * 1000 / total:.2f} ms/paso)",
+            "   propio  acumul.   llamadas  función",
+        ]
+        for (filename, lineno, func), (_cc, ncalls, tottime, cumtime, _callers) in entries[:self.top_n]:
+            location = f"{os.path.basename(filename)}:{lineno}" if lineno else filename
+            lines.append(
+                f"{tottime * 1000:7.1f}ms {cumtime * 1000:7.1f}ms {ncalls:>9}  {func} ({location})"
+            )
+        lines.append(f"[PROFILE] Guardado en {path}")
+
+        for line in lines:
+            print(line)
+        return lines
+
+
+# Instancia global del profiler
+frame_profiler = FrameProfiler()
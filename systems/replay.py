@@ -0,0 +1,307 @@
+"""
+Grabación y reproducción determinista de partidas.
+
+Una grabación guarda la semilla de los flujos aleatorios (ver `rng`), una
+copia de los slots de guardado existentes y cada entrada que procesa el
+juego. Reproducirla en modo headless recrea la partida exacta, así que
+sirve tanto para reproducir bugs como de traza de rendimiento.
+
+Formato (texto, una entrada JSON por línea):
+    {"version": 1, "seed": ..., "saves": {...}}   # cabecera
+    273                                           # tecla (KEYDOWN)
+    "abc"                                         # texto (TEXTINPUT)
+    ["down", 1, 400, 300]                          # ratón (inventario)
+    ["open", "shop"]                              # abrir pantalla (fuzzer)
+    {"end": {...}}                                # huella final (opcional)
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, TextIO
+import base64
+import json
+import os
+import tempfile
+import time
+
+from .rng import rng
+
+if TYPE_CHECKING:
+    from ..game import Game
+
+
+REPLAY_VERSION = 1
+
+# Pantallas que una entrada ["open", nombre] abre desde el juego. Jugando se
+# llega a ellas hablando con un NPC concreto (o nunca, el menú de guardado
+# en partida); el fuzzer las abre directamente para cubrir sus manejadores.
+OPEN_SCREENS = ("shop", "donation", "save_menu")
+
+
+def game_fingerprint(game: 'Game') -> Dict[str, Any]:
+    """
+    Resume el estado observable de una partida para comparar reproducciones.
+
+    Args:
+        game: Instancia del juego
+
+    Returns:
+        Diccionario con turno, estado y datos básicos del jugador
+    """
+    fingerprint: Dict[str, Any] = {
+        "turn": game.turn_count,
+        "state": game.state,
+    }
+    player = game.player
+    if player is not None:
+        fingerprint.update({
+            "floor": player.current_floor,
+            "pos": [player.x, player.y],
+            "hp": player.fighter.hp,
+            "level": player.fighter.level,
+            "gold": player.gold,
+        })
+    return fingerprint
+
+
+class InputRecorder:
+    """
+    Graba las entradas del jugador en un archivo de repetición.
+
+    Cada entrada se escribe y se vuelca al disco inmediatamente para que la
+    grabación sobreviva a un cierre inesperado del juego.
+    """
+
+    def __init__(self, path: str, seed: int, save_paths: List[str]) -> None:
+        """
+        Abre el archivo y escribe la cabecera.
+
+        Args:
+            path: Ruta del archivo de repetición
+            seed: Semilla de los flujos aleatorios
+            save_paths: Archivos de guardado a incluir en la cabecera
+        """
+        self.path = path
+        self.count = 0
+
+        saves: Dict[str, str] = {}
+        for save_path in save_paths:
+            if os.path.exists(save_path):
+                with open(save_path, "rb") as f:
+                    saves[os.path.basename(save_path)] = base64.b64encode(f.read()).decode("ascii")
+
+        self._file: Optional[TextIO] = open(path, "w", encoding="utf-8")
+        self._write({"version": REPLAY_VERSION, "seed": seed, "saves": saves})
+
+    def _write(self, entry: Any) -> None:
+        """Escribe una línea en el archivo."""
+        if self._file is None:
+            return
+        self._file.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")))
+        self._file.write("\n")
+        self._file.flush()
+
+    def record_key(self, key: int) -> None:
+        """Graba una pulsación de tecla."""
+        self.count += 1
+        self._write(key)
+
+    def record_text(self, text: str) -> None:
+        """Graba texto introducido en la consola."""
+        self.count += 1
+        self._write(text)
+
+    def record_mouse(self, kind: str, *values: int) -> None:
+        """
+        Graba un evento de ratón.
+
+        Args:
+            kind: "down", "up", "move" o "wheel"
+            *values: Botón y/o coordenadas del evento
+        """
+        self.count += 1
+        self._write([kind, *values])
+
+    def record_open(self, screen: str) -> None:
+        """
+        Graba la apertura directa de una pantalla (ver OPEN_SCREENS).
+
+        Args:
+            screen: Nombre de la pantalla
+        """
+        self.count += 1
+        self._write(["open", screen])
+
+    def close(self, game: Optional['Game'] = None) -> None:
+        """
+        Cierra la grabación, añadiendo la huella final si hay juego.
+
+        Args:
+            game: Instancia del juego (opcional)
+        """
+        if self._file is None:
+            return
+        if game is not None:
+            self._write({"end": game_fingerprint(game)})
+        self._file.close()
+        self._file = None
+
+
+def load_replay(path: str) -> Dict[str, Any]:
+    """
+    Lee un archivo de repetición.
+
+    Args:
+        path: Ruta del archivo
+
+    Returns:
+        Diccionario con "header", "inputs" y "end" (None si no hay huella)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line for line in f if line.strip()]
+
+    if not lines:
+        raise ValueError(f"Repetición vacía: {path}")
+
+    header = json.loads(lines[0])
+    if header.get("version") != REPLAY_VERSION:
+        raise ValueError(f"Versión de repetición no soportada: {header.get('version')}")
+
+    inputs: List[Any] = []
+    end = None
+    for line in lines[1:]:
+        entry = json.loads(line)
+        if isinstance(entry, dict):
+            end = entry.get("end")
+        else:
+            inputs.append(entry)
+
+    return {"header": header, "inputs": inputs, "end": end}
+
+
+def apply_input(game: 'Game', entry: Any) -> None:
+    """
+    Aplica una entrada grabada al juego, igual que lo haría el game loop.
+
+    Args:
+        game: Instancia del juego
+        entry: Entrada grabada (tecla, texto o evento de ratón)
+    """
+    from ..config import GameState
+
+    if isinstance(entry, int):
+        if game.state == GameState.MAIN_MENU:
+            game._handle_save_menu_input(entry)
+        else:
+            game._handle_input(entry)
+    elif isinstance(entry, str):
+        if game.state == GameState.CONSOLE:
+            game.console_input += entry
+    else:
+        kind, *values = entry
+        if kind == "open":
+            _open_screen(game, values[0])
+        elif kind == "wheel":
+            game._handle_mousewheel(values[0])
+        elif game.state != GameState.INVENTORY:
+            return
+        elif kind == "down":
+            game._handle_inventory_mouse_down(values[0], (values[1], values[2]))
+        elif kind == "up":
+            game._handle_inventory_mouse_up(values[0], (values[1], values[2]))
+        elif kind == "move":
+            game._handle_inventory_mouse_motion((values[0], values[1]))
+
+
+def _open_screen(game: 'Game', screen: str) -> None:
+    """
+    Abre una pantalla de OPEN_SCREENS si se está jugando (si no, se ignora).
+
+    Args:
+        game: Instancia del juego
+        screen: Nombre de la pantalla
+    """
+    from ..config import GameState
+
+    if game.state != GameState.PLAYING or game.player is None:
+        return
+    if screen == "shop":
+        game._open_shop()
+    elif screen == "donation":
+        game._open_donation()
+    elif screen == "save_menu":
+        game.save_menu_selected = 0
+        game.state = GameState.SAVE_MENU
+
+
+def run_replay(
+    path: str,
+    until_turn: Optional[int] = None,
+    render: bool = False
+) -> Dict[str, Any]:
+    """
+    Reproduce una grabación sin ventana y a máxima velocidad.
+
+    Los guardados se restauran en un directorio temporal, de modo que la
+    reproducción nunca toca los slots reales del jugador.
+
+    Args:
+        path: Ruta del archivo de repetición
+        until_turn: Si se indica, se detiene al alcanzar ese turno
+        render: Si True, renderiza un frame tras cada entrada (traza de rendimiento)
+
+    Returns:
+        Resumen con entradas aplicadas, tiempos y huella final
+        ("matches" indica si coincide con la huella grabada)
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    from ..game import Game
+    from .save_manager import save_manager
+
+    replay = load_replay(path)
+    header = replay["header"]
+
+    with tempfile.TemporaryDirectory(prefix="replay_") as save_dir:
+        for filename, data in header.get("saves", {}).items():
+            with open(os.path.join(save_dir, filename), "wb") as f:
+                f.write(base64.b64decode(data))
+
+        previous_dir = save_manager.save_dir
+        save_manager.save_dir = save_dir
+        save_manager.refresh_slots()
+
+        try:
+            rng.reseed(header["seed"])
+            game = Game()
+
+            applied = 0
+            start = time.perf_counter()
+            for entry in replay["inputs"]:
+                if until_turn is not None and game.turn_count >= until_turn:
+                    break
+                if not game.running:
+                    break
+                apply_input(game, entry)
+                # Sin game loop no se actualizan las animaciones: descartarlas
+                game.animation_manager.clear()
+                if render:
+                    game._render_frame()
+                applied += 1
+            elapsed = time.perf_counter() - start
+        finally:
+            save_manager.save_dir = previous_dir
+            save_manager.refresh_slots()
+
+    fingerprint = game_fingerprint(game)
+    expected = replay["end"]
+    finished = applied == len(replay["inputs"])
+
+    return {
+        "inputs": applied,
+        "total_inputs": len(replay["inputs"]),
+        "turns": game.turn_count,
+        "elapsed": elapsed,
+        "fingerprint": fingerprint,
+        "expected": expected,
+        "matches": (fingerprint == expected) if (finished and expected) else None,
+    }
@@ -0,0 +1,180 @@
+"""
+Flujos de números aleatorios (RNG) separados por subsistema.
+
+Cada subsistema (generación, combate, IA, botín) usa su propio
+`random.Random`, derivado de una semilla de sesión. Así una partida se
+puede reproducir exactamente a partir de la semilla y las entradas del
+jugador, y las tiradas de un subsistema no alteran las de otro.
+
+Los efectos puramente visuales (relámpagos, desplazamiento de números de
+daño) siguen usando el módulo `random` global: no afectan a la partida.
+
+Un hilo puede sustituir temporalmente algunos flujos por copias privadas
+(`rng.isolated(...)`), p. ej. para generar un piso en segundo plano sin
+consumir tiradas de los flujos que usa el hilo principal.
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+import hashlib
+import random
+import threading
+
+
+# Nombres de los flujos disponibles
+STREAM_NAMES = ("generation", "combat", "ai", "loot")
+
+
+class RNGStreams:
+    """
+    Conjunto de generadores aleatorios independientes por subsistema.
+
+    Attributes:
+        seed: Semilla de la sesión actual
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Inicializa los flujos.
+
+        Args:
+            seed: Semilla inicial (None = aleatoria)
+        """
+        self.seed: int = 0
+        self._streams: Dict[str, random.Random] = {
+            name: random.Random() for name in STREAM_NAMES
+        }
+        # Flujos privados por hilo (ver isolated())
+        self._local = threading.local()
+        self.reseed(seed)
+
+    def reseed(self, seed: Optional[int] = None) -> int:
+        """
+        Reinicia todos los flujos a partir de una semilla.
+
+        Args:
+            seed: Nueva semilla (None = aleatoria)
+
+        Returns:
+            La semilla aplicada
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(1 << 32)
+        self.seed = int(seed)
+        for name, stream in self._streams.items():
+            stream.seed(self.derive_seed(name))
+        return self.seed
+
+    def derive_seed(self, name: str, *keys: object) -> int:
+        """
+        Calcula una semilla estable para un flujo y claves adicionales.
+
+        No usa hash() porque está aleatorizado entre procesos.
+
+        Args:
+            name: Nombre del flujo
+            *keys: Claves adicionales (ej: número de piso)
+
+        Returns:
+            Semilla de 64 bits
+        """
+        text = ":".join(str(part) for part in (self.active_seed, name) + keys)
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big")
+
+    @property
+    def active_seed(self) -> int:
+        """Semilla de sesión vigente en este hilo (la de isolated(), si la hay)."""
+        return getattr(self._local, "seed", self.seed)
+
+    def begin_floor(self, floor: int) -> None:
+        """
+        Reinicia los flujos de generación y botín para un piso.
+
+        La generación de un piso depende solo de (semilla, piso), no de
+        cuántas tiradas de combate o IA hubo antes de bajar.
+
+        Args:
+            floor: Número de piso a generar
+        """
+        self.stream("generation").seed(self.derive_seed("generation", floor))
+        self.stream("loot").seed(self.derive_seed("loot", floor))
+
+    def stream(self, name: str) -> random.Random:
+        """
+        Obtiene un flujo por nombre.
+
+        Args:
+            name: Nombre del flujo (ver STREAM_NAMES)
+
+        Returns:
+            Generador del flujo (la copia privada del hilo, si la hay)
+        """
+        local = getattr(self._local, "streams", None)
+        if local is not None and name in local:
+            return local[name]
+        return self._streams[name]
+
+    @contextmanager
+    def isolated(self, names: Tuple[str, ...] = ("generation", "loot"),
+                 seed: Optional[int] = None) -> Iterator[Dict[str, random.Random]]:
+        """
+        Sustituye flujos por copias privadas solo en el hilo actual.
+
+        Las copias parten del estado actual de los flujos globales. Al
+        salir se restauran los globales; el llamador puede trasladar el
+        estado final de las copias con `adopt()`.
+
+        Args:
+            names: Flujos a aislar
+            seed: Semilla de sesión a usar en derive_seed() (None = la actual)
+
+        Yields:
+            Diccionario {nombre: generador privado}
+        """
+        streams: Dict[str, random.Random] = {}
+        for name in names:
+            stream = random.Random()
+            stream.setstate(self._streams[name].getstate())
+            streams[name] = stream
+        self._local.streams = streams
+        self._local.seed = self.seed if seed is None else int(seed)
+        try:
+            yield streams
+        finally:
+            del self._local.streams
+            del self._local.seed
+
+    def adopt(self, states: Dict[str, Tuple]) -> None:
+        """
+        Copia estados de flujos (de getstate()) en los flujos globales.
+
+        Args:
+            states: Diccionario {nombre: estado}
+        """
+        for name, state in states.items():
+            self._streams[name].setstate(state)
+
+    @property
+    def generation(self) -> random.Random:
+        """Flujo para generación de mapas, monstruos y NPCs."""
+        return self.stream("generation")
+
+    @property
+    def combat(self) -> random.Random:
+        """Flujo para tiradas de combate."""
+        return self.stream("combat")
+
+    @property
+    def ai(self) -> random.Random:
+        """Flujo para el comportamiento de monstruos."""
+        return self.stream("ai")
+
+    @property
+    def loot(self) -> random.Random:
+        """Flujo para la generación de objetos."""
+        return self.stream("loot")
+
+
+# Instancia global de los flujos aleatorios
+rng = RNGStreams()
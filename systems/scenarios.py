@@ -0,0 +1,264 @@
+"""
+Ejecución sin ventana de los escenarios de test de la consola.
+
+Cada escenario de `DevCommandManager.TEST_SCENARIOS` se carga en una
+partida nueva dentro de su propio proceso, de modo que `event_manager`,
+`npc_state_manager` y el resto de singletons empiezan limpios. Después se
+recorren las zonas (lobby y pisos 1..N, opcionalmente durante varias
+runs) para que el FSM ejecute sus transiciones diferidas y sus spawns.
+
+El informe recoge, por escenario, los estados FSM finales, las
+transiciones observadas, dónde apareció cada NPC y los tiempos.
+
+Uso:
+    python main.py --scenarios                 (todos, un proceso por CPU)
+    python main.py --scenarios "nieta_huida cadaver_juntos" --runs 3
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+import multiprocessing
+import os
+import time
+import traceback
+
+if TYPE_CHECKING:
+    from ..game import Game
+
+
+# Pisos recorridos por defecto en cada run (cubre los pisos de la historia)
+DEFAULT_WALK_FLOORS = 5
+
+
+def _fsm_snapshot() -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """
+    Copia el estado actual del FSM de todos los NPCs registrados.
+
+    Returns:
+        Diccionario {npc: (estado actual, completitud)}
+    """
+    from .npc_states import npc_state_manager
+
+    snapshot = {}
+    for npc_name in npc_state_manager.npc_states:
+        state = npc_state_manager.get_current_state(npc_name)
+        completion = npc_state_manager.get_state_completion(npc_name, state).value if state else None
+        snapshot[npc_name] = (state, completion)
+    return snapshot
+
+
+def _npcs_in_zone(zone) -> List[str]:
+    """Devuelve "NPC:estado" para cada NPC del FSM presente en la zona."""
+    from .npc_states import npc_state_manager
+
+    return sorted(
+        f"{entity.name}:{npc_state_manager.get_current_state(entity.name)}"
+        for entity in zone.entities
+        if entity.name in npc_state_manager.npc_states
+    )
+
+
+def _walk_zones(game: 'Game', floors: int, runs: int) -> Tuple[List[str], Dict[str, List[str]]]:
+    """
+    Recorre lobby y pisos para forzar los spawns y transiciones del FSM.
+
+    Args:
+        game: Partida con el escenario ya aplicado
+        floors: Pisos a visitar en cada run
+        runs: Runs adicionales a completar (respawn en el lobby)
+
+    Returns:
+        Tupla (transiciones observadas, NPCs vistos por zona)
+    """
+    from .events import event_manager
+
+    transitions: List[str] = []
+    seen: Dict[str, List[str]] = {}
+    previous = _fsm_snapshot()
+
+    def visit(label: str) -> None:
+        nonlocal previous
+        current = _fsm_snapshot()
+        for npc_name, (state, _completion) in current.items():
+            old_state = previous.get(npc_name, (None, None))[0]
+            if state != old_state:
+                transitions.append(f"{label}: {npc_name} {old_state} → {state}")
+        previous = current
+        npcs = _npcs_in_zone(game.dungeon)
+        if npcs:
+            seen[label] = npcs
+
+    for run in range(runs + 1):
+        if run > 0:
+            game._respawn_in_lobby()
+        else:
+            game._lobby.spawn_npcs_from_states()
+        game.dungeon = game._lobby
+        visit(f"run{event_manager.run_count}/lobby")
+
+        game.dungeons = {}
+        for floor in range(1, floors + 1):
+            game._change_floor(floor)
+            visit(f"run{event_manager.run_count}/piso{floor}")
+
+    return transitions, seen
+
+
+def run_scenario(name: str, floors: int = DEFAULT_WALK_FLOORS, runs: int = 0,
+                 seed: int = 0) -> Dict[str, Any]:
+    """
+    Carga un escenario en una partida nueva y recorre sus transiciones.
+
+    Pensado para ejecutarse en un proceso propio: usa los singletons del
+    proceso tal cual (la partida nueva los reinicia).
+
+    Args:
+        name: Nombre del escenario en TEST_SCENARIOS
+        floors: Pisos a visitar en cada run
+        runs: Runs adicionales a completar tras aplicar el escenario
+        seed: Semilla de los flujos aleatorios
+
+    Returns:
+        Resultado: outcome ("ok", "mismatch", "error"), problemas,
+        estados finales, transiciones, NPCs por zona y tiempos (segundos)
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    result: Dict[str, Any] = {
+        "name": name,
+        "outcome": "ok",
+        "problems": [],
+        "final_states": {},
+        "transitions": [],
+        "seen": {},
+        "timings": {},
+    }
+    started = time.perf_counter()
+    try:
+        from ..game import Game
+        from .dev_commands import dev_command_manager
+        from .npc_states import npc_state_manager
+        from .rng import rng
+
+        rng.reseed(seed)
+        start = time.perf_counter()
+        game = Game()
+        game._new_game()
+        result["timings"]["setup"] = time.perf_counter() - start
+
+        scenario = dev_command_manager.TEST_SCENARIOS[name]
+        start = time.perf_counter()
+        messages = dev_command_manager._cmd_scenario(game, [name])
+        result["timings"]["apply"] = time.perf_counter() - start
+
+        result["problems"].extend(line.strip() for line in messages if "⚠" in line)
+        for npc_name, state_id in scenario.get("states", []):
+            current = npc_state_manager.get_current_state(npc_name)
+            if current != state_id:
+                result["problems"].append(f"{npc_name}: esperado '{state_id}', actual '{current}'")
+
+        start = time.perf_counter()
+        transitions, seen = _walk_zones(game, floors, runs)
+        result["timings"]["walk"] = time.perf_counter() - start
+        result["transitions"] = transitions
+        result["seen"] = seen
+
+        affected = {npc_name for npc_name, _ in scenario.get("states", [])}
+        result["final_states"] = {
+            npc_name: state
+            for npc_name, (state, _completion) in _fsm_snapshot().items()
+            if npc_name in affected
+        }
+
+        # Un estado final visible (con zona) debe haber aparecido en el recorrido
+        spawned = {npc for npcs in seen.values() for npc in npcs}
+        for npc_name, state in result["final_states"].items():
+            config = npc_state_manager.get_state_config(npc_name, state) if state else None
+            if config and config.zone_type and f"{npc_name}:{state}" not in spawned:
+                result["problems"].append(f"{npc_name}: estado '{state}' nunca apareció en el recorrido")
+        if result["problems"]:
+            result["outcome"] = "mismatch"
+    except Exception as e:
+        result["outcome"] = "error"
+        result["problems"].append(f"{type(e).__name__}: {e}")
+        result["traceback"] = traceback.format_exc()
+
+    result["timings"]["total"] = time.perf_counter() - started
+    return result
+
+
+def _run_scenario_task(task: Tuple[str, int, int, int]) -> Dict[str, Any]:
+    """Adaptador para Pool.imap_unordered (un único argumento)."""
+    return run_scenario(*task)
+
+
+def run_scenarios(names: Optional[List[str]] = None, workers: Optional[int] = None,
+                  floors: int = DEFAULT_WALK_FLOORS, runs: int = 0,
+                  seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Ejecuta varios escenarios en procesos separados.
+
+    Cada proceso atiende un solo escenario (maxtasksperchild=1), así que
+    ningún escenario hereda estado de otro.
+
+    Args:
+        names: Escenarios a ejecutar (None = todos)
+        workers: Procesos simultáneos (None = número de CPUs)
+        floors: Pisos a visitar en cada run
+        runs: Runs adicionales a completar tras aplicar cada escenario
+        seed: Semilla de los flujos aleatorios
+
+    Returns:
+        Resultados en el orden de TEST_SCENARIOS
+
+    Raises:
+        ValueError: Si algún escenario no existe
+    """
+    from .dev_commands import DevCommandManager
+
+    available = list(DevCommandManager.TEST_SCENARIOS)
+    names = names or available
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise ValueError(f"Escenarios desconocidos: {', '.join(unknown)}")
+
+    tasks = [(name, floors, runs, seed) for name in names]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tasks)))
+    with multiprocessing.Pool(processes=workers, maxtasksperchild=1) as pool:
+        results = list(pool.imap_unordered(_run_scenario_task, tasks))
+
+    order = {name: index for index, name in enumerate(names)}
+    return sorted(results, key=lambda result: order[result["name"]])
+
+
+def format_scenario_report(results: List[Dict[str, Any]], verbose: bool = False) -> List[str]:
+    """
+    Formatea los resultados de run_scenarios().
+
+    Args:
+        results: Resultados por escenario
+        verbose: Incluir transiciones y NPCs vistos por zona
+
+    Returns:
+        Líneas legibles (tiempos en milisegundos)
+    """
+    lines = [f"{'escenario':28} {'resultado':9} {'aplicar':>8} {'recorrer':>9} {'total':>8}  estados finales"]
+    for result in results:
+        timings = result["timings"]
+        states = ", ".join(f"{npc}={state}" for npc, state in result["final_states"].items())
+        lines.append(
+            f"{result['name']:28} {result['outcome']:9} "
+            f"{timings.get('apply', 0) * 1000:>6.1f}ms {timings.get('walk', 0) * 1000:>7.1f}ms "
+            f"{timings.get('total', 0) * 1000:>6.0f}ms  {states}"
+        )
+        for problem in result["problems"]:
+            lines.append(f"    ! {problem}")
+        if verbose:
+            for transition in result["transitions"]:
+                lines.append(f"    ~ {transition}")
+            for zone, npcs in result["seen"].items():
+                lines.append(f"    @ {zone}: {', '.join(npcs)}")
+
+    failed = sum(1 for result in results if result["outcome"] != "ok")
+    lines.append(f"{len(results) - failed}/{len(results)} escenarios correctos")
+    return lines
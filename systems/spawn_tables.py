@@ -0,0 +1,263 @@
+"""
+Tablas de aparición precompiladas por piso (método alias de Walker/Vose).
+
+Monstruos y botín se eligen con pesos que solo dependen del piso y de los
+datos de config. En vez de filtrar MONSTER_DATA / WEAPON_DATA / ARMOR_DATA
+/ POTION_DATA y construir los pesos en cada tirada, se compila una tabla
+alias por piso y categoría: cada muestra cuesta O(1) y una sola tirada
+del flujo (igual que `random.choices` con k=1).
+
+Las tablas se compilan al crear la instancia global (pisos 1..MAX) y bajo
+demanda para pisos mayores. Si se modifican los datos en caliente, llamar
+a `spawn_tables.invalidate()`.
+"""
+from __future__ import annotations
+from typing import Callable, Dict, List, Optional, Sequence
+import random
+import zlib
+
+from ..config import MONSTER_DATA, WEAPON_DATA, ARMOR_DATA, POTION_DATA, MAX_DUNGEON_LEVEL
+
+
+class AliasTable:
+    """
+    Distribución discreta con muestreo O(1) (método alias de Vose).
+
+    Attributes:
+        keys: Valores posibles
+    """
+
+    __slots__ = ("keys", "_prob", "_alias", "_size")
+
+    def __init__(self, keys: Sequence[str], weights: Sequence[float]) -> None:
+        """
+        Compila la tabla.
+
+        Args:
+            keys: Valores posibles (al menos uno)
+            weights: Peso de cada valor (positivos)
+        """
+        self.keys: List[str] = list(keys)
+        size = len(self.keys)
+        total = float(sum(weights))
+        scaled = [w * size / total for w in weights]
+        prob = [1.0] * size
+        alias = list(range(size))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Los restantes (por redondeo) se quedan con probabilidad 1
+
+        self._prob = prob
+        self._alias = alias
+        self._size = size
+
+    def sample(self, rand: random.Random) -> str:
+        """
+        Elige un valor.
+
+        Args:
+            rand: Flujo aleatorio a usar (una tirada)
+
+        Returns:
+            Valor elegido
+        """
+        u = rand.random() * self._size
+        index = int(u)
+        if u - index >= self._prob[index]:
+            index = self._alias[index]
+        return self.keys[index]
+
+    def sample_many(self, rand: random.Random, count: int) -> List[str]:
+        """
+        Elige varios valores (con reemplazo).
+
+        Args:
+            rand: Flujo aleatorio a usar (una tirada por valor)
+            count: Número de valores
+
+        Returns:
+            Lista de valores elegidos
+        """
+        keys, prob, alias, size = self.keys, self._prob, self._alias, self._size
+        result = []
+        for _ in range(count):
+            u = rand.random() * size
+            index = int(u)
+            if u - index >= prob[index]:
+                index = alias[index]
+            result.append(keys[index])
+        return result
+
+    def probabilities(self) -> Dict[str, float]:
+        """
+        Reconstruye la probabilidad de cada valor (para depurar).
+
+        Returns:
+            Diccionario {valor: probabilidad}
+        """
+        result = {key: 0.0 for key in self.keys}
+        for index, key in enumerate(self.keys):
+            result[key] += self._prob[index] / self._size
+            result[self.keys[self._alias[index]]] += (1.0 - self._prob[index]) / self._size
+        return result
+
+
+def _monster_table(floor: int) -> AliasTable:
+    """Monstruos del piso (sin jefes), con peso hacia los más débiles."""
+    valid = [
+        monster_type for monster_type, data in MONSTER_DATA.items()
+        if data["min_level"] <= floor <= data["max_level"] and not data.get("is_boss", False)
+    ]
+    if not valid:
+        valid = ["rat"]  # Fallback
+    return AliasTable(valid, [1.0 / (i + 1) for i in range(len(valid))])
+
+
+def _rarity_table(sources: Sequence[Dict[str, Dict]], floor: Optional[int]) -> Optional[AliasTable]:
+    """Objetos de los diccionarios dados con min_level <= piso, pesados por rareza."""
+    keys, weights = [], []
+    for source in sources:
+        for key, data in source.items():
+            if floor is None or data["min_level"] <= floor:
+                keys.append(key)
+                weights.append(data["rarity"])
+    return AliasTable(keys, weights) if keys else None
+
+
+def _content_signature() -> str:
+    """
+    Huella de los campos de datos que deciden qué se genera y en qué orden.
+
+    Las claves (y su orden), niveles, rareza y jefes fijan la población de
+    un piso; cambiar daño o precios no la altera y no cambia la huella.
+
+    Returns:
+        CRC32 en hexadecimal
+    """
+    fields = (
+        [(key, data["min_level"], data["max_level"], data.get("is_boss", False))
+         for key, data in MONSTER_DATA.items()],
+        [[(key, data.get("min_level"), data.get("rarity")) for key, data in source.items()]
+         for source in (WEAPON_DATA, ARMOR_DATA, POTION_DATA)],
+    )
+    return f"{zlib.crc32(repr(fields).encode('utf-8')):08x}"
+
+
+class SpawnTables:
+    """
+    Caché de tablas alias por categoría y piso.
+
+    Las categorías sin candidatos para un piso devuelven None (el
+    llamador aplica su fallback).
+
+    Attributes:
+        signature: Huella de los datos compilados (ver _content_signature)
+    """
+
+    def __init__(self, floors: int = MAX_DUNGEON_LEVEL) -> None:
+        """
+        Compila las tablas de los pisos 1..floors.
+
+        Args:
+            floors: Último piso a precompilar
+        """
+        self._floors = floors
+        self._builders: Dict[str, Callable[[int], Optional[AliasTable]]] = {
+            "monster": _monster_table,
+            "equipment": lambda floor: _rarity_table((WEAPON_DATA, ARMOR_DATA), floor),
+            "weapon": lambda floor: _rarity_table((WEAPON_DATA,), floor),
+            "armor": lambda floor: _rarity_table((ARMOR_DATA,), floor),
+        }
+        self._tables: Dict[str, Dict[int, Optional[AliasTable]]] = {}
+        self._potions: Optional[AliasTable] = None
+        self.signature = ""
+        self.compile()
+
+    def compile(self) -> None:
+        """(Re)compila todas las tablas de los pisos 1..floors."""
+        self._tables = {
+            category: {floor: builder(floor) for floor in range(1, self._floors + 1)}
+            for category, builder in self._builders.items()
+        }
+        self._potions = _rarity_table((POTION_DATA,), None)
+        self.signature = _content_signature()
+
+    def invalidate(self) -> None:
+        """Recompila tras cambiar los datos de monstruos u objetos."""
+        self.compile()
+
+    def table(self, category: str, floor: int) -> Optional[AliasTable]:
+        """
+        Obtiene la tabla de una categoría para un piso.
+
+        Args:
+            category: "monster", "equipment", "weapon" o "armor"
+            floor: Número de piso
+
+        Returns:
+            Tabla compilada, o None si no hay candidatos
+        """
+        tables = self._tables[category]
+        if floor not in tables:
+            tables[floor] = self._builders[category](floor)
+        return tables[floor]
+
+    @property
+    def potions(self) -> Optional[AliasTable]:
+        """Tabla de pociones (no depende del piso)."""
+        return self._potions
+
+    def monster_types(self, floor: int, count: int, rand: random.Random) -> List[str]:
+        """
+        Elige varios tipos de monstruo para un piso.
+
+        Args:
+            floor: Número de piso
+            count: Número de monstruos
+            rand: Flujo aleatorio (rng.generation)
+
+        Returns:
+            Tipos de monstruo (claves de MONSTER_DATA)
+        """
+        return self.table("monster", floor).sample_many(rand, count)
+
+    def equipment_keys(self, floor: int, count: int, rand: random.Random) -> List[str]:
+        """
+        Elige varias armas/armaduras para un piso.
+
+        Args:
+            floor: Número de piso
+            count: Número de objetos
+            rand: Flujo aleatorio (rng.loot)
+
+        Returns:
+            Claves de WEAPON_DATA/ARMOR_DATA (fallback: primera arma)
+        """
+        table = self.table("equipment", floor)
+        if table is None:
+            return [next(iter(WEAPON_DATA))] * count
+        return table.sample_many(rand, count)
+
+    def potion_keys(self, count: int, rand: random.Random) -> List[str]:
+        """
+        Elige varias pociones.
+
+        Args:
+            count: Número de pociones
+            rand: Flujo aleatorio (rng.loot)
+
+        Returns:
+            Claves de POTION_DATA
+        """
+        return self._potions.sample_many(rand, count)
+
+
+# Instancia global de las tablas de aparición
+spawn_tables = SpawnTables()
@@ -0,0 +1,374 @@
+"""
+Escenarios de estrés para medir cómo escala el juego con el contenido.
+
+Llena el piso actual (opcionalmente un mapa agrandado) con muchos
+monstruos, objetos, puertas y manchas de sangre, ejecuta N turnos y
+mide turno de enemigos, FOV, renderizado y guardado.
+
+La partida queda como estaba: `run_stress` juega los turnos con una copia
+desechable del jugador (los golpes no desgastan su equipo real), restaura
+al terminar el piso y los eventos, y ejecuta todo con copias privadas de
+los flujos de `rng`.
+
+Se usa desde la consola (`stress monsters=300 turns=50`) o sin ventana:
+    python main.py --stress "monsters=300 items=200 size=160x80 turns=100"
+    python main.py --stress "size=500x500 engine=caves turns=20"
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+import copy
+import os
+import random
+import tempfile
+import time
+
+from .telemetry import RollingHistogram
+
+if TYPE_CHECKING:
+    from ..entities.player import Player
+    from ..game import Game
+
+
+# Valores por defecto de un escenario de estrés
+STRESS_DEFAULTS: Dict[str, Any] = {
+    "monsters": 100,
+    "items": 100,
+    "doors": 30,
+    "blood": 200,
+    "turns": 50,
+    "floor": 5,
+    "size": None,      # (ancho, alto) o None para no cambiar el mapa
+    "engine": None,    # Motor de generación (None = el del piso, ver config)
+    "render": True,
+    "seed": 0,
+}
+
+
+def parse_stress_spec(args: List[str]) -> Dict[str, Any]:
+    """
+    Parsea argumentos "clave=valor" de un escenario de estrés.
+
+    Args:
+        args: Lista de tokens (ej: ["monsters=300", "size=160x80"])
+
+    Returns:
+        Diccionario de opciones completado con STRESS_DEFAULTS
+
+    Raises:
+        ValueError: Si una clave o valor no es válido
+    """
+    options = dict(STRESS_DEFAULTS)
+    for token in args:
+        if "=" not in token:
+            raise ValueError(f"Argumento inválido: '{token}' (usa clave=valor)")
+        key, value = token.split("=", 1)
+        key = key.strip().lower()
+        if key not in options:
+            raise ValueError(f"Opción desconocida: '{key}'")
+        if key == "size":
+            width, height = value.lower().split("x")
+            options["size"] = (int(width), int(height))
+        elif key == "engine":
+            options["engine"] = value.strip().lower() or None
+        elif key == "render":
+            options["render"] = value.lower() in ("1", "true", "si", "sí", "yes", "on")
+        else:
+            options[key] = int(value)
+    return options
+
+
+def _free_floor_cells(dungeon) -> List[Tuple[int, int]]:
+    """Devuelve las celdas transitables sin escaleras de una zona."""
+    blocked = {dungeon.stairs_up, dungeon.stairs_down}
+    return [
+        (x, y)
+        for x in range(dungeon.width)
+        for y in range(dungeon.height)
+        if dungeon.is_walkable(x, y) and (x, y) not in blocked
+    ]
+
+
+def populate_stress(game: 'Game', options: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Prepara el piso de estrés y lo puebla.
+
+    Sustituye el piso `floor` de la partida y mueve al jugador: llamar
+    desde `run_stress`, que usa una copia del jugador y lo deshace al
+    terminar. La colocación usa un
+    generador propio (semilla `seed`), pero generar el piso y crear
+    monstruos y objetos tira de `rng.generation` y `rng.loot`, así que
+    los flujos de la partida solo quedan intactos dentro de
+    `rng.isolated()` (como hace `run_stress`).
+
+    Args:
+        game: Instancia del juego (con jugador creado)
+        options: Opciones del escenario (ver STRESS_DEFAULTS)
+
+    Returns:
+        Cantidades realmente colocadas por tipo
+    """
+    from ..config import MAP_WIDTH, MAP_HEIGHT
+    from ..world.dungeon import Dungeon
+    from ..world.tile import Tile, TileType
+    from ..entities.monster import create_monster_for_floor
+    from ..items.item import create_item, _create_random_equipment, _create_random_potion
+
+    floor = options["floor"]
+    width, height = options["size"] or (MAP_WIDTH, MAP_HEIGHT)
+
+    dungeon = Dungeon(width, height, floor, engine=options["engine"])
+    start_pos = dungeon.generate()
+    game.dungeons[floor] = dungeon
+    game.dungeon = dungeon
+    game.player.x, game.player.y = start_pos
+    game.player.current_floor = floor
+    game.player.dungeon = dungeon
+
+    stress_rng = random.Random(options["seed"])
+    placed = {"monsters": 0, "items": 0, "doors": 0, "blood": 0}
+
+    # Puertas: primero en entradas de habitaciones (cuellos de botella reales)
+    candidates = [
+        (x, y, orientation)
+        for room in dungeon.rooms
+        for x, y, orientation in dungeon._find_door_candidates(room)
+        if dungeon.tiles[x][y].tile_type == TileType.FLOOR
+        and (x, y) not in (dungeon.stairs_up, dungeon.stairs_down, start_pos)
+    ]
+    stress_rng.shuffle(candidates)
+    for x, y, orientation in candidates[:options["doors"]]:
+        door = Tile(TileType.DOOR)
+        door.is_open = False
+        door.orientation = orientation
+        dungeon.set_tile(x, y, door)
+        placed["doors"] += 1
+
+    free_cells = [cell for cell in _free_floor_cells(dungeon) if cell != start_pos]
+    stress_rng.shuffle(free_cells)
+
+    # Monstruos (uno por celda)
+    for x, y in free_cells[:options["monsters"]]:
+        dungeon.entities.append(create_monster_for_floor(floor, x, y, dungeon))
+        placed["monsters"] += 1
+
+    # Objetos (mezcla de equipo, pociones y oro)
+    factories = (
+        lambda x, y: _create_random_equipment(floor, x, y),
+        lambda x, y: _create_random_potion(x, y),
+        lambda x, y: create_item("gold", x, y),
+    )
+    for _ in range(options["items"]):
+        x, y = stress_rng.choice(free_cells)
+        item = stress_rng.choice(factories)(x, y)
+        if item:
+            dungeon.items.append(item)
+            placed["items"] += 1
+
+    # Sangre
+    for x, y in free_cells[:options["blood"]]:
+        dungeon.decorations[(x, y)] = ("blood", stress_rng.choice([0, 90, 180, 270]))
+        placed["blood"] += 1
+
+    game._update_fov()
+    return placed
+
+
+def _snapshot_game(game: 'Game', floor: int) -> Dict[str, Any]:
+    """
+    Guarda lo que el escenario de estrés modifica de la partida.
+
+    El jugador no se copia campo a campo: se guarda el objeto y el
+    escenario juega con otro (ver _stand_in_player), así que su equipo,
+    durabilidad, inventario y vida no se tocan.
+    """
+    from .events import event_manager
+
+    return {
+        "player": game.player,
+        "floor_dungeon": game.dungeons.get(floor),
+        "dungeon": game.dungeon,
+        "state": game.state,
+        "turn_count": game.turn_count,
+        "events": copy.deepcopy(event_manager.to_dict()),
+        "messages": (list(game.message_log.messages), game.message_log.scroll_offset),
+    }
+
+
+def _stand_in_player(player: 'Player') -> 'Player':
+    """
+    Crea una copia desechable del jugador (stats, inventario y equipo).
+
+    Args:
+        player: Jugador de la partida
+
+    Returns:
+        Jugador nuevo con objetos propios
+    """
+    from ..entities.player import Player
+
+    return Player.from_dict(player.to_dict(), getattr(player, "dungeon", None))
+
+
+def _restore_game(game: 'Game', floor: int, snapshot: Dict[str, Any]) -> None:
+    """Deshace los cambios del escenario de estrés (ver _snapshot_game)."""
+    from .events import event_manager
+    from .music import music_manager
+
+    if snapshot["floor_dungeon"] is None:
+        game.dungeons.pop(floor, None)
+    else:
+        game.dungeons[floor] = snapshot["floor_dungeon"]
+    game.dungeon = snapshot["dungeon"]
+    game.player = snapshot["player"]
+    game.state = snapshot["state"]
+    game.turn_count = snapshot["turn_count"]
+    event_manager.from_dict(snapshot["events"])
+    # Los golpes de los turnos de estrés no se quedan en el log
+    messages, game.message_log.scroll_offset = snapshot["messages"]
+    game.message_log.messages.clear()
+    game.message_log.messages.extend(messages)
+    game.animation_manager.clear()
+    # Cortar los efectos del escenario (equipo roto de la copia, etc.)
+    music_manager.stop_all_sounds()
+    if game.dungeon is not None:
+        game._update_fov()
+
+
+def run_stress(game: 'Game', options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Ejecuta un escenario de estrés sobre una partida en curso.
+
+    Una copia desechable del jugador espera en su sitio con vida
+    prácticamente infinita para que la medición no se corte por su
+    muerte. Al terminar (también si falla) vuelven el jugador original,
+    el piso y los eventos, y los flujos de `rng` no se consumen: un
+    autoguardado posterior no ve nada del escenario.
+
+    Args:
+        game: Instancia del juego (con jugador creado)
+        options: Opciones del escenario (ver STRESS_DEFAULTS)
+
+    Returns:
+        Resultados: cantidades colocadas, estadísticas por fase (segundos)
+        y tiempo/tamaño del guardado
+    """
+    from ..config import GameState
+    from .events import event_manager
+    from .rng import rng, STREAM_NAMES
+    from .save_manager import save_manager
+
+    floor = options["floor"]
+    snapshot = _snapshot_game(game, floor)
+    try:
+        with rng.isolated(STREAM_NAMES):
+            game.player = _stand_in_player(game.player)
+            placed = populate_stress(game, options)
+            phases = {
+                name: RollingHistogram(size=max(1, options["turns"]))
+                for name in ("enemies", "fov", "events", "render", "total")
+            }
+
+            game.state = GameState.PLAYING
+            player = game.player
+            player.fighter.max_hp = 10 ** 9
+            player.fighter.hp = player.fighter.max_hp
+
+            for _ in range(options["turns"]):
+                turn_start = time.perf_counter()
+
+                start = time.perf_counter()
+                game._enemy_turn()
+                phases["enemies"].add(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                game._update_fov()
+                phases["fov"].add(time.perf_counter() - start)
+
+                player.update()
+                start = time.perf_counter()
+                event_manager.check_and_trigger_events(player, game.dungeon)
+                phases["events"].add(time.perf_counter() - start)
+
+                if options["render"]:
+                    start = time.perf_counter()
+                    game._render_frame()
+                    phases["render"].add(time.perf_counter() - start)
+
+                phases["total"].add(time.perf_counter() - turn_start)
+
+                # Mantener vivo al jugador y descartar animaciones pendientes
+                player.fighter.hp = player.fighter.max_hp
+                game.animation_manager.clear()
+
+            # Guardado en un directorio temporal (no toca los slots reales)
+            with tempfile.TemporaryDirectory(prefix="stress_") as save_dir:
+                previous_dir = save_manager.save_dir
+                save_manager.save_dir = save_dir
+                try:
+                    start = time.perf_counter()
+                    save_manager.save_game(1, player, game.dungeon, game.dungeons)
+                    save_time = time.perf_counter() - start
+                    save_path = save_manager.get_save_file_path(1)
+                    save_size = os.path.getsize(save_path) if os.path.exists(save_path) else 0
+                finally:
+                    save_manager.save_dir = previous_dir
+                    save_manager.refresh_slots()
+            size = (game.dungeon.width, game.dungeon.height)
+    finally:
+        _restore_game(game, floor, snapshot)
+
+    return {
+        "placed": placed,
+        "size": size,
+        "turns": options["turns"],
+        "phases": {name: hist.snapshot() for name, hist in phases.items() if hist.total_count},
+        "save_time": save_time,
+        "save_size": save_size,
+    }
+
+
+def format_stress_report(result: Dict[str, Any]) -> List[str]:
+    """
+    Formatea los resultados de un escenario de estrés.
+
+    Args:
+        result: Resultado de run_stress()
+
+    Returns:
+        Líneas legibles (tiempos en milisegundos)
+    """
+    placed = result["placed"]
+    width, height = result["size"]
+    lines = [
+        f"[STRESS] {width}x{height}, {placed['monsters']} monstruos, {placed['items']} items, "
+        f"{placed['doors']} puertas, {placed['blood']} sangre, {result['turns']} turnos",
+        f"  {'fase':8} {'media':>8} {'p95':>8} {'max':>8}",
+    ]
+    for name, stats in result["phases"].items():
+        lines.append(
+            f"  {name:8} {stats['mean'] * 1000:>6.2f}ms {stats['p95'] * 1000:>6.2f}ms {stats['max'] * 1000:>6.2f}ms"
+        )
+    lines.append(f"  guardado {result['save_time'] * 1000:.1f}ms ({result['save_size'] / 1024:.0f} KiB)")
+    return lines
+
+
+def run_headless(options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Crea una partida nueva sin ventana y ejecuta un escenario de estrés.
+
+    Args:
+        options: Opciones del escenario (ver STRESS_DEFAULTS)
+
+    Returns:
+        Resultado de run_stress()
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    from ..game import Game
+    from .rng import rng
+
+    rng.reseed(options["seed"])
+    game = Game()
+    game._new_game()
+    return run_stress(game, options)
@@ -0,0 +1,296 @@
+"""
+Telemetría de tiempos por turno y por frame.
+
+Expone temporizadores y contadores con nombre. Cada temporizador guarda
+sus últimas muestras en un histograma circular para calcular percentiles
+(p50/p95/p99). Los resultados se pueden exportar a CSV o servir en texto
+plano desde un endpoint HTTP local.
+
+Desactivada (por defecto), `timer()` devuelve un context manager vacío
+compartido y `count()` retorna de inmediato: el coste es una llamada.
+
+Uso:
+    with telemetry.timer("turn.enemy"):
+        ...
+    telemetry.count("save.games")
+"""
+from __future__ import annotations
+from typing import Dict, List, Optional, Tuple
+from collections import deque
+import csv
+import threading
+import time
+
+
+# Muestras guardadas por temporizador
+HISTOGRAM_SIZE = 1024
+
+# Puerto por defecto del endpoint de métricas
+DEFAULT_METRICS_PORT = 9108
+
+
+class RollingHistogram:
+    """
+    Histograma circular de duraciones (en segundos).
+
+    Attributes:
+        samples: Últimas muestras
+        total_count: Muestras registradas desde el último reset
+        total_time: Suma de todas las muestras desde el último reset
+    """
+
+    def __init__(self, size: int = HISTOGRAM_SIZE) -> None:
+        """
+        Inicializa el histograma.
+
+        Args:
+            size: Número máximo de muestras retenidas
+        """
+        self.samples: deque[float] = deque(maxlen=size)
+        self.total_count = 0
+        self.total_time = 0.0
+
+    def add(self, value: float) -> None:
+        """Añade una muestra."""
+        self.samples.append(value)
+        self.total_count += 1
+        self.total_time += value
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Calcula estadísticas sobre las muestras retenidas.
+
+        Returns:
+            Diccionario con count, mean, p50, p95, p99 y max (en segundos)
+        """
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+
+        def percentile(p: float) -> float:
+            index = min(len(ordered) - 1, int(round(p * (len(ordered) - 1))))
+            return ordered[index]
+
+        return {
+            "count": self.total_count,
+            "mean": sum(ordered) / len(ordered),
+            "p50": percentile(0.50),
+            "p95": percentile(0.95),
+            "p99": percentile(0.99),
+            "max": ordered[-1],
+        }
+
+
+class _NullTimer:
+    """Context manager vacío usado cuando la telemetría está desactivada."""
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *_exc) -> None:
+        return None
+
+
+class _Timer:
+    """Context manager que mide un bloque y lo registra al salir."""
+
+    __slots__ = ("_telemetry", "_name", "_start")
+
+    def __init__(self, telemetry: Telemetry, name: str) -> None:
+        self._telemetry = telemetry
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *_exc) -> None:
+        self._telemetry.record(self._name, time.perf_counter() - self._start)
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Telemetry:
+    """
+    Registro central de temporizadores y contadores.
+
+    Attributes:
+        enabled: Si False, no se registra nada
+        timers: Histogramas por nombre de temporizador
+        counters: Valores por nombre de contador
+    """
+
+    def __init__(self) -> None:
+        """Inicializa la telemetría (desactivada)."""
+        self.enabled = False
+        self.timers: Dict[str, RollingHistogram] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self._server_thread: Optional[threading.Thread] = None
+
+    def timer(self, name: str):
+        """
+        Devuelve un context manager que mide el bloque que envuelve.
+
+        Args:
+            name: Nombre del temporizador (ej: "render.map")
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def record(self, name: str, seconds: float) -> None:
+        """
+        Registra una duración medida externamente.
+
+        Args:
+            name: Nombre del temporizador
+            seconds: Duración en segundos
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.timers.get(name)
+            if histogram is None:
+                histogram = self.timers[name] = RollingHistogram()
+            histogram.add(seconds)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """
+        Incrementa un contador.
+
+        Args:
+            name: Nombre del contador
+            amount: Cantidad a sumar
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def reset(self) -> None:
+        """Borra todas las muestras y contadores."""
+        with self._lock:
+            self.timers.clear()
+            self.counters.clear()
+
+    def snapshot(self) -> Tuple[Dict[str, Dict[str, float]], Dict[str, int]]:
+        """
+        Copia consistente de las métricas actuales.
+
+        Returns:
+            Tupla (estadísticas por temporizador, contadores)
+        """
+        with self._lock:
+            timers = {name: hist.snapshot() for name, hist in sorted(self.timers.items())}
+            counters = dict(sorted(self.counters.items()))
+        return timers, counters
+
+    def summary_lines(self) -> List[str]:
+        """
+        Resumen legible de los temporizadores y contadores.
+
+        Returns:
+            Lista de líneas (tiempos en milisegundos)
+        """
+        timers, counters = self.snapshot()
+        lines = [f"{'métrica':24} {'n':>7} {'media':>8} {'p95':>8} {'max':>8}"]
+        for name, stats in timers.items():
+            lines.append(
+                f"{name:24} {int(stats['count']):>7} {stats['mean'] * 1000:>6.2f}ms "
+                f"{stats['p95'] * 1000:>6.2f}ms {stats['max'] * 1000:>6.2f}ms"
+            )
+        for name, value in counters.items():
+            lines.append(f"{name:24} {value:>7}")
+        return lines
+
+    def export_csv(self, path: str) -> None:
+        """
+        Exporta las métricas a un archivo CSV (tiempos en milisegundos).
+
+        Args:
+            path: Ruta del archivo de salida
+        """
+        timers, counters = self.snapshot()
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["metric", "kind", "count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"])
+            for name, stats in timers.items():
+                writer.writerow([
+                    name, "timer", int(stats["count"]),
+                    *(f"{stats[key] * 1000:.4f}" for key in ("mean", "p50", "p95", "p99", "max"))
+                ])
+            for name, value in counters.items():
+                writer.writerow([name, "counter", value, "", "", "", "", ""])
+
+    def render_text(self) -> str:
+        """
+        Formatea las métricas en texto plano, una por línea.
+
+        Returns:
+            Texto con líneas "nombre{stat="p95"} valor" (segundos)
+        """
+        timers, counters = self.snapshot()
+        lines: List[str] = []
+        for name, stats in timers.items():
+            metric = name.replace(".", "_")
+            lines.append(f"{metric}_count {int(stats['count'])}")
+            for key in ("mean", "p50", "p95", "p99", "max"):
+                lines.append(f'{metric}_seconds{{stat="{key}"}} {stats[key]:.6f}')
+        for name, value in counters.items():
+            lines.append(f"{name.replace('.', '_')}_total {value}")
+        return "\n".join(lines) + "\n"
+
+    def start_server(self, port: int = DEFAULT_METRICS_PORT) -> int:
+        """
+        Sirve las métricas en http://127.0.0.1:<port>/metrics (texto plano).
+
+        Args:
+            port: Puerto local (0 = elegir uno libre)
+
+        Returns:
+            Puerto en el que escucha el servidor
+        """
+        if self._server is not None:
+            return self._server.server_address[1]
+
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        telemetry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 (nombre impuesto por http.server)
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = telemetry.render_text().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_args) -> None:
+                return
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), MetricsHandler)
+        self._server_thread = threading.Thread(
+            target=self._server.serve_forever, name="telemetry-http", daemon=True
+        )
+        self._server_thread.start()
+        return self._server.server_address[1]
+
+    def stop_server(self) -> None:
+        """Detiene el endpoint de métricas si está activo."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        self._server_thread = None
+
+
+# Instancia global de telemetría
+telemetry = Telemetry()
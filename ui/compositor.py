@@ -0,0 +1,243 @@
+"""
+Compositor de capas cacheadas para el renderer.
+
+El juego es por turnos: entre dos pulsaciones casi nada cambia, pero el
+renderer redibujaba los 3.040 tiles del mapa 60 veces por segundo. Cada
+capa guarda su superficie junto con la clave de las entradas con las que
+se dibujó (FOV, estado de las puertas, objetos visibles...) y solo se
+vuelve a dibujar cuando la clave cambia.
+
+Capas del renderer:
+- "terrain": tiles explorados y visibles (FOV, puertas, `map_version`)
+- "scene": terrain + objetos + decoraciones estáticas (sangre, mobiliario)
+- "message_log": panel del log de mensajes
+
+Lo animado (hogueras, relámpagos, actores con offset de animación,
+números de daño) y los overlays se siguen dibujando en cada frame encima.
+
+`DirtyRegions` decide qué partes de la pantalla hay que enviar al
+display: las capas redibujadas y los grupos de blits (actores,
+animaciones...) que cambiaron respecto al frame anterior. Si cambió la
+mayor parte de la pantalla, se hace un flip completo.
+"""
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from contextlib import contextmanager
+import pygame
+
+from ..systems.telemetry import telemetry
+
+
+class Layer:
+    """
+    Una capa cacheada.
+
+    Attributes:
+        name: Nombre de la capa
+        surface: Superficie con el último dibujo
+        key: Clave de las entradas con las que se dibujó (None = inválida)
+        rebuilds: Veces que se ha redibujado
+    """
+
+    __slots__ = ("name", "surface", "key", "rebuilds")
+
+    def __init__(self, name: str, size: Tuple[int, int], alpha: bool = False) -> None:
+        """
+        Args:
+            name: Nombre de la capa
+            size: Tamaño en píxeles
+            alpha: Si la superficie necesita transparencia por píxel
+        """
+        self.name = name
+        self.surface = pygame.Surface(size, pygame.SRCALPHA) if alpha else pygame.Surface(size)
+        self.key: Any = None
+        self.rebuilds: int = 0
+
+
+class Compositor:
+    """
+    Conjunto de capas cacheadas por clave.
+
+    Attributes:
+        layers: Capas creadas {nombre: Layer}
+    """
+
+    def __init__(self) -> None:
+        """Inicializa el compositor sin capas."""
+        self.layers: Dict[str, Layer] = {}
+        self._changed: Set[str] = set()
+
+    def layer(
+        self,
+        name: str,
+        size: Tuple[int, int],
+        key: Any,
+        draw: Callable[[pygame.Surface], None],
+        alpha: bool = False,
+    ) -> pygame.Surface:
+        """
+        Devuelve la superficie de una capa, redibujándola si cambió su clave.
+
+        Args:
+            name: Nombre de la capa
+            size: Tamaño en píxeles
+            key: Entradas de la capa (se compara con == contra la anterior)
+            draw: Función que dibuja la capa sobre la superficie (ya limpia)
+            alpha: Si la superficie necesita transparencia por píxel
+
+        Returns:
+            Superficie actualizada de la capa
+        """
+        layer = self.layers.get(name)
+        if layer is None or layer.surface.get_size() != size:
+            layer = self.layers[name] = Layer(name, size, alpha)
+        elif layer.key == key:
+            return layer.surface
+
+        layer.surface.fill((0, 0, 0, 0))
+        draw(layer.surface)
+        layer.key = key
+        layer.rebuilds += 1
+        self._changed.add(name)
+        telemetry.count(f"render.layer.{name}")
+        return layer.surface
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """
+        Fuerza el redibujado de una capa (o de todas).
+
+        Args:
+            name: Nombre de la capa, o None para todas
+        """
+        for layer_name, layer in self.layers.items():
+            if name is None or layer_name == name:
+                layer.key = None
+
+    def take_changed(self) -> Set[str]:
+        """
+        Devuelve (y olvida) las capas redibujadas desde la última llamada.
+
+        Returns:
+            Nombres de las capas redibujadas
+        """
+        changed, self._changed = self._changed, set()
+        return changed
+
+    def status_lines(self) -> List[str]:
+        """
+        Describe las capas y cuántas veces se han redibujado.
+
+        Returns:
+            Líneas legibles
+        """
+        if not self.layers:
+            return ["Compositor: sin capas"]
+        return [
+            f"  {layer.name}: {layer.surface.get_width()}x{layer.surface.get_height()}, "
+            f"{layer.rebuilds} redibujados"
+            for layer in self.layers.values()
+        ]
+
+
+# Fracción de la pantalla a partir de la cual se hace un flip completo
+FULL_FLIP_RATIO = 0.5
+
+
+class DirtyRegions:
+    """
+    Rectángulos de pantalla que cambiaron desde el último frame presentado.
+
+    Las zonas estáticas se marcan con `mark()` cuando se redibuja su capa.
+    Lo que se dibuja cada frame se agrupa con `group()`: cada blit queda
+    anotado (superficie, rectángulo, alpha) y, si la lista difiere de la
+    del frame anterior, se marcan los rectángulos viejos (para borrar) y
+    los nuevos.
+
+    Attributes:
+        full_flips: Frames presentados con flip completo
+        partial_updates: Frames presentados por rectángulos
+        skipped: Frames sin cambios (no se envía nada al display)
+    """
+
+    def __init__(self, size: Tuple[int, int], full_ratio: float = FULL_FLIP_RATIO) -> None:
+        """
+        Args:
+            size: Tamaño de la pantalla en píxeles
+            full_ratio: Fracción de área sucia que fuerza un flip completo
+        """
+        self._screen_rect = pygame.Rect((0, 0), size)
+        self._full_area = size[0] * size[1] * full_ratio
+        self._rects: List[pygame.Rect] = []
+        self._full = True
+        self._groups: Dict[str, List[Tuple[pygame.Surface, Tuple[int, int, int, int], Optional[int]]]] = {}
+        self._current: Optional[List[Tuple[pygame.Surface, Tuple[int, int, int, int], Optional[int]]]] = None
+        self.full_flips = 0
+        self.partial_updates = 0
+        self.skipped = 0
+
+    def mark(self, rect: Any) -> None:
+        """
+        Marca un rectángulo como cambiado.
+
+        Args:
+            rect: Rect o tupla (x, y, ancho, alto)
+        """
+        self._rects.append(pygame.Rect(rect))
+
+    def mark_full(self) -> None:
+        """Fuerza un flip completo en el próximo present()."""
+        self._full = True
+
+    @contextmanager
+    def group(self, name: str) -> Iterator[None]:
+        """
+        Agrupa los blits anotados con note() bajo un nombre.
+
+        Args:
+            name: Nombre del grupo (p. ej. "actors")
+        """
+        self._current = []
+        try:
+            yield
+        finally:
+            current, self._current = self._current, None
+            previous = self._groups.get(name, [])
+            if current != previous:
+                for _surface, rect, _alpha in previous + current:
+                    self._rects.append(pygame.Rect(rect))
+            self._groups[name] = current
+
+    @property
+    def collecting(self) -> bool:
+        """True dentro de group() (note() anota los blits)."""
+        return self._current is not None
+
+    def note(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        """
+        Anota un blit hecho en pantalla (solo dentro de group()).
+
+        Args:
+            surface: Superficie copiada (se guarda la referencia, así una
+                superficie nueva nunca se confunde con la del frame anterior)
+            rect: Rectángulo devuelto por Surface.blit
+        """
+        if self._current is not None and rect.width and rect.height:
+            self._current.append((surface, tuple(rect), surface.get_alpha()))
+
+    def present(self) -> None:
+        """Envía al display lo que cambió (rectángulos o flip completo)."""
+        rects = [rect.clip(self._screen_rect) for rect in self._rects]
+        rects = [rect for rect in rects if rect.width and rect.height]
+        self._rects = []
+        if self._full or sum(rect.width * rect.height for rect in rects) >= self._full_area:
+            self._full = False
+            self.full_flips += 1
+            telemetry.count("render.present.full")
+            pygame.display.flip()
+        elif rects:
+            self.partial_updates += 1
+            telemetry.count("render.present.partial")
+            pygame.display.update(rects)
+        else:
+            self.skipped += 1
+            telemetry.count("render.present.skipped")
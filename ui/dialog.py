@@ -1,18 +1,29 @@
 """
 Sistema de UI para diálogos y textos.
 Muestra diálogos interactivos y textos simples en pantalla.
+
+Mientras un diálogo está abierto se redibuja en cada frame. El texto
+envuelto y sus líneas ya renderizadas se cachean por (texto, ancho,
+color) en `_layout`, así un monólogo largo cuesta lo mismo que uno corto.
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional, List
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, List, Tuple
 import pygame
 
-from ..config import WINDOW_WIDTH, WINDOW_HEIGHT, COLORS, FONT_NAME, FONT_SIZE
+from ..config import WINDOW_WIDTH, WINDOW_HEIGHT, COLORS, FONT_SIZE
 from ..systems.text import DialogNode, TextContent
+from .fonts import fonts, text_cache
+from ..systems.telemetry import telemetry
 
 if TYPE_CHECKING:
     from ..entities.player import Player
 
 
+# Textos envueltos (líneas renderizadas) retenidos en el LRU de disposiciones
+LAYOUT_CACHE_SIZE = 32
+
+
 class DialogRenderer:
     """
     Renderizador de diálogos y textos.
@@ -24,6 +35,8 @@ class DialogRenderer:
         """Inicializa el renderizador de diálogos."""
         self.font: Optional[pygame.font.Font] = None
         self.font_bold: Optional[pygame.font.Font] = None
+        self._overlay: Optional[pygame.Surface] = None
+        self._layout_cache: OrderedDict = OrderedDict()
         self._initialized = False
     
     def _ensure_initialized(self):
@@ -35,18 +48,8 @@ class DialogRenderer:
         if not pygame.get_init():
             pygame.init()
         
-        try:
-            self.font = pygame.font.SysFont(FONT_NAME, FONT_SIZE)
-            self.font_bold = pygame.font.SysFont(FONT_NAME, FONT_SIZE, bold=True)
-        except:
-            try:
-                self.font = pygame.font.Font(None, FONT_SIZE)
-                self.font_bold = pygame.font.Font(None, FONT_SIZE)
-            except:
-                # Fallback absoluto
-                pygame.font.init()
-                self.font = pygame.font.Font(None, FONT_SIZE)
-                self.font_bold = pygame.font.Font(None, FONT_SIZE)
+        self.font = fonts.get(FONT_SIZE)
+        self.font_bold = fonts.get(FONT_SIZE, bold=True)
         
         self._initialized = True
     
@@ -72,10 +75,7 @@ class DialogRenderer:
         dialog_y = WINDOW_HEIGHT - dialog_height - 20  # 20 píxeles desde abajo
         
         # Fondo semitransparente oscuro
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(COLORS["black"])
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._get_overlay(), (0, 0))
         
         # Cuadro de diálogo
         dialog_rect = pygame.Rect(dialog_x, dialog_y, dialog_width, dialog_height)
@@ -90,14 +90,12 @@ class DialogRenderer:
         
         # Nombre del hablante (si existe)
         if node.speaker:
-            speaker_surface = self.font_bold.render(f"{node.speaker}:", True, COLORS["white"])
+            speaker_surface = text_cache.render(f"{node.speaker}:", self.font_bold, COLORS["white"])
             screen.blit(speaker_surface, (text_x, text_y))
             text_y += FONT_SIZE + 10
         
         # Texto del diálogo (puede ser multilínea)
-        dialog_lines = self._wrap_text(node.text, max_text_width)
-        for line in dialog_lines:
-            text_surface = self.font.render(line, True, COLORS["message"])
+        for text_surface in self._layout(node.text, max_text_width, COLORS["message"]):
             screen.blit(text_surface, (text_x, text_y))
             text_y += FONT_SIZE + 5
         
@@ -117,7 +115,7 @@ class DialogRenderer:
                     prefix = "> " if orig_idx == selected_option else "  "
                     option_line = f"{prefix}{option_text}"
                     
-                    option_surface = self.font.render(option_line, True, option_color)
+                    option_surface = text_cache.render(option_line, self.font, option_color)
                     screen.blit(option_surface, (text_x + 10, text_y))
                     text_y += FONT_SIZE + 5
         
@@ -125,7 +123,7 @@ class DialogRenderer:
         if node.options:
             instruction_y = dialog_y + dialog_height - 30
             instruction = "↑↓ para navegar, ESPACIO para seleccionar, ESC para cerrar"
-            instruction_surface = self.font.render(instruction, True, COLORS["dark_gray"])
+            instruction_surface = text_cache.render(instruction, self.font, COLORS["dark_gray"])
             screen.blit(instruction_surface, (text_x, instruction_y))
     
     def render_simple_text(
@@ -148,10 +146,7 @@ class DialogRenderer:
         dialog_y = WINDOW_HEIGHT - dialog_height - 20  # 20 píxeles desde abajo
         
         # Fondo semitransparente oscuro
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(COLORS["black"])
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._get_overlay(), (0, 0))
         
         # Cuadro de texto
         dialog_rect = pygame.Rect(dialog_x, dialog_y, dialog_width, dialog_height)
@@ -166,24 +161,56 @@ class DialogRenderer:
         
         # Título (si existe)
         if content.title:
-            title_surface = self.font_bold.render(content.title, True, COLORS["white"])
+            title_surface = text_cache.render(content.title, self.font_bold, COLORS["white"])
             screen.blit(title_surface, (text_x, text_y))
             text_y += FONT_SIZE + 15
         
         # Líneas de texto
         for line in content.lines:
-            wrapped_lines = self._wrap_text(line, max_text_width)
-            for wrapped_line in wrapped_lines:
-                text_surface = self.font.render(wrapped_line, True, COLORS["message"])
+            for text_surface in self._layout(line, max_text_width, COLORS["message"]):
                 screen.blit(text_surface, (text_x, text_y))
                 text_y += FONT_SIZE + 5
         
         # Instrucciones
         instruction_y = dialog_y + dialog_height - 30
         instruction = "Presiona ESPACIO o ESC para continuar"
-        instruction_surface = self.font.render(instruction, True, COLORS["dark_gray"])
+        instruction_surface = text_cache.render(instruction, self.font, COLORS["dark_gray"])
         screen.blit(instruction_surface, (text_x, instruction_y))
     
+    def _get_overlay(self) -> pygame.Surface:
+        """Obtiene el fondo oscuro semitransparente (creado una sola vez)."""
+        if self._overlay is None:
+            self._overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+            self._overlay.set_alpha(180)
+            self._overlay.fill(COLORS["black"])
+        return self._overlay
+    
+    def _layout(self, text: str, max_width: int, color: Tuple[int, int, int]) -> Tuple[pygame.Surface, ...]:
+        """
+        Envuelve y renderiza un texto, cacheado (LRU) por (texto, ancho, color).
+        
+        Args:
+            text: Texto a mostrar
+            max_width: Ancho máximo en píxeles
+            color: Color del texto
+            
+        Returns:
+            Superficies de las líneas, en orden (no modificarlas: son compartidas)
+        """
+        key = (text, max_width, tuple(color))
+        lines = self._layout_cache.get(key)
+        if lines is not None:
+            self._layout_cache.move_to_end(key)
+            telemetry.count("dialog.layout.hits")
+            return lines
+        
+        lines = tuple(self.font.render(line, True, color) for line in self._wrap_text(text, max_width))
+        self._layout_cache[key] = lines
+        if len(self._layout_cache) > LAYOUT_CACHE_SIZE:
+            self._layout_cache.popitem(last=False)
+        telemetry.count("dialog.layout.misses")
+        return lines
+    
     def _wrap_text(self, text: str, max_width: int) -> List[str]:
         """
         Envuelve texto en múltiples líneas según el ancho máximo.
@@ -200,6 +227,7 @@ class DialogRenderer:
         # Primero dividir por saltos de línea explícitos
         paragraphs = text.split('\n')
         all_lines = []
+        space_width = self.font.size(' ')[0]
         
         for paragraph in paragraphs:
             if not paragraph.strip():
@@ -213,9 +241,8 @@ class DialogRenderer:
             current_width = 0
             
             for word in words:
-                word_surface = self.font.render(word, True, COLORS["message"])
-                word_width = word_surface.get_width()
-                space_width = self.font.size(' ')[0]
+                # Medir sin renderizar (mismo ancho que la superficie)
+                word_width = self.font.size(word)[0]
                 
                 if current_width + word_width + (len(current_line) * space_width) <= max_width:
                     current_line.append(word)
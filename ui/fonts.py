@@ -0,0 +1,148 @@
+"""
+Registro central de fuentes y cache de superficies de texto.
+
+Crear una fuente con SysFont busca el archivo en el sistema y cuesta
+milisegundos; el renderer lo hacía dentro del dibujado de cada frame
+(inventario, números de daño, prompts...). `fonts.get()` crea cada
+(nombre, tamaño, negrita) una sola vez.
+
+Encima, `text_cache.render()` guarda las superficies de texto ya
+renderizadas en un LRU por (texto, fuente, color): las líneas del log,
+el HUD y las etiquetas de los menús casi nunca cambian entre frames.
+Las superficies devueltas son compartidas: no se deben modificar (para
+alpha o decoraciones, trabajar sobre una copia o con
+`sprite_manager.get_variant`).
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+import pygame
+
+from ..config import FONT_NAME, FONT_SIZE
+from ..systems.telemetry import telemetry
+
+
+# Superficies de texto retenidas en el LRU
+TEXT_CACHE_SIZE = 512
+
+
+class FontRegistry:
+    """
+    Fuentes creadas una sola vez por (nombre, tamaño, negrita).
+    """
+
+    def __init__(self) -> None:
+        """Inicializa el registro vacío."""
+        self._fonts: Dict[Tuple[str, int, bool], pygame.font.Font] = {}
+
+    def get(self, size: int = FONT_SIZE, bold: bool = False, name: str = FONT_NAME) -> pygame.font.Font:
+        """
+        Obtiene una fuente, creándola la primera vez.
+
+        Si la fuente del sistema no está disponible se usa la fuente por
+        defecto de pygame con el mismo tamaño.
+
+        Args:
+            size: Tamaño en puntos
+            bold: Si es negrita
+            name: Nombre de la fuente del sistema
+
+        Returns:
+            Fuente compartida
+        """
+        key = (name, size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            try:
+                font = pygame.font.SysFont(name, size, bold=bold)
+            except Exception:
+                font = pygame.font.Font(None, size)
+            self._fonts[key] = font
+        return font
+
+    def clear(self) -> None:
+        """Olvida las fuentes creadas (y las superficies que dependen de ellas)."""
+        self._fonts.clear()
+        text_cache.clear()
+
+
+class TextCache:
+    """
+    LRU de superficies de texto renderizadas.
+
+    Attributes:
+        hits: Textos servidos desde el cache
+        misses: Textos que hubo que renderizar
+    """
+
+    def __init__(self, max_size: int = TEXT_CACHE_SIZE) -> None:
+        """
+        Args:
+            max_size: Número máximo de superficies retenidas
+        """
+        self.max_size = max_size
+        self._cache: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(
+        self,
+        text: str,
+        font: pygame.font.Font,
+        color: Any,
+        antialias: bool = True,
+    ) -> pygame.Surface:
+        """
+        Renderiza un texto, o lo devuelve del cache.
+
+        Args:
+            text: Texto a renderizar
+            font: Fuente (preferiblemente de `fonts.get`, así es estable)
+            color: Color RGB o RGBA
+            antialias: Si se suaviza el texto
+
+        Returns:
+            Superficie del texto (no modificarla: es compartida)
+        """
+        key = (text, font, tuple(color), antialias)
+        surface = self._cache.get(key)
+        if surface is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            telemetry.count("text.cache.hits")
+            return surface
+
+        surface = font.render(text, antialias, color)
+        self._cache[key] = surface
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        self.misses += 1
+        telemetry.count("text.cache.misses")
+        return surface
+
+    def clear(self) -> None:
+        """Vacía el cache."""
+        self._cache.clear()
+
+    def status_lines(self) -> List[str]:
+        """
+        Describe el uso del cache.
+
+        Returns:
+            Líneas legibles
+        """
+        total = self.hits + self.misses
+        ratio = f"{100 * self.hits / total:.1f}%" if total else "-"
+        return [
+            f"Texto: {len(self._cache)}/{self.max_size} superficies, "
+            f"aciertos {self.hits}, fallos {self.misses} ({ratio})"
+        ]
+
+
+# Instancia global del registro de fuentes
+fonts = FontRegistry()
+
+# Instancia global del cache de superficies de texto
+text_cache = TextCache()
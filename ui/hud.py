@@ -2,10 +2,12 @@
 Sistema de HUD (Heads-Up Display) del juego.
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 import pygame
 
 from ..config import COLORS, TILE_SIZE, FONT_SIZE, WINDOW_WIDTH
+from .fonts import text_cache
+from ..systems.telemetry import telemetry
 
 if TYPE_CHECKING:
     from ..entities.player import Player
@@ -20,6 +22,9 @@ class HUD:
       [HP barra  ] [XP barra   ]
     
     El indicador de piso se renderiza aparte en la esquina superior derecha.
+    
+    Las secciones se redibujan solo cuando cambian sus valores (HP, XP,
+    oro, equipo...), que en un juego por turnos es casi nunca.
     """
     
     def __init__(self, font: pygame.font.Font, x: int, y: int, width: int, height: int) -> None:
@@ -38,52 +43,105 @@ class HUD:
         self.y = y
         self.width = width
         self.height = height
+        
+        # Superficie cacheada del HUD y lo que muestra cada sección
+        self._surface: Optional[pygame.Surface] = None
+        self._signatures: Tuple[Tuple, ...] = ()
+        self._section_x: List[int] = [0, 0, 0]
+        
+        # Fondo del indicador de piso (por tamaño)
+        self._floor_bg: Optional[pygame.Surface] = None
     
-    def render(self, surface: pygame.Surface, player: Player) -> None:
+    def render(self, surface: pygame.Surface, player: Player) -> bool:
         """
         Renderiza el HUD.
         
+        El HUD se dibuja en una superficie propia que solo se actualiza
+        cuando cambian los valores mostrados (ver _section_signatures). Si
+        cambia una sección se redibujan ella y las de su derecha (su
+        posición depende del ancho de las anteriores).
+        
         Args:
             surface: Superficie de Pygame
             player: El jugador
+            
+        Returns:
+            True si el contenido del HUD cambió respecto al frame anterior
         """
-        # Fondo del HUD
-        pygame.draw.rect(
-            surface,
-            COLORS["darker_gray"],
-            (self.x, self.y, self.width, self.height)
-        )
+        signatures = self._section_signatures(player)
+        changed = signatures != self._signatures
+        if changed:
+            self._redraw(player, signatures)
+        surface.blit(self._surface, (self.x, self.y))
+        return changed
+    
+    def invalidate(self) -> None:
+        """Fuerza el redibujado completo del HUD en el próximo render()."""
+        self._surface = None
+        self._signatures = ()
+    
+    def _section_signatures(self, player: Player) -> Tuple[Tuple, ...]:
+        """
+        Calcula los valores de los que depende cada sección del HUD.
         
-        # Borde
-        pygame.draw.rect(
-            surface,
-            COLORS["gray"],
-            (self.x, self.y, self.width, self.height),
-            1
+        Returns:
+            Firmas (HP, Nivel + XP, stats de combate) en orden de dibujo
+        """
+        fighter = player.fighter
+        return (
+            (fighter.hp, fighter.max_hp),
+            (fighter.level, player.current_level_xp, player.xp_to_next_level),
+            # Los textos incluyen bonus y durabilidad del equipo
+            (self._format_attack_text(player), self._format_defense_text(player),
+             player.gold, player.has_amulet),
         )
+    
+    def _redraw(self, player: Player, signatures: Tuple[Tuple, ...]) -> None:
+        """
+        Redibuja en la superficie cacheada las secciones cuya firma cambió
+        (y las que quedan a su derecha).
+        
+        Args:
+            player: El jugador
+            signatures: Firmas actuales (ver _section_signatures)
+        """
+        first = 0
+        if self._surface is None:
+            self._surface = pygame.Surface((self.width, self.height))
+            # Fondo del HUD
+            pygame.draw.rect(self._surface, COLORS["darker_gray"], (0, 0, self.width, self.height))
+            # Borde
+            pygame.draw.rect(self._surface, COLORS["gray"], (0, 0, self.width, self.height), 1)
+        else:
+            while signatures[first] == self._signatures[first]:
+                first += 1
+            # Borrar desde la primera sección cambiada hasta el borde derecho
+            start_x = self._section_x[first]
+            pygame.draw.rect(
+                self._surface, COLORS["darker_gray"],
+                (start_x, 1, self.width - 1 - start_x, self.height - 2)
+            )
+        self._signatures = signatures
+        telemetry.count("render.hud.redraws")
         
         padding = 8
         gap = 24  # Espacio entre secciones
         bar_height = 8
-        text_y = self.y + padding
+        text_y = padding
         bar_y = text_y + FONT_SIZE + 2
         
-        cursor_x = self.x + padding
-        
-        # ── Sección HP: texto arriba, barra debajo ──
-        cursor_x = self._render_hp_section(
-            surface, player, cursor_x, text_y, bar_y, bar_height
-        )
-        cursor_x += gap
-        
-        # ── Sección Nivel + XP: texto arriba, barra debajo ──
-        cursor_x = self._render_level_section(
-            surface, player, cursor_x, text_y, bar_y, bar_height
+        sections = (
+            # ── Sección HP: texto arriba, barra debajo ──
+            lambda x: self._render_hp_section(self._surface, player, x, text_y, bar_y, bar_height) + gap,
+            # ── Sección Nivel + XP: texto arriba, barra debajo ──
+            lambda x: self._render_level_section(self._surface, player, x, text_y, bar_y, bar_height) + gap,
+            # ── Stats en línea (centrados verticalmente): ATK, DEF, Oro, Amuleto ──
+            lambda x: self._render_combat_stats(self._surface, player, x, gap),
         )
-        cursor_x += gap
-        
-        # ── Stats en línea (centrados verticalmente): ATK, DEF, Oro, Amuleto ──
-        self._render_combat_stats(surface, player, cursor_x, gap)
+        cursor_x = self._section_x[first] if first else padding
+        for index in range(first, len(sections)):
+            self._section_x[index] = cursor_x
+            cursor_x = sections[index](cursor_x)
     
     def _render_hp_section(
         self,
@@ -105,7 +163,7 @@ class HUD:
         
         # Texto HP
         hp_text = f"HP: {hp}/{max_hp}"
-        text_surface = self.font.render(hp_text, True, COLORS["white"])
+        text_surface = text_cache.render(hp_text, self.font, COLORS["white"])
         text_width = text_surface.get_width()
         surface.blit(text_surface, (x, text_y))
         
@@ -148,7 +206,7 @@ class HUD:
         """
         # Texto Nivel
         level_text = f"Nivel: {player.fighter.level}"
-        text_surface = self.font.render(level_text, True, COLORS["white"])
+        text_surface = text_cache.render(level_text, self.font, COLORS["white"])
         text_width = text_surface.get_width()
         surface.blit(text_surface, (x, text_y))
         
@@ -183,34 +241,42 @@ class HUD:
         player: Player,
         start_x: int,
         gap: int
-    ) -> None:
-        """Renderiza ATK, DEF, Oro (y amuleto) centrados verticalmente."""
-        center_y = self.y + self.height // 2 - FONT_SIZE // 2
+    ) -> int:
+        """
+        Renderiza ATK, DEF, Oro (y amuleto) centrados verticalmente.
+        
+        Returns:
+            Posición X tras la sección.
+        """
+        center_y = self.height // 2 - FONT_SIZE // 2
         cursor_x = start_x
         
         # Ataque
         atk_text = self._format_attack_text(player)
-        text_surface = self.font.render(atk_text, True, COLORS["message_damage"])
+        text_surface = text_cache.render(atk_text, self.font, COLORS["message_damage"])
         surface.blit(text_surface, (cursor_x, center_y))
         cursor_x += text_surface.get_width() + gap
         
         # Defensa
         def_text = self._format_defense_text(player)
-        text_surface = self.font.render(def_text, True, COLORS["message_heal"])
+        text_surface = text_cache.render(def_text, self.font, COLORS["message_heal"])
         surface.blit(text_surface, (cursor_x, center_y))
         cursor_x += text_surface.get_width() + gap
         
         # Oro
         gold_text = f"Oro: {player.gold}"
-        text_surface = self.font.render(gold_text, True, COLORS["gold"])
+        text_surface = text_cache.render(gold_text, self.font, COLORS["gold"])
         surface.blit(text_surface, (cursor_x, center_y))
         cursor_x += text_surface.get_width() + gap
         
         # Indicador de amuleto
         if player.has_amulet:
             amulet_text = "¡TIENES EL AMULETO!"
-            text_surface = self.font.render(amulet_text, True, COLORS["amulet"])
+            text_surface = text_cache.render(amulet_text, self.font, COLORS["amulet"])
             surface.blit(text_surface, (cursor_x, center_y))
+            cursor_x += text_surface.get_width()
+        
+        return cursor_x
     
     def render_floor_indicator(self, surface: pygame.Surface, player: Player) -> None:
         """
@@ -222,7 +288,7 @@ class HUD:
             player: El jugador
         """
         floor_text = f"Piso: {player.current_floor}"
-        text_surface = self.font.render(floor_text, True, COLORS["stairs"])
+        text_surface = text_cache.render(floor_text, self.font, COLORS["stairs"])
         
         text_w = text_surface.get_width()
         text_h = text_surface.get_height()
@@ -236,9 +302,10 @@ class HUD:
         bg_x = screen_w - bg_w - 4
         bg_y = 4
         
-        bg_surface = pygame.Surface((bg_w, bg_h), pygame.SRCALPHA)
-        bg_surface.fill((20, 20, 20, 180))
-        surface.blit(bg_surface, (bg_x, bg_y))
+        if self._floor_bg is None or self._floor_bg.get_size() != (bg_w, bg_h):
+            self._floor_bg = pygame.Surface((bg_w, bg_h), pygame.SRCALPHA)
+            self._floor_bg.fill((20, 20, 20, 180))
+        surface.blit(self._floor_bg, (bg_x, bg_y))
         
         # Texto
         surface.blit(text_surface, (bg_x + padding, bg_y + padding))
@@ -0,0 +1,188 @@
+"""
+Modelo de render por turno.
+
+Entre dos turnos el mapa, los objetos, las decoraciones y los actores no
+cambian, pero el renderer los volvía a filtrar por FOV en cada frame,
+buscaba el sprite de cada criatura y recorría todas las entidades por
+cada casilla adyacente al jugador para los indicadores de interacción.
+
+`RenderModel.build` hace ese trabajo una vez por turno (o al cambiar de
+estado, de zona o de FOV) y deja listas planas de registros de dibujo.
+El frame a 60 Hz solo recorre esas listas y añade lo que sí cambia entre
+frames: offsets de animación, frames de la hoguera, relámpagos y el
+pulso de los indicadores.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Set, Tuple
+import pygame
+
+from ..config import COLORS, TILE_SIZE
+from .sprite_manager import sprite_manager
+
+if TYPE_CHECKING:
+    from ..entities.player import Player
+    from ..world.dungeon import Dungeon
+
+
+# Registro de actor: (id para la animación, x, y, sprite o None, char, color)
+ActorRecord = Tuple[int, int, int, Optional[pygame.Surface], str, Tuple[int, int, int]]
+
+
+def model_signature(
+    dungeon: 'Dungeon',
+    player: 'Player',
+    visible_tiles: Set[Tuple[int, int]],
+    turn: int,
+    game_state: str,
+) -> Tuple:
+    """
+    Calcula la firma barata que decide si hay que reconstruir el modelo.
+
+    El FOV devuelve un conjunto nuevo en cada actualización, así que basta
+    su identidad (el modelo guarda la referencia, el id no se reutiliza).
+    Los tamaños de las listas cubren cambios fuera de turno (consola,
+    inventario, scripts).
+
+    Args:
+        dungeon: Zona actual
+        player: El jugador
+        visible_tiles: Tiles visibles
+        turn: Contador de turnos de la partida
+        game_state: Estado actual del juego
+
+    Returns:
+        Tupla comparable con ==
+    """
+    return (
+        id(dungeon), id(visible_tiles), turn, game_state,
+        player.x, player.y, getattr(dungeon, "map_version", 0),
+        len(dungeon.items), len(dungeon.entities), len(dungeon.decorations),
+    )
+
+
+class RenderModel:
+    """
+    Lo que se dibuja en un turno, ya filtrado y resuelto.
+
+    Attributes:
+        signature: Firma con la que se construyó (ver model_signature)
+        terrain_key: Clave de la capa "terrain"
+        scene_key: Clave de la capa "scene" (sin el contador de redibujados)
+        items: Objetos visibles
+        decals: Decoraciones estáticas visibles ((x, y), (tipo, ángulo))
+        animated_decorations: Decoraciones animadas visibles, mismo formato
+        actors: Registros de actores (entidades y, al final, el jugador)
+        prompt_anchors: Indicadores de interacción (x, y, alto extra del sprite)
+    """
+
+    __slots__ = (
+        "signature", "dungeon", "visible_tiles", "terrain_key", "scene_key",
+        "items", "decals", "animated_decorations", "actors", "prompt_anchors",
+    )
+
+    def __init__(self, signature: Tuple, dungeon: 'Dungeon', visible_tiles: Set[Tuple[int, int]]) -> None:
+        """
+        Args:
+            signature: Firma del estado (ver model_signature)
+            dungeon: Zona actual (se retiene para que su id siga siendo válido)
+            visible_tiles: Tiles visibles (ídem)
+        """
+        self.signature = signature
+        self.dungeon = dungeon
+        self.visible_tiles = visible_tiles
+        self.terrain_key: Tuple = ()
+        self.scene_key: Tuple = ()
+        self.items: Tuple[Any, ...] = ()
+        self.decals: Tuple[Tuple[Tuple[int, int], Tuple[str, int]], ...] = ()
+        self.animated_decorations: List[Tuple[Tuple[int, int], Tuple[str, int]]] = []
+        self.actors: List[ActorRecord] = []
+        self.prompt_anchors: List[Tuple[int, int, int]] = []
+
+    @classmethod
+    def build(
+        cls,
+        signature: Tuple,
+        dungeon: 'Dungeon',
+        player: 'Player',
+        visible_tiles: Set[Tuple[int, int]],
+        is_animated: Callable[[str], bool],
+    ) -> 'RenderModel':
+        """
+        Construye el modelo de un turno.
+
+        Args:
+            signature: Firma del estado (ver model_signature)
+            dungeon: Zona actual
+            player: El jugador
+            visible_tiles: Tiles visibles
+            is_animated: Si un tipo de decoración cambia sola entre frames
+
+        Returns:
+            Modelo listo para dibujar
+        """
+        model = cls(signature, dungeon, visible_tiles)
+        tiles = dungeon.tiles
+        doors = tuple(tiles[x][y].is_open for x, y in getattr(dungeon, "door_cells", ()))
+        model.terrain_key = (dungeon, getattr(dungeon, "map_version", 0), visible_tiles, doors)
+
+        model.items = tuple(item for item in dungeon.items if (item.x, item.y) in visible_tiles)
+        decals, animated = [], []
+        for pos, deco in dungeon.decorations.items():
+            if pos in visible_tiles:
+                (animated if is_animated(deco[0]) else decals).append((pos, deco))
+        model.decals = tuple(decals)
+        model.animated_decorations = animated
+        model.scene_key = (tuple((item, item.x, item.y) for item in model.items), model.decals)
+
+        entities = [entity for entity in dungeon.entities if (entity.x, entity.y) in visible_tiles]
+        model.actors = [_actor_record(entity) for entity in entities]
+        player_sprite = sprite_manager.get_creature_sprite("player")
+        model.actors.append(
+            (id(player), player.x, player.y, player_sprite, player.char,
+             COLORS.get(player.color, COLORS["white"]))
+        )
+
+        # Indicadores: NPCs vivos con texto de interacción junto al jugador
+        # (ortogonales + misma casilla, en este orden)
+        for ax, ay in (
+            (player.x, player.y - 1),
+            (player.x, player.y + 1),
+            (player.x - 1, player.y),
+            (player.x + 1, player.y),
+            (player.x, player.y),
+        ):
+            for entity in entities:
+                if entity.x != ax or entity.y != ay or not getattr(entity, "interactive_text", None):
+                    continue
+                fighter = getattr(entity, "fighter", None)
+                if fighter and fighter.is_dead:
+                    continue
+                entity_sprite = getattr(entity, "sprite", None)
+                extra_h = 0
+                if entity_sprite and entity_sprite.get_height() > TILE_SIZE:
+                    extra_h = entity_sprite.get_height() - TILE_SIZE
+                model.prompt_anchors.append((entity.x, entity.y, extra_h))
+        return model
+
+
+def _actor_record(entity: Any) -> ActorRecord:
+    """
+    Resuelve cómo se dibuja una entidad (sprite, o ASCII si no hay o está muerta).
+
+    Args:
+        entity: Entidad visible
+
+    Returns:
+        Registro de actor
+    """
+    sprite = None
+    fighter = getattr(entity, "fighter", None)
+    # Los cadáveres se dibujan en ASCII (%)
+    if not (fighter.is_dead if fighter else False):
+        # Sprite asignado directamente (NPCs como Stranger) o por monster_type
+        sprite = getattr(entity, "sprite", None)
+        if not sprite:
+            monster_type = getattr(entity, "monster_type", None)
+            sprite = sprite_manager.get_creature_sprite(monster_type) if monster_type else None
+    return (id(entity), entity.x, entity.y, sprite or None, entity.char,
+            COLORS.get(entity.color, COLORS["white"]))
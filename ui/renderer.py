@@ -3,13 +3,14 @@ Sistema de renderizado del juego.
 Dibuja el mapa, entidades, UI y mensajes usando Pygame.
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Tuple, Set, Optional, Any
+from typing import TYPE_CHECKING, List, Tuple, Set, Optional, Any, Sequence
+from contextlib import contextmanager
 import pygame
 import time
 import random
 
 from ..config import (
-    WINDOW_WIDTH, WINDOW_HEIGHT, TILE_SIZE, FONT_NAME, FONT_SIZE,
+    WINDOW_WIDTH, WINDOW_HEIGHT, TILE_SIZE, FONT_SIZE,
     COLORS, MAP_WIDTH, MAP_HEIGHT, MESSAGE_LOG_HEIGHT,
     FPS, GameState,
     GRID_INVENTORY_WIDTH, GRID_INVENTORY_HEIGHT
@@ -18,8 +19,12 @@ from .hud import HUD
 from .message_log import MessageLog
 from .sprite_manager import sprite_manager
 from .dialog import dialog_renderer
+from .compositor import Compositor, DirtyRegions
+from .fonts import fonts, text_cache
+from .render_model import ActorRecord, RenderModel, model_signature
 from ..systems.dialog_manager import dialog_manager
 from ..systems.music import music_manager
+from ..systems.telemetry import telemetry
 
 if TYPE_CHECKING:
     from ..world.dungeon import Dungeon
@@ -58,6 +63,10 @@ class LightningEffect:
         )
         self._just_triggered: bool = False  # True solo en el frame que arranca el rayo
     
+    def next_change_at(self) -> float:
+        """Instante (time.time) del próximo cambio de alpha: el rayo o ya."""
+        return self._next_strike if self._phase == "idle" else time.time()
+    
     def did_trigger(self) -> bool:
         """Devuelve True una sola vez cuando arranca un relámpago (para disparar sonido)."""
         if self._just_triggered:
@@ -130,10 +139,7 @@ class Renderer:
         self.clock = pygame.time.Clock()
         
         # Cargar fuente monoespaciada
-        try:
-            self.font = pygame.font.SysFont(FONT_NAME, FONT_SIZE)
-        except:
-            self.font = pygame.font.Font(None, FONT_SIZE)
+        self.font = fonts.get(FONT_SIZE)
         
         # Calcular dimensiones
         self.map_width = MAP_WIDTH * TILE_SIZE
@@ -153,9 +159,15 @@ class Renderer:
             log_height = min_log_height
         self.log_area = (0, log_y, WINDOW_WIDTH, log_height)
         
-        # Cache de superficies de caracteres para rendimiento
+        # Cache de caracteres: (char, color) -> (superficie, offset de centrado)
         self._char_cache: dict = {}
         
+        # Modelo de render del turno actual (ver render_model)
+        self._render_model: Optional[RenderModel] = None
+        
+        # Blits pendientes dentro de _batched() (None = se copian al momento)
+        self._batch: Optional[List[Tuple[pygame.Surface, Tuple[int, int]]]] = None
+        
         # Referencia al animation manager (se actualiza en cada render)
         self._current_animation_manager: Optional[Any] = None
         
@@ -163,6 +175,17 @@ class Renderer:
         self._lightning_effect: Optional[LightningEffect] = (
             LightningEffect() if LIGHTNING_ENABLED else None
         )
+        
+        # Capas cacheadas (mapa, escena, log)
+        self.compositor = Compositor()
+        
+        # Rectángulos de pantalla a actualizar en cada frame
+        self.dirty = DirtyRegions((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self._last_game_state: Optional[str] = None
+        
+        # Próximo instante (time.time) en que cambia algo animado en pantalla
+        # sin que haya entrada (hoguera, relámpago, indicador ESPACIO)
+        self._wake_at: Optional[float] = None
     
     def render(
         self,
@@ -188,6 +211,7 @@ class Renderer:
         inv_drag_mouse_pos: tuple = (0, 0),
         inv_context_menu: dict = None,
         inv_hover_item: object = None,
+        turn: int = 0,
     ) -> None:
         """
         Renderiza todo el juego.
@@ -204,81 +228,233 @@ class Renderer:
             animation_manager: Gestor de animaciones
             shop: Instancia de Shop (para estado SHOP)
             shop_cursor: Índice del item seleccionado en la tienda
+            turn: Contador de turnos (el modelo de render se reconstruye
+                cuando cambia, o al cambiar de estado, zona o FOV)
         """
         # Guardar referencia para métodos internos
         self._current_animation_manager = animation_manager
+        self._wake_at = None
+        
+        # Los overlays cambian con cada tecla: fuera de PLAYING (o al salir
+        # de un overlay) se actualiza la pantalla entera
+        if game_state != GameState.PLAYING or game_state != self._last_game_state:
+            self.dirty.mark_full()
+        self._last_game_state = game_state
         # Limpiar pantalla
         self.screen.fill(COLORS["black"])
         
-        # Renderizar mapa
-        self._render_map(dungeon, visible_tiles)
-        
-        # Renderizar items
-        self._render_items(dungeon, visible_tiles)
+        # Lo visible en este turno, ya filtrado por FOV (una vez por turno)
+        model = self._get_render_model(dungeon, player, visible_tiles, turn, game_state)
         
-        # Renderizar decoraciones de suelo (sangre, etc.)
-        self._render_decorations(dungeon, visible_tiles)
+        # Mapa, objetos y decoraciones estáticas: capas cacheadas que solo se
+        # redibujan cuando cambian el FOV, las puertas o lo que hay en el suelo
+        with telemetry.timer("render.map"):
+            self.screen.blit(self._get_scene_layer(model), (0, 0))
         
-        # Renderizar entidades
-        self._render_entities(dungeon, visible_tiles)
+        # Decoraciones animadas (hogueras, ventanas con relámpago)
+        with telemetry.timer("render.decorations"), self.dirty.group("decorations"), self._batched():
+            self._render_decorations(model.animated_decorations)
         
-        # Renderizar jugador
-        self._render_player(player)
+        # Renderizar entidades y jugador
+        with telemetry.timer("render.entities"), self.dirty.group("actors"), self._batched():
+            self._render_actors(model.actors)
         
         # Renderizar indicadores de interacción sobre NPCs cercanos
         if game_state == GameState.PLAYING:
-            self._render_interaction_prompts(dungeon, player, visible_tiles)
+            with telemetry.timer("render.prompts"), self.dirty.group("prompts"):
+                self._render_interaction_prompts(model.prompt_anchors)
         
         # Renderizar números de daño flotantes
-        self._render_damage_numbers()
+        with telemetry.timer("render.damage_numbers"), self.dirty.group("damage_numbers"):
+            self._render_damage_numbers()
         
         # Renderizar HUD
-        self.hud.render(self.screen, player)
-        
-        # Renderizar indicador de piso (esquina superior derecha)
-        self.hud.render_floor_indicator(self.screen, player)
+        with telemetry.timer("render.hud"):
+            if self.hud.render(self.screen, player):
+                self.dirty.mark((self.hud.x, self.hud.y, self.hud.width, self.hud.height))
+            
+            # Renderizar indicador de piso (esquina superior derecha)
+            self.hud.render_floor_indicator(self.screen, player)
         
         # Renderizar log de mensajes
-        self._render_message_log(message_log)
+        with telemetry.timer("render.message_log"):
+            x, y, width, height = self.log_area
+            log_key = (
+                tuple(message_log.get_recent(MESSAGE_LOG_HEIGHT)),
+                message_log.can_scroll_up,
+                message_log.can_scroll_down,
+            )
+            log_surface = self.compositor.layer(
+                "message_log", (width, height), log_key,
+                lambda surface: self._render_message_log(message_log, surface),
+            )
+            self.screen.blit(log_surface, (x, y))
         
         # Renderizar overlays según estado
-        if game_state == GameState.INVENTORY:
-            self._render_inventory(
-                player, inventory_mode, cursor, scroll,
-                drag_item=inv_drag_item,
-                drag_mouse_pos=inv_drag_mouse_pos,
-                context_menu=inv_context_menu,
-                hover_item=inv_hover_item,
+        with telemetry.timer("render.overlay"):
+            if game_state == GameState.INVENTORY:
+                self._render_inventory(
+                    player, inventory_mode, cursor, scroll,
+                    drag_item=inv_drag_item,
+                    drag_mouse_pos=inv_drag_mouse_pos,
+                    context_menu=inv_context_menu,
+                    hover_item=inv_hover_item,
+                )
+            elif game_state == GameState.DEAD:
+                self._render_death_screen()
+            elif game_state == GameState.VICTORY:
+                self._render_victory_screen()
+            elif game_state == GameState.PAUSED:
+                self._render_pause_menu(pause_cursor)
+            elif game_state == GameState.OPTIONS:
+                self._render_options_menu(options_cursor)
+            elif game_state == GameState.DIALOG:
+                self._render_dialog()
+            elif game_state == GameState.CONSOLE:
+                self._render_console(console_input)
+            elif game_state == GameState.SAVE_MENU:
+                self._render_save_menu(save_menu_selected, save_menu_mode)
+            elif game_state == GameState.SHOP:
+                self._render_shop(player, shop, shop_cursor)
+            elif game_state == GameState.DONATION:
+                self._render_donation(player, donation_amount, donation_digit)
+        
+        # Actualizar pantalla (solo lo que cambió)
+        changed = self.compositor.take_changed()
+        if "scene" in changed:
+            self.dirty.mark((0, 0, self.map_width, self.map_height))
+        if "message_log" in changed:
+            self.dirty.mark(self.log_area)
+        with telemetry.timer("render.flip"):
+            self.dirty.present()
+    
+    @contextmanager
+    def _drawing_on(self, surface: pygame.Surface):
+        """Redirige los métodos _draw_* a otra superficie (p. ej. una capa)."""
+        screen, self.screen = self.screen, surface
+        try:
+            yield surface
+        finally:
+            self.screen = screen
+    
+    def _get_render_model(
+        self,
+        dungeon: Dungeon,
+        player: Player,
+        visible_tiles: Set[Tuple[int, int]],
+        turn: int,
+        game_state: str,
+    ) -> RenderModel:
+        """
+        Devuelve el modelo de render, reconstruyéndolo si cambió su firma.
+        
+        Args:
+            dungeon: Zona actual
+            player: El jugador
+            visible_tiles: Tiles visibles
+            turn: Contador de turnos
+            game_state: Estado actual del juego
+            
+        Returns:
+            Modelo del turno actual
+        """
+        signature = model_signature(dungeon, player, visible_tiles, turn, game_state)
+        model = self._render_model
+        if model is None or model.signature != signature:
+            model = self._render_model = RenderModel.build(
+                signature, dungeon, player, visible_tiles, self._is_animated_decoration
             )
-        elif game_state == GameState.DEAD:
-            self._render_death_screen()
-        elif game_state == GameState.VICTORY:
-            self._render_victory_screen()
-        elif game_state == GameState.PAUSED:
-            self._render_pause_menu(pause_cursor)
-        elif game_state == GameState.OPTIONS:
-            self._render_options_menu(options_cursor)
-        elif game_state == GameState.DIALOG:
-            self._render_dialog()
-        elif game_state == GameState.CONSOLE:
-            self._render_console(console_input)
-        elif game_state == GameState.SAVE_MENU:
-            self._render_save_menu(save_menu_selected, save_menu_mode)
-        elif game_state == GameState.SHOP:
-            self._render_shop(player, shop, shop_cursor)
-        elif game_state == GameState.DONATION:
-            self._render_donation(player, donation_amount, donation_digit)
-        
-        # Actualizar pantalla
-        pygame.display.flip()
+            telemetry.count("render.model.builds")
+        return model
+    
+    def _get_scene_layer(self, model: RenderModel) -> pygame.Surface:
+        """
+        Devuelve la capa de escena (terreno + objetos + decoraciones estáticas).
+        
+        La capa "terrain" depende del FOV (el conjunto visible se guarda en
+        la clave y se compara por valor), del estado de las puertas y de
+        `map_version`; la de escena, además, de los objetos y decoraciones
+        visibles. Cambiar solo un objeto no redibuja el terreno. Las claves
+        vienen del modelo del turno, así que entre turnos la comparación es
+        por identidad.
+        
+        Args:
+            model: Modelo de render del turno
+            
+        Returns:
+            Superficie del tamaño del mapa lista para copiar a pantalla
+        """
+        size = (self.map_width, self.map_height)
+        dungeon, visible_tiles = model.dungeon, model.visible_tiles
+        
+        def draw_terrain(surface: pygame.Surface) -> None:
+            with self._drawing_on(surface), self._batched():
+                self._render_map(dungeon, visible_tiles)
+        
+        terrain = self.compositor.layer("terrain", size, model.terrain_key, draw_terrain)
+        scene_key = (self.compositor.layers["terrain"].rebuilds, model.scene_key)
+        
+        def draw_scene(surface: pygame.Surface) -> None:
+            surface.blit(terrain, (0, 0))
+            with self._drawing_on(surface), self._batched():
+                self._render_items(model.items)
+                self._render_decorations(model.decals)
+        
+        return self.compositor.layer("scene", size, scene_key, draw_scene)
+    
+    def _is_animated_decoration(self, deco_type: str) -> bool:
+        """True si la decoración cambia sola entre frames (hoguera, ventanas)."""
+        return sprite_manager.is_animated_decoration(deco_type) or (
+            deco_type == "ventanas" and self._lightning_effect is not None
+        )
+    
+    def _schedule_wake(self, at: float) -> None:
+        """Registra un cambio visual futuro (se queda con el más próximo)."""
+        if self._wake_at is None or at < self._wake_at:
+            self._wake_at = at
+    
+    def idle_timeout(self) -> Optional[float]:
+        """
+        Tiempo hasta el próximo cambio visual sin entrada del jugador.
+        
+        Se calcula en el último render (decoraciones animadas visibles,
+        relámpago pendiente, indicadores de interacción).
+        
+        Returns:
+            Segundos (0 = hay que seguir pintando) o None si la pantalla
+            es estática hasta que llegue un evento
+        """
+        if self._wake_at is None:
+            return None
+        return max(0.0, self._wake_at - time.time())
+    
+    def invalidate_layers(self, name: Optional[str] = None) -> None:
+        """
+        Fuerza el redibujado de las capas cacheadas.
+        
+        Solo hace falta si se modifican tiles sin pasar por update_fov,
+        Dungeon.set_tile o las puertas (p. ej. al recargar sprites).
+        
+        Args:
+            name: Nombre de la capa ("terrain", "scene", "message_log") o None
+        """
+        self._render_model = None
+        self.compositor.invalidate(name)
+        if name is None:
+            self.hud.invalidate()
     
     def _render_map(self, dungeon: Dungeon, visible_tiles: Set[Tuple[int, int]]) -> None:
         """Renderiza el mapa de tiles."""
         from ..world.tile import TileType
         
+        # El caracter de los tiles que no son puertas solo depende del tipo y
+        # de si está visible: se resuelve una vez por combinación
+        glyphs: dict = {}
+        
         for x in range(min(dungeon.width, MAP_WIDTH)):
+            column = dungeon.tiles[x]
             for y in range(min(dungeon.height, MAP_HEIGHT)):
-                tile = dungeon.tiles[x][y]
+                tile = column[y]
                 
                 if tile.visible or tile.explored:
                     # Verificar si es terreno especial visible (usar sprite)
@@ -304,42 +480,48 @@ class Renderer:
                         sprite_key = "door_open" if tile.is_open else "door_closed"
                         sprite = sprite_manager.get_terrain_sprite(sprite_key)
                         if sprite:
-                            dark_sprite = sprite.copy()
-                            dark_sprite.fill((80, 80, 80), special_flags=pygame.BLEND_RGB_MULT)
+                            dark_sprite = sprite_manager.get_variant(sprite, tint=(80, 80, 80))
                             self._draw_sprite(x, y, dark_sprite)
                             continue
                     
                     # Fallback a ASCII para todo lo demás
-                    char = tile.char
-                    color = tile.get_color_rgb()
-                    self._draw_char(x, y, char, color)
+                    glyph_key = (tile.tile_type, tile.visible)
+                    glyph = glyphs.get(glyph_key)
+                    if glyph is None:
+                        glyph = self._glyph(tile.char, tile.get_color_rgb())
+                        if tile.tile_type != TileType.DOOR:
+                            glyphs[glyph_key] = glyph
+                    surface, offset_x, offset_y = glyph
+                    self._blit(surface, (x * TILE_SIZE + offset_x, y * TILE_SIZE + offset_y))
     
-    def _render_items(self, dungeon: Dungeon, visible_tiles: Set[Tuple[int, int]]) -> None:
-        """Renderiza los items en el suelo."""
-        for item in dungeon.items:
-            if (item.x, item.y) in visible_tiles:
-                # Intentar sprite específico del item (ej: "dagger", "sword")
-                sprite = None
-                if getattr(item, 'sprite', None):
-                    sprite = sprite_manager.get_item_sprite(item.sprite)
-                # Fallback a sprite genérico por tipo (ej: "weapon", "armor")
-                if not sprite:
-                    sprite = sprite_manager.get_item_sprite(item.item_type)
-                if sprite:
-                    self._draw_sprite(item.x, item.y, sprite)
-                else:
-                    # Fallback a ASCII
-                    color = COLORS.get(item.color, COLORS["white"])
-                    self._draw_char(item.x, item.y, item.char, color)
+    def _render_items(self, items: Tuple[Any, ...]) -> None:
+        """Renderiza los items en el suelo (los visibles, del modelo)."""
+        for item in items:
+            # Intentar sprite específico del item (ej: "dagger", "sword")
+            sprite = None
+            if getattr(item, 'sprite', None):
+                sprite = sprite_manager.get_item_sprite(item.sprite)
+            # Fallback a sprite genérico por tipo (ej: "weapon", "armor")
+            if not sprite:
+                sprite = sprite_manager.get_item_sprite(item.item_type)
+            if sprite:
+                self._draw_sprite(item.x, item.y, sprite)
+            else:
+                # Fallback a ASCII
+                color = COLORS.get(item.color, COLORS["white"])
+                self._draw_char(item.x, item.y, item.char, color)
     
-    def _render_decorations(self, dungeon: Dungeon, visible_tiles: Set[Tuple[int, int]]) -> None:
-        """Renderiza las decoraciones del suelo (sangre, hogueras animadas, ventanas con relámpago, etc.)."""
+    def _render_decorations(self, decorations: Sequence[Tuple[Tuple[int, int], Tuple[str, int]]]) -> None:
+        """
+        Renderiza las decoraciones del suelo (sangre, hogueras animadas, ventanas con relámpago, etc.).
+        
+        Args:
+            decorations: ((x, y), (tipo, ángulo)) visibles, del modelo: las
+                animadas (cada frame) o las estáticas (capa de escena)
+        """
         current_time = time.time()
         
-        for (x, y), (deco_type, angle) in dungeon.decorations.items():
-            if (x, y) not in visible_tiles:
-                continue
-            
+        for (x, y), (deco_type, angle) in decorations:
             # Verificar si es una decoración animada (múltiples frames)
             if sprite_manager.is_animated_decoration(deco_type):
                 frames = sprite_manager.get_animated_decoration_frames(deco_type)
@@ -347,6 +529,7 @@ class Renderer:
                     # Ciclar frames: ~200ms por frame
                     frame_index = int(current_time / 0.2) % len(frames)
                     self._draw_sprite(x, y, frames[frame_index])
+                    self._schedule_wake((int(current_time / 0.2) + 1) * 0.2)
                 continue
             
             # Efecto relámpago para ventanas
@@ -354,11 +537,11 @@ class Renderer:
                 alpha = self._lightning_effect.get_alpha()
                 if self._lightning_effect.did_trigger():
                     music_manager.play_sound("storm_sound.mp3")
+                self._schedule_wake(self._lightning_effect.next_change_at())
                 if alpha > 0:
                     sprite = sprite_manager.get_decoration_sprite(deco_type)
                     if sprite:
-                        flash_sprite = sprite.copy()
-                        flash_sprite.set_alpha(alpha)
+                        flash_sprite = sprite_manager.get_variant(sprite, alpha=alpha)
                         self._draw_sprite(x, y, flash_sprite)
                 continue
             
@@ -366,79 +549,50 @@ class Renderer:
             sprite = sprite_manager.get_decoration_sprite(deco_type)
             if sprite:
                 if angle != 0:
-                    sprite = pygame.transform.rotate(sprite, angle)
+                    sprite = sprite_manager.get_variant(sprite, angle=angle)
                 self._draw_sprite(x, y, sprite)
     
-    def _render_entities(self, dungeon: Dungeon, visible_tiles: Set[Tuple[int, int]]) -> None:
-        """Renderiza las entidades (monstruos)."""
-        for entity in dungeon.entities:
-            if (entity.x, entity.y) in visible_tiles:
-                # Obtener offset de animación si existe
-                offset_x, offset_y = 0.0, 0.0
-                if self._current_animation_manager:
-                    offset_x, offset_y = self._current_animation_manager.get_offset(id(entity))
-                
-                # Verificar si el monstruo está muerto (cadáver = ASCII %)
-                fighter = getattr(entity, 'fighter', None)
-                is_dead = fighter.is_dead if fighter else False
-                
-                # Solo usar sprite si está vivo
-                if not is_dead:
-                    # Primero verificar si la entidad tiene un sprite asignado directamente (NPCs como Stranger)
-                    sprite = getattr(entity, 'sprite', None)
-                    
-                    # Si no tiene sprite directo, intentar obtenerlo por monster_type
-                    if not sprite:
-                        monster_type = getattr(entity, 'monster_type', None)
-                        sprite = sprite_manager.get_creature_sprite(monster_type) if monster_type else None
-                    
-                    if sprite:
-                        self._draw_sprite_with_offset(entity.x, entity.y, sprite, offset_x, offset_y)
-                        continue
-                
+    def _render_actors(self, actors: List[ActorRecord]) -> None:
+        """
+        Renderiza las entidades visibles y el jugador (registros del modelo).
+        
+        Args:
+            actors: Registros (id de animación, x, y, sprite, char, color)
+        """
+        animation_manager = self._current_animation_manager
+        for anim_id, x, y, sprite, char, color in actors:
+            # Obtener offset de animación si existe
+            offset_x, offset_y = 0.0, 0.0
+            if animation_manager:
+                offset_x, offset_y = animation_manager.get_offset(anim_id)
+            
+            if sprite:
+                self._draw_sprite_with_offset(x, y, sprite, offset_x, offset_y)
+            else:
                 # Fallback a ASCII (también para cadáveres)
-                color = COLORS.get(entity.color, COLORS["white"])
-                self._draw_char_with_offset(
-                    entity.x, entity.y, 
-                    entity.char, color,
-                    offset_x, offset_y
-                )
+                self._draw_char_with_offset(x, y, char, color, offset_x, offset_y)
     
-    def _render_player(self, player: Player) -> None:
-        """Renderiza al jugador."""
-        # Obtener offset de animación si existe
-        offset_x, offset_y = 0.0, 0.0
-        if self._current_animation_manager:
-            offset_x, offset_y = self._current_animation_manager.get_offset(id(player))
-        
-        # Intentar usar sprite del jugador
-        sprite = sprite_manager.get_creature_sprite("player")
-        
-        if sprite:
-            self._draw_sprite_with_offset(player.x, player.y, sprite, offset_x, offset_y)
-        else:
-            # Fallback a ASCII
-            color = COLORS.get(player.color, COLORS["white"])
-            self._draw_char_with_offset(
-                player.x, player.y,
-                player.char, color,
-                offset_x, offset_y
-            )
-    
-    def _render_message_log(self, message_log: MessageLog) -> None:
-        """Renderiza el log de mensajes con soporte de scroll."""
-        x, y, width, height = self.log_area
+    def _render_message_log(self, message_log: MessageLog, surface: pygame.Surface) -> None:
+        """
+        Renderiza el log de mensajes con soporte de scroll.
+        
+        Args:
+            message_log: Log de mensajes
+            surface: Superficie de la capa del log (coordenadas locales)
+        """
+        x, y = 0, 0
+        width, height = surface.get_size()
         
         # Fondo
         pygame.draw.rect(
-            self.screen,
+            surface,
             COLORS["darker_gray"],
             (x, y, width, height)
         )
         
         # Borde
         pygame.draw.rect(
-            self.screen,
+            surface,
             COLORS["gray"],
             (x, y, width, height),
             1
@@ -451,8 +605,8 @@ class Renderer:
         
         for i, (text, color_key) in enumerate(messages):
             color = message_log.get_color_rgb(color_key)
-            text_surface = self.font.render(text, True, color)
-            self.screen.blit(
+            text_surface = text_cache.render(text, self.font, color)
+            surface.blit(
                 text_surface,
                 (x + padding, y + padding + i * line_height)
             )
@@ -460,11 +614,11 @@ class Renderer:
         # Indicador de scroll (esquina derecha del log)
         indicator_x = x + width - 10
         if message_log.can_scroll_up:
-            arrow_up = self.font.render("\u25b2", True, COLORS["gray"])
-            self.screen.blit(arrow_up, (indicator_x, y + 2))
+            arrow_up = text_cache.render("\u25b2", self.font, COLORS["gray"])
+            surface.blit(arrow_up, (indicator_x, y + 2))
         if message_log.can_scroll_down:
-            arrow_down = self.font.render("\u25bc", True, COLORS["gray"])
-            self.screen.blit(arrow_down, (indicator_x, y + height - FONT_SIZE - 2))
+            arrow_down = text_cache.render("\u25bc", self.font, COLORS["gray"])
+            surface.blit(arrow_down, (indicator_x, y + height - FONT_SIZE - 2))
     
     # ── Constantes de grid UI ─────────────────────────────────────
     _GRID_CELL = 48          # Píxeles por celda del grid
@@ -641,7 +795,7 @@ class Renderer:
                 scale = min(max_w / sw, max_h / sh, 3.0)  # Máx ×3
                 new_w = max(1, int(sw * scale))
                 new_h = max(1, int(sh * scale))
-                scaled = pygame.transform.scale(sprite, (new_w, new_h))
+                scaled = sprite_manager.get_variant(sprite, size=(new_w, new_h))
                 sx = ipx + (ipw - new_w) // 2
                 sy = ipy + (iph - new_h) // 2 - 4  # Un poco arriba para dejar espacio al nombre
                 self.screen.blit(scaled, (sx, sy))
@@ -649,38 +803,29 @@ class Renderer:
                 # Fallback: dibujar el carácter del item (grande)
                 ch = getattr(item, 'char', '?')
                 item_color = COLORS.get(getattr(item, 'color', 'white'), COLORS["white"])
-                try:
-                    big_font = pygame.font.SysFont(FONT_NAME, min(cell - 8, 28), bold=True)
-                except Exception:
-                    big_font = pygame.font.Font(None, min(cell - 8, 28))
-                ch_surface = big_font.render(ch, True, item_color)
+                big_font = fonts.get(min(cell - 8, 28), bold=True)
+                ch_surface = text_cache.render(ch, big_font, item_color)
                 cx = ipx + (ipw - ch_surface.get_width()) // 2
                 cy = ipy + (iph - ch_surface.get_height()) // 2 - 4
                 self.screen.blit(ch_surface, (cx, cy))
 
             # ── Nombre del item (abajo del sprite) ───────────
-            try:
-                name_font = pygame.font.SysFont(FONT_NAME, 10)
-            except Exception:
-                name_font = pygame.font.Font(None, 10)
+            name_font = fonts.get(10)
             # Truncar nombre si es muy largo
             display_name = item.name
             if name_font.size(display_name)[0] > ipw - 4:
                 while len(display_name) > 3 and name_font.size(display_name + "..")[0] > ipw - 4:
                     display_name = display_name[:-1]
                 display_name += ".."
-            name_surface = name_font.render(display_name, True, COLORS["white"])
+            name_surface = text_cache.render(display_name, name_font, COLORS["white"])
             nx = ipx + (ipw - name_surface.get_width()) // 2
             ny = ipy + iph - name_surface.get_height() - 2
             self.screen.blit(name_surface, (nx, ny))
 
             # Indicador "E" si está equipado (esquina superior-derecha)
             if is_equipped:
-                try:
-                    eq_font = pygame.font.SysFont(FONT_NAME, 10, bold=True)
-                except Exception:
-                    eq_font = pygame.font.Font(None, 10)
-                eq_surf = eq_font.render("E", True, self._COL_EQUIPPED)
+                eq_font = fonts.get(10, bold=True)
+                eq_surf = text_cache.render("E", eq_font, self._COL_EQUIPPED)
                 self.screen.blit(eq_surf, (ipx + ipw - eq_surf.get_width() - 3, ipy + 2))
 
         # ── Panel de equipamiento (derecha del grid) ─────────
@@ -695,7 +840,7 @@ class Renderer:
 
         # Título
         eq_title = "EQUIPADO"
-        eq_title_surface = self.font.render(eq_title, True, COLORS["white"])
+        eq_title_surface = text_cache.render(eq_title, self.font, COLORS["white"])
         self.screen.blit(eq_title_surface,
                          (equip_x + (equip_panel_w - eq_title_surface.get_width()) // 2,
                           equip_y + 8))
@@ -719,12 +864,12 @@ class Renderer:
                 color = COLORS["gray"]
 
             # Truncar si es muy largo
-            eq_surface = self.font.render(eq_text, True, color)
+            eq_surface = text_cache.render(eq_text, self.font, color)
             if eq_surface.get_width() > equip_panel_w - 16:
                 while len(eq_text) > 8 and self.font.size(eq_text + "..")[0] > equip_panel_w - 16:
                     eq_text = eq_text[:-1]
                 eq_text += ".."
-                eq_surface = self.font.render(eq_text, True, color)
+                eq_surface = text_cache.render(eq_text, self.font, color)
             self.screen.blit(eq_surface, (equip_x + 8, ey))
             ey += line_h
 
@@ -744,7 +889,7 @@ class Renderer:
             if is_eq:
                 sel_name += "  (equipado)"
             name_color = self._COL_EQUIPPED if is_eq else COLORS["white"]
-            name_surf = self.font.render(sel_name, True, name_color)
+            name_surf = text_cache.render(sel_name, self.font, name_color)
             self.screen.blit(name_surf, (tooltip_x + 10, tooltip_y + 6))
 
             # Descripción
@@ -767,19 +912,21 @@ class Renderer:
             heal_val = getattr(selected_item, 'heal_amount', 0)
             if heal_val:
                 stats_parts.append(f"Cura {heal_val} HP")
+            if atk or dfn:
+                from ..systems.damage import item_tooltip
+                combat_hint = item_tooltip(player, selected_item)
+                if combat_hint:
+                    stats_parts.append(combat_hint)
 
             stats_str = "  |  ".join(stats_parts) if stats_parts else ""
 
-            try:
-                desc_font = pygame.font.SysFont(FONT_NAME, FONT_SIZE - 2)
-            except Exception:
-                desc_font = pygame.font.Font(None, FONT_SIZE - 2)
+            desc_font = fonts.get(FONT_SIZE - 2)
 
             if desc:
-                desc_surf = desc_font.render(desc, True, COLORS["message"])
+                desc_surf = text_cache.render(desc, desc_font, COLORS["message"])
                 self.screen.blit(desc_surf, (tooltip_x + 10, tooltip_y + 26))
             if stats_str:
-                stats_surf = desc_font.render(stats_str, True, COLORS["message_heal"])
+                stats_surf = text_cache.render(stats_str, desc_font, COLORS["message_heal"])
                 self.screen.blit(stats_surf, (tooltip_x + 10, tooltip_y + 46))
         # (Sin texto cuando no hay item seleccionado — tooltip vacío)
 
@@ -817,17 +964,14 @@ class Renderer:
                 scale = min(max_sw / sw, max_sh / sh, 3.0)
                 new_w = max(1, int(sw * scale))
                 new_h = max(1, int(sh * scale))
-                scaled = pygame.transform.scale(sprite, (new_w, new_h))
+                scaled = sprite_manager.get_variant(sprite, size=(new_w, new_h))
                 ghost_surf.blit(scaled, ((ghost_w - new_w) // 2,
                                           (ghost_h - new_h) // 2 - 4))
             else:
                 ch = getattr(drag_item, 'char', '?')
                 item_color = COLORS.get(getattr(drag_item, 'color', 'white'), COLORS["white"])
-                try:
-                    big_font = pygame.font.SysFont(FONT_NAME, min(cell - 8, 28), bold=True)
-                except Exception:
-                    big_font = pygame.font.Font(None, min(cell - 8, 28))
-                ch_surface = big_font.render(ch, True, item_color)
+                big_font = fonts.get(min(cell - 8, 28), bold=True)
+                ch_surface = text_cache.render(ch, big_font, item_color)
                 ghost_surf.blit(ch_surface, ((ghost_w - ch_surface.get_width()) // 2,
                                               (ghost_h - ch_surface.get_height()) // 2))
 
@@ -840,11 +984,8 @@ class Renderer:
 
             # Indicador "soltar" si fuera del grid
             if not on_grid:
-                try:
-                    drop_font = pygame.font.SysFont(FONT_NAME, 12, bold=True)
-                except Exception:
-                    drop_font = pygame.font.Font(None, 12)
-                drop_label = drop_font.render("SOLTAR", True, (255, 80, 80))
+                drop_font = fonts.get(12, bold=True)
+                drop_label = text_cache.render("SOLTAR", drop_font, (255, 80, 80))
                 self.screen.blit(drop_label, (ghost_x + (ghost_w - drop_label.get_width()) // 2,
                                                ghost_y + ghost_h + 4))
 
@@ -873,10 +1014,7 @@ class Renderer:
 
                 # Detectar hover del ratón sobre las opciones
                 mouse_pos = pygame.mouse.get_pos()
-                try:
-                    cm_font = pygame.font.SysFont(FONT_NAME, FONT_SIZE, bold=False)
-                except Exception:
-                    cm_font = pygame.font.Font(None, FONT_SIZE)
+                cm_font = fonts.get(FONT_SIZE)
 
                 for i, opt in enumerate(cm_options):
                     opt_y = cm_y + 4 + i * cm_line_h
@@ -886,7 +1024,7 @@ class Renderer:
                     if opt_rect.collidepoint(mouse_pos):
                         pygame.draw.rect(self.screen, self._COL_CONTEXT_HOVER, opt_rect)
 
-                    opt_surface = cm_font.render(opt["label"], True, COLORS["white"])
+                    opt_surface = text_cache.render(opt["label"], cm_font, COLORS["white"])
                     self.screen.blit(opt_surface, (cm_x + 10, opt_y + (cm_line_h - opt_surface.get_height()) // 2))
 
     # ── Helpers del grid (pixel ↔ celda) ──────────────────────────
@@ -1011,7 +1149,7 @@ class Renderer:
         # Título
         shop_name = shop.name if shop else "Tienda"
         title = f"=== {shop_name.upper()} ==="
-        title_surface = self.font.render(title, True, COLORS["white"])
+        title_surface = text_cache.render(title, self.font, COLORS["white"])
         self.screen.blit(
             title_surface,
             (shop_x + (shop_width - title_surface.get_width()) // 2, shop_y + 10)
@@ -1020,12 +1158,12 @@ class Renderer:
         # Oro del jugador
         gold_text = f"Tu oro: {player.gold}"
         gold_color = COLORS.get("gold", COLORS["message_important"])
-        gold_surface = self.font.render(gold_text, True, gold_color)
+        gold_surface = text_cache.render(gold_text, self.font, gold_color)
         self.screen.blit(gold_surface, (shop_x + shop_width - gold_surface.get_width() - 20, shop_y + 12))
         
         # Instrucciones
         instructions = "↑↓ Navegar    ENTER Comprar    ESC Cerrar"
-        instr_surface = self.font.render(instructions, True, COLORS["gray"])
+        instr_surface = text_cache.render(instructions, self.font, COLORS["gray"])
         self.screen.blit(instr_surface, (shop_x + 20, shop_y + 35))
         
         # Línea separadora
@@ -1044,7 +1182,7 @@ class Renderer:
         
         if not shop or not shop.items:
             empty_text = "No hay mercancía disponible."
-            empty_surface = self.font.render(empty_text, True, COLORS["gray"])
+            empty_surface = text_cache.render(empty_text, self.font, COLORS["gray"])
             self.screen.blit(empty_surface, (shop_x + 20, y_offset))
         else:
             for i, shop_item in enumerate(shop.items):
@@ -1074,7 +1212,7 @@ class Renderer:
                 
                 # Nombre del item + descripción
                 item_text = f"{prefix}{shop_item.name}  ({shop_item.description})"
-                item_surface = self.font.render(item_text, True, color)
+                item_surface = text_cache.render(item_text, self.font, color)
                 self.screen.blit(item_surface, (shop_x + 20, y_offset))
                 
                 # Precio (alineado a la derecha)
@@ -1082,7 +1220,7 @@ class Renderer:
                 price_color = color if can_afford else COLORS.get("message_death", COLORS["gray"])
                 if is_selected:
                     price_color = COLORS["black"]
-                price_surface = self.font.render(price_text, True, price_color)
+                price_surface = text_cache.render(price_text, self.font, price_color)
                 self.screen.blit(
                     price_surface,
                     (shop_x + shop_width - price_surface.get_width() - 20, y_offset)
@@ -1096,10 +1234,10 @@ class Renderer:
             selected_item = shop.items[cursor]
             if player.gold < selected_item.price:
                 info_text = f"Necesitas {selected_item.price - player.gold} monedas más."
-                info_surface = self.font.render(info_text, True, COLORS.get("message_death", COLORS["gray"]))
+                info_surface = text_cache.render(info_text, self.font, COLORS.get("message_death", COLORS["gray"]))
             else:
                 info_text = "Pulsa ENTER para comprar."
-                info_surface = self.font.render(info_text, True, COLORS["white"])
+                info_surface = text_cache.render(info_text, self.font, COLORS["white"])
             self.screen.blit(info_surface, (shop_x + 20, info_y))
     
     def _render_donation(
@@ -1144,7 +1282,7 @@ class Renderer:
         
         # Título
         title = "=== DONACIÓN ==="
-        title_surface = self.font.render(title, True, COLORS["white"])
+        title_surface = text_cache.render(title, self.font, COLORS["white"])
         self.screen.blit(
             title_surface,
             (panel_x + (panel_w - title_surface.get_width()) // 2, panel_y + 10)
@@ -1153,7 +1291,7 @@ class Renderer:
         # Oro del jugador
         gold_text = f"Tu oro: {player.gold}"
         gold_color = COLORS.get("gold", COLORS["message_important"])
-        gold_surface = self.font.render(gold_text, True, gold_color)
+        gold_surface = text_cache.render(gold_text, self.font, gold_color)
         self.screen.blit(
             gold_surface,
             (panel_x + (panel_w - gold_surface.get_width()) // 2, panel_y + 35)
@@ -1164,8 +1302,8 @@ class Renderer:
         units = amount % 10
         
         # Dimensiones de cada columna de dígito
-        digit_font = pygame.font.SysFont(FONT_NAME, FONT_SIZE + 10, bold=True)
-        arrow_font = pygame.font.SysFont(FONT_NAME, FONT_SIZE + 4)
+        digit_font = fonts.get(FONT_SIZE + 10, bold=True)
+        arrow_font = fonts.get(FONT_SIZE + 4)
         col_w = 50
         gap = 20
         total_w = col_w * 2 + gap
@@ -1183,14 +1321,14 @@ class Renderer:
             arrow_color = COLORS["white"] if is_active else COLORS.get("dark_gray", (60, 60, 60))
             
             # Flecha arriba ▲
-            up_surface = arrow_font.render("▲", True, arrow_color)
+            up_surface = text_cache.render("▲", arrow_font, arrow_color)
             self.screen.blit(
                 up_surface,
                 (cx - up_surface.get_width() // 2, center_y - 35)
             )
             
             # Dígito
-            digit_surface = digit_font.render(str(val), True, digit_color)
+            digit_surface = text_cache.render(str(val), digit_font, digit_color)
             self.screen.blit(
                 digit_surface,
                 (cx - digit_surface.get_width() // 2, center_y - 8)
@@ -1208,7 +1346,7 @@ class Renderer:
                 )
             
             # Flecha abajo ▼
-            down_surface = arrow_font.render("▼", True, arrow_color)
+            down_surface = text_cache.render("▼", arrow_font, arrow_color)
             self.screen.blit(
                 down_surface,
                 (cx - down_surface.get_width() // 2, center_y + 28)
@@ -1217,7 +1355,7 @@ class Renderer:
         # Total a donar
         total_text = f"Donar: {amount} oro"
         total_color = COLORS["white"] if amount > 0 else COLORS["gray"]
-        total_surface = self.font.render(total_text, True, total_color)
+        total_surface = text_cache.render(total_text, self.font, total_color)
         self.screen.blit(
             total_surface,
             (panel_x + (panel_w - total_surface.get_width()) // 2, panel_y + panel_h - 60)
@@ -1225,7 +1363,7 @@ class Renderer:
         
         # Instrucciones
         hint = "←→ Dígito   ↑↓ Valor   ENTER Donar   ESC Cancelar"
-        hint_surface = self.font.render(hint, True, COLORS.get("dark_gray", (80, 80, 80)))
+        hint_surface = text_cache.render(hint, self.font, COLORS.get("dark_gray", (80, 80, 80)))
         self.screen.blit(
             hint_surface,
             (panel_x + (panel_w - hint_surface.get_width()) // 2, panel_y + panel_h - 30)
@@ -1240,7 +1378,7 @@ class Renderer:
         
         # Texto de muerte
         death_text = "HAS MUERTO"
-        death_surface = self.font.render(death_text, True, COLORS["message_death"])
+        death_surface = text_cache.render(death_text, self.font, COLORS["message_death"])
         death_surface = pygame.transform.scale(
             death_surface,
             (death_surface.get_width() * 3, death_surface.get_height() * 3)
@@ -1253,7 +1391,7 @@ class Renderer:
         
         # Instrucciones
         restart_text = "Presiona [R] para reiniciar o [ESC] para salir"
-        restart_surface = self.font.render(restart_text, True, COLORS["white"])
+        restart_surface = text_cache.render(restart_text, self.font, COLORS["white"])
         self.screen.blit(
             restart_surface,
             ((WINDOW_WIDTH - restart_surface.get_width()) // 2,
@@ -1269,7 +1407,7 @@ class Renderer:
         
         # Texto de victoria
         victory_text = "¡VICTORIA!"
-        victory_surface = self.font.render(victory_text, True, COLORS["gold"])
+        victory_surface = text_cache.render(victory_text, self.font, COLORS["gold"])
         victory_surface = pygame.transform.scale(
             victory_surface,
             (victory_surface.get_width() * 3, victory_surface.get_height() * 3)
@@ -1282,7 +1420,7 @@ class Renderer:
         
         # Subtexto
         sub_text = "¡Has escapado con el Amuleto de Ámbar!"
-        sub_surface = self.font.render(sub_text, True, COLORS["amulet"])
+        sub_surface = text_cache.render(sub_text, self.font, COLORS["amulet"])
         self.screen.blit(
             sub_surface,
             ((WINDOW_WIDTH - sub_surface.get_width()) // 2,
@@ -1291,7 +1429,7 @@ class Renderer:
         
         # Instrucciones
         restart_text = "Presiona [R] para jugar de nuevo o [ESC] para salir"
-        restart_surface = self.font.render(restart_text, True, COLORS["white"])
+        restart_surface = text_cache.render(restart_text, self.font, COLORS["white"])
         self.screen.blit(
             restart_surface,
             ((WINDOW_WIDTH - restart_surface.get_width()) // 2,
@@ -1307,7 +1445,7 @@ class Renderer:
         
         # Título
         title_text = "PAUSA"
-        title_surface = self.font.render(title_text, True, COLORS["white"])
+        title_surface = text_cache.render(title_text, self.font, COLORS["white"])
         title_surface = pygame.transform.scale(
             title_surface,
             (title_surface.get_width() * 2, title_surface.get_height() * 2)
@@ -1340,7 +1478,7 @@ class Renderer:
                 text = option
                 color = COLORS["gray"]
             
-            opt_surface = self.font.render(text, True, color)
+            opt_surface = text_cache.render(text, self.font, color)
             self.screen.blit(
                 opt_surface,
                 ((WINDOW_WIDTH - opt_surface.get_width()) // 2, y_offset)
@@ -1350,7 +1488,7 @@ class Renderer:
         # Hint de controles
         hint_y = y_offset + 20
         hint_text = "[↑↓] Navegar   [Enter] Seleccionar   [ESC] Continuar"
-        hint_surface = self.font.render(hint_text, True, (100, 100, 100))
+        hint_surface = text_cache.render(hint_text, self.font, (100, 100, 100))
         self.screen.blit(
             hint_surface,
             ((WINDOW_WIDTH - hint_surface.get_width()) // 2, hint_y)
@@ -1382,7 +1520,7 @@ class Renderer:
         
         # Título
         title_text = "OPCIONES"
-        title_surface = self.font.render(title_text, True, COLORS["white"])
+        title_surface = text_cache.render(title_text, self.font, COLORS["white"])
         title_scaled = pygame.transform.scale(
             title_surface,
             (title_surface.get_width() * 2, title_surface.get_height() * 2)
@@ -1411,7 +1549,7 @@ class Renderer:
             vol_label = f"  Volumen: {vol_percent}%"
             vol_color = COLORS["gray"]
         
-        vol_surface = self.font.render(vol_label, True, vol_color)
+        vol_surface = text_cache.render(vol_label, self.font, vol_color)
         self.screen.blit(vol_surface, (panel_x + 30, vol_y))
         
         # Barra de volumen
@@ -1442,7 +1580,7 @@ class Renderer:
         # Hint de ajuste si está seleccionado
         if selected == 0:
             adj_text = "[← →] Ajustar volumen"
-            adj_surface = self.font.render(adj_text, True, (120, 120, 140))
+            adj_surface = text_cache.render(adj_text, self.font, (120, 120, 140))
             self.screen.blit(adj_surface, (panel_x + 50, bar_y + bar_height + 5))
         
         # === Opción 1: Volver ===
@@ -1454,7 +1592,7 @@ class Renderer:
             back_text = "  Volver"
             back_color = COLORS["gray"]
         
-        back_surface = self.font.render(back_text, True, back_color)
+        back_surface = text_cache.render(back_text, self.font, back_color)
         self.screen.blit(
             back_surface,
             ((WINDOW_WIDTH - back_surface.get_width()) // 2, back_y)
@@ -1463,7 +1601,7 @@ class Renderer:
         # Hint de controles al fondo del panel
         hint_y = panel_y + panel_h - FONT_SIZE - 10
         hint_text = "[↑↓] Navegar   [Enter] Seleccionar   [ESC] Volver"
-        hint_surface = self.font.render(hint_text, True, (80, 80, 90))
+        hint_surface = text_cache.render(hint_text, self.font, (80, 80, 90))
         self.screen.blit(
             hint_surface,
             ((WINDOW_WIDTH - hint_surface.get_width()) // 2, hint_y)
@@ -1506,22 +1644,13 @@ class Renderer:
             offset_x: Offset X en tiles (puede ser fraccionario)
             offset_y: Offset Y en tiles (puede ser fraccionario)
         """
-        # Usar cache para mejor rendimiento
-        cache_key = (char, color)
-        if cache_key not in self._char_cache:
-            self._char_cache[cache_key] = self.font.render(char, True, color)
-        
-        surface = self._char_cache[cache_key]
+        surface, center_offset_x, center_offset_y = self._glyph(char, color)
         
         # Calcular posición con offset
         pixel_x = int((x + offset_x) * TILE_SIZE)
         pixel_y = int((y + offset_y) * TILE_SIZE)
         
-        # Centrar el caracter en el tile
-        center_offset_x = (TILE_SIZE - surface.get_width()) // 2
-        center_offset_y = (TILE_SIZE - surface.get_height()) // 2
-        
-        self.screen.blit(surface, (pixel_x + center_offset_x, pixel_y + center_offset_y))
+        self._blit(surface, (pixel_x + center_offset_x, pixel_y + center_offset_y))
     
     def _draw_char(
         self,
@@ -1539,20 +1668,65 @@ class Renderer:
             char: Caracter a dibujar
             color: Color RGB
         """
-        # Usar cache para mejor rendimiento
-        cache_key = (char, color)
-        if cache_key not in self._char_cache:
-            self._char_cache[cache_key] = self.font.render(char, True, color)
+        surface, offset_x, offset_y = self._glyph(char, color)
+        self._blit(surface, (x * TILE_SIZE + offset_x, y * TILE_SIZE + offset_y))
+    
+    def _glyph(self, char: str, color: Tuple[int, int, int]) -> Tuple[pygame.Surface, int, int]:
+        """
+        Obtiene un caracter renderizado y su offset para centrarlo en el tile.
         
-        surface = self._char_cache[cache_key]
-        pixel_x = x * TILE_SIZE
-        pixel_y = y * TILE_SIZE
+        Args:
+            char: Caracter
+            color: Color RGB
+            
+        Returns:
+            Tupla (superficie, offset X, offset Y)
+        """
+        cache_key = (char, color)
+        glyph = self._char_cache.get(cache_key)
+        if glyph is None:
+            surface = self.font.render(char, True, color)
+            glyph = self._char_cache[cache_key] = (
+                surface,
+                (TILE_SIZE - surface.get_width()) // 2,
+                (TILE_SIZE - surface.get_height()) // 2,
+            )
+        return glyph
+    
+    def _blit(self, surface: pygame.Surface, dest: Tuple[int, int]) -> None:
+        """
+        Copia una superficie a self.screen (o la encola si hay un lote abierto).
         
-        # Centrar el caracter en el tile
-        offset_x = (TILE_SIZE - surface.get_width()) // 2
-        offset_y = (TILE_SIZE - surface.get_height()) // 2
+        Args:
+            surface: Superficie a copiar
+            dest: Posición en píxeles
+        """
+        if self._batch is not None:
+            self._batch.append((surface, dest))
+        else:
+            self.dirty.note(surface, self.screen.blit(surface, dest))
+    
+    @contextmanager
+    def _batched(self):
+        """
+        Agrupa los _draw_* del bloque en un solo Surface.blits.
         
-        self.screen.blit(surface, (pixel_x + offset_x, pixel_y + offset_y))
+        Dibujar una capa son miles de blits de 16x16; con uno por llamada
+        domina el coste de Python, no el de copiar píxeles. El orden se
+        conserva, así que el resultado es idéntico.
+        """
+        batch, self._batch = self._batch, []
+        try:
+            yield
+            pending = self._batch
+            if self.dirty.collecting:
+                rects = self.screen.blits(pending)
+                for (surface, _dest), rect in zip(pending, rects):
+                    self.dirty.note(surface, rect)
+            elif pending:
+                self.screen.blits(pending, doreturn=False)
+        finally:
+            self._batch = batch
     
     def _draw_sprite(
         self,
@@ -1568,9 +1742,7 @@ class Renderer:
             y: Posición Y (en tiles)
             sprite: Superficie de pygame con el sprite
         """
-        pixel_x = x * TILE_SIZE
-        pixel_y = y * TILE_SIZE
-        self.screen.blit(sprite, (pixel_x, pixel_y))
+        self._blit(sprite, (x * TILE_SIZE, y * TILE_SIZE))
     
     def _draw_sprite_with_offset(
         self,
@@ -1604,85 +1776,63 @@ class Renderer:
             pixel_x = int((x + offset_x) * TILE_SIZE)
             pixel_y = int((y + offset_y) * TILE_SIZE)
         
-        self.screen.blit(sprite, (pixel_x, pixel_y))
+        self._blit(sprite, (pixel_x, pixel_y))
     
-    def _render_interaction_prompts(
-        self, dungeon: Dungeon, player: Player, visible_tiles: Set[Tuple[int, int]]
-    ) -> None:
+    def _render_interaction_prompts(self, anchors: List[Tuple[int, int, int]]) -> None:
         """
         Renderiza el indicador [ESPACIO] sobre NPCs interactivos
         que estén adyacentes al jugador.
+        
+        Args:
+            anchors: (x, y, alto extra del sprite) de cada NPC, del modelo
         """
         import math
         
-        # Posiciones adyacentes al jugador (ortogonales + misma posición)
-        adjacent_positions = [
-            (player.x, player.y - 1),
-            (player.x, player.y + 1),
-            (player.x - 1, player.y),
-            (player.x + 1, player.y),
-            (player.x, player.y),
-        ]
+        if not anchors:
+            return
         
         # Fuente más pequeña para el indicador
-        try:
-            prompt_font = pygame.font.SysFont(FONT_NAME, 11, bold=True)
-        except Exception:
-            prompt_font = pygame.font.Font(None, 11)
+        prompt_font = fonts.get(11, bold=True)
         
         # Efecto de "respiración" sutil usando el tiempo
         ticks = pygame.time.get_ticks()
         pulse = int(25 * math.sin(ticks * 0.004))  # oscila ±25
         
-        for ax, ay in adjacent_positions:
-            if (ax, ay) not in visible_tiles:
-                continue
-            for entity in dungeon.entities:
-                if entity.x == ax and entity.y == ay:
-                    if hasattr(entity, 'interactive_text') and entity.interactive_text:
-                        # Verificar que el NPC no esté muerto
-                        fighter = getattr(entity, 'fighter', None)
-                        if fighter and fighter.is_dead:
-                            continue
-                        
-                        # Texto del prompt
-                        prompt_text = "ESPACIO"
-                        text_surface = prompt_font.render(prompt_text, True, (255, 255, 255))
-                        text_w = text_surface.get_width()
-                        text_h = text_surface.get_height()
-                        
-                        # Calcular offset extra para sprites más grandes que TILE_SIZE
-                        entity_sprite = getattr(entity, 'sprite', None)
-                        sprite_extra_h = 0
-                        if entity_sprite and entity_sprite.get_height() > TILE_SIZE:
-                            sprite_extra_h = entity_sprite.get_height() - TILE_SIZE
-                        
-                        # Posición: centrado sobre el sprite del NPC
-                        pixel_x = entity.x * TILE_SIZE + TILE_SIZE // 2
-                        pixel_y = entity.y * TILE_SIZE - sprite_extra_h - text_h - 4
-                        
-                        # Fondo con bordes redondeados
-                        padding_x = 4
-                        padding_y = 2
-                        bg_rect = pygame.Rect(
-                            pixel_x - text_w // 2 - padding_x,
-                            pixel_y - padding_y,
-                            text_w + padding_x * 2,
-                            text_h + padding_y * 2
-                        )
-                        
-                        # Fondo semi-transparente sin borde
-                        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-                        bg_color = (30, 30, 30, min(255, 200 + pulse))
-                        bg_surface.fill(bg_color)
-                        
-                        self.screen.blit(bg_surface, bg_rect.topleft)
-                        
-                        # Texto centrado
-                        self.screen.blit(
-                            text_surface,
-                            (pixel_x - text_w // 2, pixel_y)
-                        )
+        # Texto del prompt
+        prompt_text = "ESPACIO"
+        text_surface = text_cache.render(prompt_text, prompt_font, (255, 255, 255))
+        text_w = text_surface.get_width()
+        text_h = text_surface.get_height()
+        
+        for entity_x, entity_y, sprite_extra_h in anchors:
+            # Posición: centrado sobre el sprite del NPC
+            pixel_x = entity_x * TILE_SIZE + TILE_SIZE // 2
+            pixel_y = entity_y * TILE_SIZE - sprite_extra_h - text_h - 4
+            
+            # Fondo con bordes redondeados
+            padding_x = 4
+            padding_y = 2
+            bg_rect = pygame.Rect(
+                pixel_x - text_w // 2 - padding_x,
+                pixel_y - padding_y,
+                text_w + padding_x * 2,
+                text_h + padding_y * 2
+            )
+            
+            # Fondo semi-transparente sin borde
+            bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
+            bg_color = (30, 30, 30, min(255, 200 + pulse))
+            bg_surface.fill(bg_color)
+            
+            self.dirty.note(bg_surface, self.screen.blit(bg_surface, bg_rect.topleft))
+            # El fondo "respira": basta con repintar a ~20 FPS
+            self._schedule_wake(time.time() + 0.05)
+            
+            # Texto centrado
+            self.dirty.note(text_surface, self.screen.blit(
+                text_surface,
+                (pixel_x - text_w // 2, pixel_y)
+            ))
 
     def _render_damage_numbers(self) -> None:
         """Renderiza los números de daño flotantes y textos flotantes."""
@@ -1693,10 +1843,7 @@ class Renderer:
         
         # Crear fuente pequeña para números de daño (similar al tamaño de sprites)
         damage_font_size = TILE_SIZE  # 16 píxeles, igual que los sprites
-        try:
-            damage_font = pygame.font.SysFont(FONT_NAME, damage_font_size, bold=True)
-        except:
-            damage_font = pygame.font.Font(None, damage_font_size)
+        damage_font = fonts.get(damage_font_size, bold=True)
         
         for damage_num in self._current_animation_manager.get_damage_numbers():
             x, y = damage_num.get_position()
@@ -1728,15 +1875,15 @@ class Renderer:
             
             # Usar fuente ligeramente más grande para textos de rotura
             if damage_num.text is not None:
-                try:
-                    render_font = pygame.font.SysFont(FONT_NAME, damage_font_size + 1, bold=True)
-                except:
-                    render_font = pygame.font.Font(None, damage_font_size + 1)
+                render_font = fonts.get(damage_font_size + 1, bold=True)
             else:
                 render_font = damage_font
             
             # Crear superficie con el texto y aplicar alpha
-            text_surface = render_font.render(display_text, True, color)
+            text_surface = text_cache.render(display_text, render_font, color)
+            # La del cache es compartida: tachado y alpha sobre una copia
+            if damage_num.text_style == "strikethrough" or damage_num.alpha < 255:
+                text_surface = text_surface.copy()
             
             # Dibujar línea de tachado si el estilo lo requiere
             if damage_num.text_style == "strikethrough":
@@ -1755,7 +1902,7 @@ class Renderer:
             centered_x = pixel_x + (TILE_SIZE - text_width) // 2
             centered_y = pixel_y - text_height - 2  # Un poco arriba del sprite
             
-            self.screen.blit(text_surface, (centered_x, centered_y))
+            self.dirty.note(text_surface, self.screen.blit(text_surface, (centered_x, centered_y)))
     
     def show_splash_and_load(self) -> None:
         """
@@ -1845,15 +1992,16 @@ class Renderer:
         
         # --- Texto de estado debajo de la barra ---
         if status_text:
-            st_surf = self.font.render(status_text, True, COLORS["dark_gray"])
+            st_surf = text_cache.render(status_text, self.font, COLORS["dark_gray"])
             self.screen.blit(st_surf, (cx - st_surf.get_width() // 2, bar_y + bar_height + 10))
         
         # --- Prompt de continuar (parpadeo) ---
         if show_prompt:
-            prompt = self.font.render("Pulsa cualquier tecla para continuar", True, COLORS["gray"])
+            prompt = text_cache.render("Pulsa cualquier tecla para continuar", self.font, COLORS["gray"])
             self.screen.blit(prompt, (cx - prompt.get_width() // 2, bar_y + bar_height + 50))
         
         pygame.display.flip()
+        self.dirty.mark_full()
     
     def _render_save_menu(self, selected_index: int = 0, mode: str = "select") -> None:
         """Renderiza el menú de selección de guardados."""
@@ -1873,7 +2021,7 @@ class Renderer:
         
         y_offset = 80
         for line in title_lines:
-            line_surface = self.font.render(line, True, COLORS["white"])
+            line_surface = text_cache.render(line, self.font, COLORS["white"])
             self.screen.blit(
                 line_surface,
                 ((WINDOW_WIDTH - line_surface.get_width()) // 2, y_offset)
@@ -1903,23 +2051,23 @@ class Renderer:
             
             # Número del slot
             slot_num_text = f"Slot {slot.slot_id}"
-            slot_num_surface = self.font.render(slot_num_text, True, COLORS["white"])
+            slot_num_surface = text_cache.render(slot_num_text, self.font, COLORS["white"])
             self.screen.blit(slot_num_surface, (slot_rect.x + 15, slot_rect.y + 10))
             
             # Información del save
             if slot.exists:
                 info_text = slot.get_display_info()
-                info_surface = self.font.render(info_text, True, COLORS["gray"])
+                info_surface = text_cache.render(info_text, self.font, COLORS["gray"])
                 self.screen.blit(info_surface, (slot_rect.x + 15, slot_rect.y + 35))
                 
                 # Indicador de que es una partida guardada
                 saved_text = "Partida guardada"
-                saved_surface = self.font.render(saved_text, True, COLORS["message_heal"])
+                saved_surface = text_cache.render(saved_text, self.font, COLORS["message_heal"])
                 self.screen.blit(saved_surface, (slot_rect.x + 15, slot_rect.y + 55))
             else:
                 # Slot vacío
                 empty_text = "Slot vacío - Nueva partida"
-                empty_surface = self.font.render(empty_text, True, COLORS["gray"])
+                empty_surface = text_cache.render(empty_text, self.font, COLORS["gray"])
                 self.screen.blit(empty_surface, (slot_rect.x + 15, slot_rect.y + 35))
         
         # Instrucciones
@@ -1931,7 +2079,7 @@ class Renderer:
         ]
         y_inst = WINDOW_HEIGHT - 100
         for inst in instructions:
-            inst_surface = self.font.render(inst, True, COLORS["gray"])
+            inst_surface = text_cache.render(inst, self.font, COLORS["gray"])
             self.screen.blit(inst_surface, (WINDOW_WIDTH // 2 - 200, y_inst))
             y_inst += 22
     
@@ -1939,6 +2087,7 @@ class Renderer:
         """Renderiza solo el menú de guardados (sin necesidad de dungeon/player)."""
         self._render_save_menu(selected_index, mode)
         pygame.display.flip()
+        self.dirty.mark_full()
     
     def tick(self, fps: int) -> float:
         """
@@ -1971,22 +2120,22 @@ class Renderer:
         
         # Título de la consola
         title_text = "CONSOLA DE DESARROLLO (F1 para cerrar)"
-        title_surface = self.font.render(title_text, True, COLORS["message_important"])
+        title_surface = text_cache.render(title_text, self.font, COLORS["message_important"])
         self.screen.blit(title_surface, (10, console_y + 5))
         
         # Prompt
         prompt_text = "> "
-        prompt_surface = self.font.render(prompt_text, True, COLORS["white"])
+        prompt_surface = text_cache.render(prompt_text, self.font, COLORS["white"])
         self.screen.blit(prompt_surface, (10, console_y + 30))
         
         # Input del usuario
         input_text = console_input + "_"  # Cursor parpadeante (simple)
-        input_surface = self.font.render(input_text, True, COLORS["white"])
+        input_surface = text_cache.render(input_text, self.font, COLORS["white"])
         self.screen.blit(input_surface, (10 + prompt_surface.get_width(), console_y + 30))
         
         # Instrucciones
         help_text = "Escribe 'help' para ver comandos disponibles | ENTER para ejecutar | ESC para cerrar"
-        help_surface = self.font.render(help_text, True, COLORS["gray"])
+        help_surface = text_cache.render(help_text, self.font, COLORS["gray"])
         self.screen.blit(help_surface, (10, console_y + 55))
     
     def quit(self) -> None:
@@ -4,10 +4,20 @@ Carga y maneja sprites PNG para criaturas e items.
 """
 from __future__ import annotations
 import os
+from collections import OrderedDict
 from typing import Dict, Generator, List, Optional, Tuple
 import pygame
 
 from ..config import TILE_SIZE
+from ..systems.telemetry import telemetry
+
+
+# Variantes derivadas (tinte, rotación, alpha, tamaño) retenidas en el LRU
+VARIANT_CACHE_SIZE = 256
+
+# Paso de cuantización del alpha de las variantes (fundidos sin una
+# superficie por cada valor 0-255)
+ALPHA_STEP = 8
 
 
 class SpriteManager:
@@ -15,7 +25,9 @@ class SpriteManager:
     Gestor de sprites del juego.
     
     Carga sprites PNG desde carpetas y los escala al tamaño de tile.
-    Mantiene cache de sprites para mejor rendimiento.
+    Mantiene cache de sprites para mejor rendimiento, y un LRU acotado de
+    variantes derivadas (ver get_variant) para no crear superficies en
+    cada frame.
     """
     
     # Mapeo de tipos de monstruo a nombres de archivo
@@ -50,6 +62,8 @@ class SpriteManager:
     DECORATION_SPRITES: Dict[str, str] = {
         "blood": "blood.png",
         "ventanas": "ventanas.png",
+        "sofa": "sofa.png",  # Mobiliario del lobby (layouts/custom_layout.json)
+        "mesa": "mesa.png",
     }
     
     # Sprites de decoración animada (múltiples frames)
@@ -66,6 +80,8 @@ class SpriteManager:
     # Decoraciones que NO deben escalarse a TILE_SIZE (mantienen su tamaño original)
     NO_SCALE_DECORATIONS: set = {
         "ventanas",
+        "sofa",
+        "mesa",
     }
     
     # Mapeo de terreno especial (escaleras, puertas)
@@ -103,6 +119,11 @@ class SpriteManager:
         self._animated_decoration_cache: Dict[str, List[pygame.Surface]] = {}
         self._loaded = False
         
+        # LRU de variantes: clave → (sprite original, variante)
+        self._variant_cache: OrderedDict = OrderedDict()
+        self.variant_hits = 0
+        self.variant_misses = 0
+        
         # Ruta base a los sprites
         self._base_path = os.path.join(
             os.path.dirname(os.path.dirname(__file__)),
@@ -343,6 +364,71 @@ class SpriteManager:
             self.load_sprites()
         return self._animated_decoration_cache.get(deco_type)
     
+    def get_variant(
+        self,
+        sprite: pygame.Surface,
+        tint: Optional[Tuple[int, int, int]] = None,
+        angle: int = 0,
+        alpha: Optional[int] = None,
+        size: Optional[Tuple[int, int]] = None,
+    ) -> pygame.Surface:
+        """
+        Obtiene una variante derivada de un sprite, cacheada (LRU).
+        
+        Se aplica en orden: escalado, rotación, tinte y alpha. El alpha se
+        cuantiza a múltiplos de ALPHA_STEP.
+        
+        Args:
+            sprite: Sprite original (de los caches de este gestor)
+            tint: Color multiplicado sobre RGB (BLEND_RGB_MULT), o None
+            angle: Rotación en grados
+            alpha: Alpha de superficie (0-255), o None
+            size: Tamaño final (ancho, alto), o None
+            
+        Returns:
+            Superficie derivada (no modificarla: es compartida)
+        """
+        angle %= 360
+        if alpha is not None:
+            alpha = min(255, round(alpha / ALPHA_STEP) * ALPHA_STEP)
+        if size == sprite.get_size():
+            size = None
+        if tint is None and not angle and alpha is None and size is None:
+            return sprite
+        
+        key = (id(sprite), tint, angle, alpha, size)
+        entry = self._variant_cache.get(key)
+        # Comprobar identidad: el id de un sprite liberado puede reutilizarse
+        if entry is not None and entry[0] is sprite:
+            self._variant_cache.move_to_end(key)
+            self.variant_hits += 1
+            telemetry.count("sprites.variant.hits")
+            return entry[1]
+        
+        variant = sprite
+        if size is not None:
+            variant = pygame.transform.scale(variant, size)
+        if angle:
+            variant = pygame.transform.rotate(variant, angle)
+        if tint is not None or alpha is not None:
+            if variant is sprite:
+                variant = sprite.copy()
+            if tint is not None:
+                variant.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+            if alpha is not None:
+                variant.set_alpha(alpha)
+        
+        self._variant_cache[key] = (sprite, variant)
+        if len(self._variant_cache) > VARIANT_CACHE_SIZE:
+            self._variant_cache.popitem(last=False)
+        self.variant_misses += 1
+        telemetry.count("sprites.variant.misses")
+        return variant
+    
+    def clear_variants(self) -> None:
+        """Vacía el cache de variantes."""
+        self._variant_cache.clear()
+    
     def is_animated_decoration(self, deco_type: str) -> bool:
         """Verifica si una decoración es animada (tiene múltiples frames)."""
         if not self._loaded:
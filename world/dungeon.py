@@ -3,10 +3,9 @@ Clase Dungeon - Generación y gestión de mazmorras.
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING, List, Optional, Dict, Any, Tuple, Set
-import random
-
 from .tile import Tile, TileType
 from .room import Room
+from ..systems.rng import rng
 from ..config import (
     MAP_WIDTH, MAP_HEIGHT, ROOM_MIN_SIZE, ROOM_MAX_SIZE,
     MAX_ROOMS, MAX_ROOM_MONSTERS, MAX_DUNGEON_LEVEL,
@@ -17,6 +16,7 @@ from ..config import (
     FLOOR_GOLD_RANGE, FLOOR_GOLD_RANGE_DEFAULT,
     FLOOR_ROOM_COUNT, FLOOR_ROOM_COUNT_DEFAULT,
     FLOOR_MAP_MARGIN, FLOOR_MAP_MARGIN_DEFAULT,
+    FLOOR_GENERATOR, FLOOR_GENERATOR_DEFAULT,
 )
 
 if TYPE_CHECKING:
@@ -26,6 +26,17 @@ if TYPE_CHECKING:
     from ..items.item import Item
 
 
+# Versión del contenido generado: subirla cuando la misma (semilla, piso)
+# pase a generar otro mapa o población. Los pisos guardados como semilla +
+# diff con otra versión (o con otros datos de monstruos/objetos, ver
+# spawn_tables.signature) no se pueden regenerar: se descartan al cargar.
+GENERATION_VERSION = 3
+
+
+class FloorRestoreError(ValueError):
+    """Un piso guardado como semilla + diff ya no regenera el mismo contenido."""
+
+
 def _get_pool_spawn_chance(pool: str, floor: int = 0) -> float:
     """
     Devuelve la probabilidad de que una pool aparezca en un piso dado.
@@ -63,7 +74,8 @@ class Dungeon:
         self,
         width: int = MAP_WIDTH,
         height: int = MAP_HEIGHT,
-        floor: int = 1
+        floor: int = 1,
+        engine: Optional[str] = None
     ) -> None:
         """
         Inicializa una mazmorra vacía.
@@ -72,10 +84,12 @@ class Dungeon:
             width: Ancho del mapa
             height: Alto del mapa
             floor: Número de piso
+            engine: Motor de generación (None = el de FLOOR_GENERATOR)
         """
         self.width = width
         self.height = height
         self.floor = floor
+        self.engine = engine or FLOOR_GENERATOR.get(floor, FLOOR_GENERATOR_DEFAULT)
         
         # Crear mapa vacío (todo paredes/void)
         self.tiles: List[List[Tile]] = [
@@ -96,17 +110,112 @@ class Dungeon:
         
         # Para el jefe final
         self.boss_spawned: bool = False
+        
+        # Persistencia compacta (semilla + diff, ver to_dict)
+        self.seed: Optional[int] = None
+        self.loot_flags: Optional[Tuple[bool, bool]] = None
+        self.explored_cells: Set[Tuple[int, int]] = set()
+        self.door_cells: Set[Tuple[int, int]] = set()
+        self._tile_overrides: Set[Tuple[int, int]] = set()
+        self._baseline: Optional[Dict[str, list]] = None
+        
+        # Se incrementa al sustituir tiles tras generar (invalida la capa de terreno)
+        self.map_version: int = 0
+        
+        # Celdas libres barajadas por (pool, sala) para poblar sin reintentos
+        self._free_cells: Dict[Tuple[str, int], List[Tuple[int, int]]] = {}
+        
+        # Informe de alcanzabilidad de la última generación (ver world/validator.py)
+        self.validation: Optional[Dict[str, Any]] = None
     
-    def generate(self) -> Tuple[int, int]:
+    def generate(self, spawn_npcs: bool = True) -> Tuple[int, int]:
         """
         Genera la mazmorra proceduralmente.
         
+        Args:
+            spawn_npcs: Spawnear los NPCs del FSM y validar el piso al
+                terminar. La pre-generación en segundo plano lo desactiva;
+                spawnea y valida después en el hilo principal.
+        
         Returns:
             Posición inicial del jugador (centro de la primera habitación)
         """
+        from .generators import get_engine
+        
+        # Flujos deterministas para este piso (dependen solo de semilla + piso)
+        rng.begin_floor(self.floor)
+        self.seed = rng.active_seed
+        
+        engine = get_engine(self.engine)
+        if engine is None:
+            self._generate_rooms()
+            stairs_up = self.rooms[0].center if self.rooms else None
+            stairs_down = self.rooms[-1].center if self.rooms else None
+        else:
+            layout = engine.generate(self.width, self.height, self.floor, rng.generation)
+            self._apply_layout(layout.floor, layout.rooms)
+            stairs_up, stairs_down = layout.stairs_up, layout.stairs_down
+        
+        # Colocar escaleras
+        if self.rooms:
+            # Escaleras hacia arriba en la primera habitación (si no es piso 1)
+            if self.floor > 1:
+                up_x, up_y = stairs_up
+                self.tiles[up_x][up_y] = Tile(TileType.STAIRS_UP)
+                self.stairs_up = (up_x, up_y)
+            
+            # Escaleras hacia abajo en la última habitación (si no es el último piso)
+            if self.floor < MAX_DUNGEON_LEVEL:
+                down_x, down_y = stairs_down
+                self.tiles[down_x][down_y] = Tile(TileType.STAIRS_DOWN)
+                self.stairs_down = (down_x, down_y)
+        
+        # Colocar puertas en entradas de habitaciones (después de escaleras)
+        self._place_doors()
+        
+        # Poblar con monstruos e items
+        self._populate()
+        self._capture_baseline()
+        
+        # Spawn automático de NPCs basado en configuración de estados
+        # (la validación necesita los NPCs colocados: bloquean casillas)
+        if spawn_npcs:
+            self.spawn_npcs_from_states()
+            self.validate()
+        
+        # Retornar posición inicial (cerca de escaleras arriba o centro de primera habitación)
+        if self.stairs_up:
+            # Buscar posición adyacente a las escaleras
+            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+                nx, ny = self.stairs_up[0] + dx, self.stairs_up[1] + dy
+                if self.is_walkable(nx, ny):
+                    return (nx, ny)
+        
+        return self.rooms[0].center if self.rooms else (self.width // 2, self.height // 2)
+    
+    def validate(self) -> Dict[str, Any]:
+        """
+        Comprueba que todo es alcanzable (puertas transitables, NPCs bloquean).
+        
+        Debe llamarse con los NPCs del FSM ya spawneados. Guarda el informe
+        en `validation` y avisa por consola si el piso no pasa.
+        
+        Returns:
+            Informe de validate_dungeon()
+        """
+        from .validator import validate_dungeon, format_validation
+        
+        self.validation = validate_dungeon(self)
+        if not self.validation["ok"]:
+            for line in format_validation(self.validation, self.floor):
+                print(f"[Dungeon] {line}")
+        return self.validation
+    
+    def _generate_rooms(self) -> None:
+        """Algoritmo clásico: salas aleatorias unidas a la más cercana."""
         # Determinar número de salas para esta planta (progresivo)
         min_rooms, max_rooms = FLOOR_ROOM_COUNT.get(self.floor, FLOOR_ROOM_COUNT_DEFAULT)
-        target_rooms = random.randint(min_rooms, max_rooms)
+        target_rooms = rng.generation.randint(min_rooms, max_rooms)
         
         # Margen de colocación: concentra las salas en pisos con pocas
         margin_x, margin_y = FLOOR_MAP_MARGIN.get(self.floor, FLOOR_MAP_MARGIN_DEFAULT)
@@ -117,8 +226,8 @@ class Dungeon:
                 break
             
             # Tamaño aleatorio
-            w = random.randint(ROOM_MIN_SIZE, ROOM_MAX_SIZE)
-            h = random.randint(ROOM_MIN_SIZE, ROOM_MAX_SIZE)
+            w = rng.generation.randint(ROOM_MIN_SIZE, ROOM_MAX_SIZE)
+            h = rng.generation.randint(ROOM_MIN_SIZE, ROOM_MAX_SIZE)
             
             # Posición aleatoria dentro del área efectiva (con margen)
             x_min = 1 + margin_x
@@ -131,8 +240,8 @@ class Dungeon:
                 x_min, x_max = 1, self.width - w - 2
                 y_min, y_max = 1, self.height - h - 2
             
-            x = random.randint(x_min, x_max)
-            y = random.randint(y_min, y_max)
+            x = rng.generation.randint(x_min, x_max)
+            y = rng.generation.randint(y_min, y_max)
             
             new_room = Room(x, y, w, h)
             
@@ -146,36 +255,20 @@ class Dungeon:
                     self._create_tunnel(nearest.center, new_room.center)
                 
                 self.rooms.append(new_room)
+    
+    def _apply_layout(self, floor_mask, rooms: List[Room]) -> None:
+        """
+        Convierte el resultado de un motor de generación en tiles.
         
-        # Colocar escaleras
-        if self.rooms:
-            # Escaleras hacia arriba en la primera habitación (si no es piso 1)
-            if self.floor > 1:
-                up_x, up_y = self.rooms[0].center
-                self.tiles[up_x][up_y] = Tile(TileType.STAIRS_UP)
-                self.stairs_up = (up_x, up_y)
-            
-            # Escaleras hacia abajo en la última habitación (si no es el último piso)
-            if self.floor < MAX_DUNGEON_LEVEL:
-                down_x, down_y = self.rooms[-1].center
-                self.tiles[down_x][down_y] = Tile(TileType.STAIRS_DOWN)
-                self.stairs_down = (down_x, down_y)
-        
-        # Colocar puertas en entradas de habitaciones (después de escaleras)
-        self._place_doors()
-        
-        # Poblar con monstruos e items
-        self._populate()
-        
-        # Retornar posición inicial (cerca de escaleras arriba o centro de primera habitación)
-        if self.stairs_up:
-            # Buscar posición adyacente a las escaleras
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                nx, ny = self.stairs_up[0] + dx, self.stairs_up[1] + dy
-                if self.is_walkable(nx, ny):
-                    return (nx, ny)
-        
-        return self.rooms[0].center if self.rooms else (self.width // 2, self.height // 2)
+        Args:
+            floor_mask: Máscara booleana (ancho, alto) de suelo
+            rooms: Salas del layout
+        """
+        self.rooms = rooms
+        xs, ys = floor_mask.nonzero()
+        tiles = self.tiles
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            tiles[x][y] = Tile(TileType.FLOOR)
     
     def _create_room(self, room: Room) -> None:
         """
@@ -201,7 +294,7 @@ class Dungeon:
         x2, y2 = end
         
         # Decidir aleatoriamente si ir horizontal o vertical primero
-        if random.random() < 0.5:
+        if rng.generation.random() < 0.5:
             # Horizontal primero
             self._create_h_tunnel(x1, x2, y1)
             self._create_v_tunnel(y1, y2, x2)
@@ -230,7 +323,7 @@ class Dungeon:
         Si una habitación tiene puertas, TODAS sus entradas las reciben.
         """
         for room in self.rooms:
-            if random.random() > DOOR_CHANCE:
+            if rng.generation.random() > DOOR_CHANCE:
                 continue
             
             candidates = self._find_door_candidates(room)
@@ -244,6 +337,7 @@ class Dungeon:
                 self.tiles[x][y] = Tile(TileType.DOOR)
                 self.tiles[x][y].is_open = False
                 self.tiles[x][y].orientation = orientation
+                self.door_cells.add((x, y))
     
     def _find_door_candidates(self, room: Room) -> List[Tuple[int, int, str]]:
         """
@@ -317,19 +411,21 @@ class Dungeon:
           3. ¿Cuál concreto? → selección por rarity + min_level
           4. Reparto → round-robin entre salas
         """
-        from ..entities.monster import Monster, create_monster_for_floor
-        from ..items.item import create_item, _create_random_equipment, _create_random_potion
+        from ..entities.monster import Monster
+        from ..items.item import create_item
+        from ..systems.spawn_tables import spawn_tables
         
         eligible_rooms = self.rooms[1:]  # Excluir sala de spawn
         
         # --- Monstruos (por habitación) ---
         for room in eligible_rooms:
-            num_monsters = random.randint(0, min(MAX_ROOM_MONSTERS, 1 + self.floor // 2))
-            for _ in range(num_monsters):
-                x, y = self._get_random_room_position(room)
-                if not self.get_blocking_entity_at(x, y):
-                    monster = create_monster_for_floor(self.floor, x, y, self)
-                    self.entities.append(monster)
+            num_monsters = rng.generation.randint(0, min(MAX_ROOM_MONSTERS, 1 + self.floor // 2))
+            cells = self._room_free_cells(room, "monsters", rng.generation)
+            for monster_type in spawn_tables.monster_types(self.floor, num_monsters, rng.generation):
+                if not cells:
+                    break
+                x, y = cells.pop()
+                self.entities.append(Monster(x, y, monster_type, self))
         
         # --- Items: desbloqueo progresivo por narrativa ---
         # Fase 1: Sin items (primera run, va a puños)
@@ -337,33 +433,40 @@ class Dungeon:
         # Fase 3: Todo (equipo + pociones + oro)
         from ..systems.events import event_manager
         
-        weapons_unlocked = event_manager.is_event_triggered("stranger_lobby_weapons_unlocked")
-        potions_unlocked = event_manager.is_event_triggered("stranger_lobby_potions_unlocked")
+        # Se guardan para poder regenerar el piso igual al cargarlo
+        if self.loot_flags is None:
+            self.loot_flags = (
+                event_manager.is_event_triggered("stranger_lobby_weapons_unlocked"),
+                event_manager.is_event_triggered("stranger_lobby_potions_unlocked"),
+            )
+        weapons_unlocked, potions_unlocked = self.loot_flags
         
         if weapons_unlocked and eligible_rooms:
             # Pool 1: Equipo (armas + armaduras)
-            if random.random() < _get_pool_spawn_chance("equipment", self.floor):
+            if rng.loot.random() < _get_pool_spawn_chance("equipment", self.floor):
                 lo, hi = FLOOR_EQUIPMENT_RANGE.get(self.floor, FLOOR_EQUIPMENT_RANGE_DEFAULT)
-                count = random.randint(lo, hi)
+                count = rng.loot.randint(lo, hi)
+                keys = iter(spawn_tables.equipment_keys(self.floor, count, rng.loot))
                 self._distribute_items_round_robin(
                     eligible_rooms, count,
-                    lambda x, y: _create_random_equipment(self.floor, x, y)
+                    lambda x, y: create_item(next(keys), x, y)
                 )
             
             if potions_unlocked:
                 # Pool 2: Pociones
-                if random.random() < _get_pool_spawn_chance("potion", self.floor):
+                if rng.loot.random() < _get_pool_spawn_chance("potion", self.floor):
                     lo, hi = FLOOR_POTION_RANGE.get(self.floor, FLOOR_POTION_RANGE_DEFAULT)
-                    count = random.randint(lo, hi)
+                    count = rng.loot.randint(lo, hi)
+                    potions = iter(spawn_tables.potion_keys(count, rng.loot))
                     self._distribute_items_round_robin(
                         eligible_rooms, count,
-                        lambda x, y: _create_random_potion(x, y)
+                        lambda x, y: create_item(next(potions), x, y)
                     )
                 
                 # Pool 3: Oro
-                if random.random() < _get_pool_spawn_chance("gold", self.floor):
+                if rng.loot.random() < _get_pool_spawn_chance("gold", self.floor):
                     lo, hi = FLOOR_GOLD_RANGE.get(self.floor, FLOOR_GOLD_RANGE_DEFAULT)
-                    count = random.randint(lo, hi)
+                    count = rng.loot.randint(lo, hi)
                     self._distribute_items_round_robin(
                         eligible_rooms, count,
                         lambda x, y: create_item("gold", x, y)
@@ -372,49 +475,91 @@ class Dungeon:
         # Spawn del jefe en el último piso
         if self.floor == MAX_DUNGEON_LEVEL and not self.boss_spawned:
             self._spawn_boss()
-        
-        # Spawn automático de NPCs basado en configuración de estados
-        self.spawn_npcs_from_states()
     
     def _distribute_items_round_robin(
         self,
         rooms: List[Room],
         count: int,
-        item_factory,
-        max_retries: int = 3
+        item_factory
     ) -> None:
         """Distribuye items entre salas con round-robin barajado.
         
         Recorre las salas en orden aleatorio y cicla al acabar la lista,
         re-barajando en cada vuelta. Esto reparte items de forma uniforme
-        sin hardcodear límites por sala.
+        sin hardcodear límites por sala. Cada item saca una celda de la
+        pool de la sala, así que nunca hay reintentos; las salas llenas
+        salen de la rotación.
         
         Args:
             rooms: Salas elegibles
             count: Número de items a colocar
             item_factory: Callable(x, y) -> Item
-            max_retries: Reintentos por item si la posición está ocupada
         """
-        if not rooms:
-            return
-        
         # Crear cola round-robin barajada
         queue: List[Room] = []
+        remaining = count
         
-        for _ in range(count):
+        while remaining > 0:
             # Rellenar y re-barajar cuando se agota la cola
             if not queue:
-                queue = list(rooms)
-                random.shuffle(queue)
+                queue = [room for room in rooms if self._room_free_cells(room, "items", rng.loot)]
+                if not queue:
+                    return  # Todas las salas llenas
+                rng.loot.shuffle(queue)
             
             room = queue.pop()
-            for _retry in range(max_retries):
-                x, y = self._get_random_room_position(room)
-                if not self.get_item_at(x, y):
-                    item = item_factory(x, y)
-                    if item:
-                        self.items.append(item)
-                    break
+            cells = self._room_free_cells(room, "items", rng.loot)
+            if not cells:
+                continue
+            x, y = cells.pop()
+            item = item_factory(x, y)
+            if item:
+                self.items.append(item)
+            else:
+                self._release_room_cell(room, "items", (x, y))
+            remaining -= 1
+    
+    def _room_free_cells(self, room: Room, pool: str, rand) -> List[Tuple[int, int]]:
+        """
+        Devuelve la pool de celdas libres de una sala (se crea la primera vez).
+        
+        La pool es una lista barajada: pop() saca una celda aleatoria en
+        O(1). Monstruos e items usan pools distintas porque un item puede
+        estar bajo un monstruo. Excluye escaleras.
+        
+        Args:
+            room: Sala
+            pool: Nombre de la pool ("monsters", "items")
+            rand: Flujo aleatorio con el que barajar al crearla
+            
+        Returns:
+            Lista de celdas libres (se modifica al sacar celdas)
+        """
+        key = (pool, id(room))
+        cells = self._free_cells.get(key)
+        if cells is None:
+            blocked = (self.stairs_up, self.stairs_down)
+            tiles = self.tiles
+            cells = [
+                (x, y)
+                for x in range(room.x + 1, room.x2)
+                for y in range(room.y + 1, room.y2)
+                if tiles[x][y].walkable and (x, y) not in blocked
+            ]
+            rand.shuffle(cells)
+            self._free_cells[key] = cells
+        return cells
+    
+    def _release_room_cell(self, room: Room, pool: str, cell: Tuple[int, int]) -> None:
+        """
+        Devuelve una celda a la pool de su sala (O(1)).
+        
+        Args:
+            room: Sala
+            pool: Nombre de la pool
+            cell: Celda a devolver
+        """
+        self._free_cells.setdefault((pool, id(room)), []).append(cell)
     
     def _spawn_boss(self) -> None:
         """Spawnea el jefe final y el amuleto."""
@@ -465,8 +610,8 @@ class Dungeon:
         Returns:
             Posición (x, y)
         """
-        x = random.randint(room.x + 1, room.x2 - 1)
-        y = random.randint(room.y + 1, room.y2 - 1)
+        x = rng.generation.randint(room.x + 1, room.x2 - 1)
+        y = rng.generation.randint(room.y + 1, room.y2 - 1)
         return (x, y)
     
     def is_walkable(self, x: int, y: int) -> bool:
@@ -614,11 +759,89 @@ class Dungeon:
             if 0 <= vx < self.width and 0 <= vy < self.height:
                 self.tiles[vx][vy].visible = True
                 self.tiles[vx][vy].explored = True
+                self.explored_cells.add((vx, vy))
         
         return visible
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Serializa la mazmorra a diccionario."""
+    def set_tile(self, x: int, y: int, tile: Tile) -> None:
+        """
+        Sustituye un tile después de la generación.
+        
+        Los tiles cambiados así se guardan en el diff del piso; asignar
+        directamente en self.tiles no quedaría registrado.
+        
+        Args:
+            x: Coordenada X
+            y: Coordenada Y
+            tile: Nuevo tile
+        """
+        self.tiles[x][y] = tile
+        self._tile_overrides.add((x, y))
+        self.map_version += 1
+        if tile.tile_type == TileType.DOOR:
+            self.door_cells.add((x, y))
+    
+    def _capture_baseline(self) -> None:
+        """Guarda el contenido recién generado para calcular el diff al guardar."""
+        self._baseline = {
+            "entities": list(self.entities),
+            "entity_data": [e.to_dict() for e in self.entities],
+            "items": list(self.items),
+            "item_data": [i.to_dict() for i in self.items],
+        }
+    
+    @staticmethod
+    def _diff_objects(current: list, generated: list, generated_data: list) -> Tuple[List[int], list]:
+        """
+        Compara objetos actuales con los generados.
+        
+        Args:
+            current: Entidades u objetos actuales
+            generated: Los que había tras la generación (mismas instancias)
+            generated_data: Su to_dict() tras la generación
+            
+        Returns:
+            Tupla (índices generados que ya no están intactos,
+            to_dict() de los añadidos o modificados)
+        """
+        present = {id(obj): obj for obj in current}
+        removed = []
+        for index, (obj, data) in enumerate(zip(generated, generated_data)):
+            if id(obj) not in present:
+                removed.append(index)
+            elif obj.to_dict() == data:
+                del present[id(obj)]
+            else:
+                removed.append(index)
+        return removed, [obj.to_dict() for obj in current if id(obj) in present]
+    
+    @staticmethod
+    def _encode_cells(cells: Set[Tuple[int, int]], height: int) -> List[List[int]]:
+        """Codifica celdas como tramos [inicio, longitud] de índices x * alto + y."""
+        runs: List[List[int]] = []
+        for index in sorted(x * height + y for x, y in cells):
+            if runs and runs[-1][0] + runs[-1][1] == index:
+                runs[-1][1] += 1
+            else:
+                runs.append([index, 1])
+        return runs
+    
+    def to_dict(self, compact: bool = True) -> Dict[str, Any]:
+        """
+        Serializa la mazmorra a diccionario.
+        
+        Un piso generado se guarda como semilla + diff: lo explorado,
+        puertas abiertas, tiles cambiados, entidades/objetos quitados o
+        añadidos y decoraciones. El mapa se regenera al cargar, así que el
+        tamaño depende de lo que cambió el jugador y no del área.
+        
+        Args:
+            compact: False = guardar todos los tiles (formato completo).
+                Los pisos cargados de guardados antiguos, sin semilla,
+                siempre usan el formato completo.
+        """
+        if compact and self.seed is not None and self._baseline is not None:
+            return self._to_diff_dict()
         return {
             "width": self.width,
             "height": self.height,
@@ -639,12 +862,148 @@ class Dungeon:
             "decorations": {f"{x},{y}": {"type": v[0], "angle": v[1]} for (x, y), v in self.decorations.items()},
         }
     
+    def _to_diff_dict(self) -> Dict[str, Any]:
+        """Serializa la mazmorra como semilla + diff (ver to_dict)."""
+        from ..systems.spawn_tables import spawn_tables
+        
+        baseline = self._baseline
+        removed_entities, entities = self._diff_objects(
+            self.entities, baseline["entities"], baseline["entity_data"]
+        )
+        removed_items, items = self._diff_objects(
+            self.items, baseline["items"], baseline["item_data"]
+        )
+        return {
+            "width": self.width,
+            "height": self.height,
+            "floor": self.floor,
+            "version": GENERATION_VERSION,
+            "seed": self.seed,
+            "engine": self.engine,
+            "loot_flags": list(self.loot_flags),
+            # Para detectar un generador o unos datos distintos al cargar
+            "rooms": [[r.x, r.y, r.width, r.height] for r in self.rooms],
+            "content": spawn_tables.signature,
+            "explored": self._encode_cells(self.explored_cells, self.height),
+            "open_doors": sorted(
+                [x, y] for x, y in self.door_cells - self._tile_overrides
+                if self.tiles[x][y].tile_type == TileType.DOOR and self.tiles[x][y].is_open
+            ),
+            "tiles": [[x, y, self.tiles[x][y].to_dict()] for x, y in sorted(self._tile_overrides)],
+            "removed_entities": removed_entities,
+            "entities": entities,
+            "removed_items": removed_items,
+            "items": items,
+            "boss_spawned": self.boss_spawned,
+            "decorations": {f"{x},{y}": {"type": v[0], "angle": v[1]} for (x, y), v in self.decorations.items()},
+        }
+    
+    @staticmethod
+    def _entity_from_dict(entity_data: Dict[str, Any], dungeon: Dungeon) -> Entity:
+        """Restaura un monstruo o un NPC genérico desde su diccionario."""
+        from ..entities.monster import Monster
+        from ..entities.entity import Entity
+        from ..ui.sprite_manager import sprite_manager
+        
+        # Determinar si es un monstruo o un NPC genérico (Entity)
+        if entity_data.get("monster_type"):
+            # Es un monstruo
+            return Monster.from_dict(entity_data, dungeon)
+        
+        # Es un NPC genérico - usar sistema FSM para restaurar sprite
+        entity = Entity.from_dict(entity_data, dungeon)
+        sprite = sprite_manager.get_creature_sprite(entity.name.lower())
+        if sprite:
+            entity.sprite = sprite
+        return entity
+    
+    @staticmethod
+    def _restore_decorations(dungeon: Dungeon, data: Dict[str, Any]) -> None:
+        """Restaura las decoraciones (sangre, etc.)."""
+        for key, deco_data in data.get("decorations", {}).items():
+            x, y = map(int, key.split(","))
+            if isinstance(deco_data, dict):
+                dungeon.decorations[(x, y)] = (deco_data["type"], deco_data.get("angle", 0))
+            else:
+                dungeon.decorations[(x, y)] = (deco_data, 0)
+    
+    @classmethod
+    def _from_diff_dict(cls, data: Dict[str, Any]) -> Dungeon:
+        """
+        Regenera una mazmorra desde su semilla y aplica el diff guardado.
+        
+        La regeneración usa flujos aislados: no altera las tiradas de la
+        partida en curso.
+        
+        Los índices de removed_entities/removed_items son posiciones en la
+        población regenerada: si los datos de monstruos u objetos cambiaron
+        apuntarían a otros objetos, así que ese caso también se rechaza.
+        
+        Raises:
+            FloorRestoreError: Si el piso no se puede regenerar igual
+        """
+        from ..items.item import Item
+        from ..systems.spawn_tables import spawn_tables
+        
+        if data.get("version", 1) != GENERATION_VERSION:
+            raise FloorRestoreError(
+                f"El piso {data['floor']} se guardó con otra versión de la generación "
+                f"({data.get('version', 1)}, actual {GENERATION_VERSION})"
+            )
+        # Guardados anteriores a la huella: se confía en la versión
+        if data.get("content", spawn_tables.signature) != spawn_tables.signature:
+            raise FloorRestoreError(
+                f"El piso {data['floor']} se guardó con otros datos de monstruos u objetos"
+            )
+        
+        dungeon = cls(data["width"], data["height"], data["floor"], engine=data["engine"])
+        dungeon.loot_flags = tuple(data["loot_flags"])
+        with rng.isolated(seed=data["seed"]):
+            dungeon.generate(spawn_npcs=False)
+        
+        if [[r.x, r.y, r.width, r.height] for r in dungeon.rooms] != data["rooms"]:
+            raise FloorRestoreError(
+                f"El piso {dungeon.floor} no se puede regenerar desde su semilla "
+                f"(motor '{dungeon.engine}' distinto o no disponible)"
+            )
+        
+        # Explorado
+        height = dungeon.height
+        for start, length in data["explored"]:
+            for index in range(start, start + length):
+                x, y = divmod(index, height)
+                dungeon.tiles[x][y].explored = True
+                dungeon.explored_cells.add((x, y))
+        
+        # Puertas abiertas y tiles cambiados
+        for x, y in data["open_doors"]:
+            dungeon.tiles[x][y].is_open = True
+        for x, y, tile_data in data["tiles"]:
+            dungeon.set_tile(x, y, Tile.from_dict(tile_data))
+        
+        # Entidades y objetos: quitar los que cambiaron y añadir los guardados
+        removed = set(data["removed_entities"])
+        dungeon.entities = [e for i, e in enumerate(dungeon.entities) if i not in removed]
+        dungeon.entities.extend(cls._entity_from_dict(e, dungeon) for e in data["entities"])
+        removed = set(data["removed_items"])
+        dungeon.items = [item for i, item in enumerate(dungeon.items) if i not in removed]
+        dungeon.items.extend(Item.from_dict(item_data) for item_data in data["items"])
+        
+        dungeon.boss_spawned = data.get("boss_spawned", False)
+        cls._restore_decorations(dungeon, data)
+        
+        # Asegurar que los NPCs estén en el estado correcto usando el sistema FSM
+        dungeon.spawn_npcs_from_states()
+        return dungeon
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Dungeon:
-        """Crea una mazmorra desde un diccionario."""
-        from ..entities.monster import Monster
+        """Crea una mazmorra desde un diccionario (formato completo o semilla + diff)."""
         from ..items.item import Item
         
+        if "seed" in data:
+            return cls._from_diff_dict(data)
+        
         dungeon = cls(data["width"], data["height"], data["floor"])
         
         # Restaurar tiles
@@ -659,24 +1018,8 @@ class Dungeon:
         ]
         
         # Restaurar entidades (monstruos y NPCs)
-        from ..entities.entity import Entity
-        from ..ui.sprite_manager import sprite_manager
-        
         for entity_data in data["entities"]:
-            # Determinar si es un monstruo o un NPC genérico (Entity)
-            if entity_data.get("monster_type"):
-                # Es un monstruo
-                entity = Monster.from_dict(entity_data, dungeon)
-            else:
-                # Es un NPC genérico - usar sistema FSM para restaurar sprite
-                entity = Entity.from_dict(entity_data, dungeon)
-                
-                # Restaurar sprite usando el sistema genérico del FSM
-                sprite = sprite_manager.get_creature_sprite(entity.name.lower())
-                if sprite:
-                    entity.sprite = sprite
-            
-            dungeon.entities.append(entity)
+            dungeon.entities.append(cls._entity_from_dict(entity_data, dungeon))
         
         # Restaurar items
         for item_data in data["items"]:
@@ -688,12 +1031,7 @@ class Dungeon:
         dungeon.boss_spawned = data.get("boss_spawned", False)
         
         # Restaurar decoraciones (sangre, etc.)
-        for key, deco_data in data.get("decorations", {}).items():
-            x, y = map(int, key.split(","))
-            if isinstance(deco_data, dict):
-                dungeon.decorations[(x, y)] = (deco_data["type"], deco_data.get("angle", 0))
-            else:
-                dungeon.decorations[(x, y)] = (deco_data, 0)
+        cls._restore_decorations(dungeon, data)
         
         # Asegurar que los NPCs estén en el estado correcto usando el sistema FSM
         # Esto reemplaza cualquier NPC cargado con uno creado usando el FSM
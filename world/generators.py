@@ -0,0 +1,323 @@
+"""
+Motores de generación de mapas intercambiables.
+
+`Dungeon.generate` usa por defecto su algoritmo clásico (rectángulos
+aleatorios sobre objetos Tile). Los motores de este módulo trabajan sobre
+arrays de NumPy y están pensados para mapas grandes (500×500 o más):
+
+- "bsp": partición binaria del espacio, una sala por hoja y pasillos
+  entre hermanos del árbol.
+- "caves": cuevas por autómata celular alrededor de cámaras
+  rectangulares unidas por túneles.
+
+Cada motor devuelve un `GeneratedLayout`: máscara de suelo, salas
+(`Room`, con el mismo convenio de paredes que el algoritmo clásico) y
+escaleras. La mazmorra convierte la máscara en tiles y sigue con sus
+pasos habituales (`_place_doors`, `_populate`), que solo necesitan salas.
+
+NumPy es opcional: sin él `get_engine` devuelve None y se usa el
+algoritmo clásico.
+
+Para añadir un motor: subclase de `GeneratorEngine` + `register_engine()`.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import random
+
+from .room import Room
+from ..config import ROOM_MIN_SIZE, ROOM_MAX_SIZE
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+
+# Nombre del algoritmo clásico de Dungeon (no es un motor de este módulo)
+CLASSIC_ENGINE = "classic"
+
+
+@dataclass
+class GeneratedLayout:
+    """
+    Resultado de un motor de generación.
+
+    Attributes:
+        floor: Máscara booleana (ancho, alto) de celdas transitables
+        rooms: Salas rectangulares (paredes en x, x2, y, y2)
+        stairs_up: Centro de la sala de entrada
+        stairs_down: Centro de la sala más alejada de la entrada
+    """
+    floor: Any
+    rooms: List[Room]
+    stairs_up: Optional[Tuple[int, int]] = None
+    stairs_down: Optional[Tuple[int, int]] = None
+
+
+class GeneratorEngine:
+    """
+    Interfaz de un motor de generación.
+
+    Attributes:
+        name: Nombre con el que se registra y se elige en config
+    """
+
+    name: str = ""
+
+    def generate(self, width: int, height: int, floor: int,
+                 rand: random.Random) -> GeneratedLayout:
+        """
+        Genera un mapa.
+
+        Args:
+            width: Ancho del mapa
+            height: Alto del mapa
+            floor: Número de piso
+            rand: Flujo aleatorio (rng.generation) para ser determinista
+
+        Returns:
+            Layout generado
+        """
+        raise NotImplementedError
+
+
+def _carve_tunnel(floor, start: Tuple[int, int], end: Tuple[int, int],
+                  horizontal_first: bool) -> None:
+    """
+    Cava un túnel en L entre dos puntos sobre la máscara.
+
+    Args:
+        floor: Máscara de suelo (se modifica)
+        start: Punto inicial (x, y)
+        end: Punto final (x, y)
+        horizontal_first: Tramo horizontal primero (en la fila de start)
+    """
+    (x1, y1), (x2, y2) = start, end
+    corner = (x2, y1) if horizontal_first else (x1, y2)
+    floor[min(x1, x2):max(x1, x2) + 1, corner[1]] = True
+    floor[corner[0], min(y1, y2):max(y1, y2) + 1] = True
+
+
+def _with_stairs(floor, rooms: List[Room]) -> GeneratedLayout:
+    """
+    Completa un layout con escaleras en la primera y la sala más lejana.
+
+    La sala de bajada se mueve al final de la lista: `_populate` y el
+    jefe final usan rooms[-1] como sala de las escaleras.
+
+    Args:
+        floor: Máscara de suelo
+        rooms: Salas generadas (rooms[0] es la de entrada)
+
+    Returns:
+        Layout con escaleras
+    """
+    if not rooms:
+        return GeneratedLayout(floor, rooms)
+
+    start_x, start_y = rooms[0].center
+    centers = np.array([room.center for room in rooms])
+    distances = (centers[:, 0] - start_x) ** 2 + (centers[:, 1] - start_y) ** 2
+    farthest = int(distances.argmax())
+    if farthest:
+        rooms.append(rooms.pop(farthest))
+    return GeneratedLayout(floor, rooms, rooms[0].center, rooms[-1].center)
+
+
+class BSPEngine(GeneratorEngine):
+    """
+    Partición binaria del espacio.
+
+    Divide el mapa recursivamente hasta hojas de tamaño `leaf_size`, pone
+    una sala en cada hoja y une cada par de subárboles hermanos con un
+    túnel, así que el mapa siempre es conexo.
+    """
+
+    name = "bsp"
+
+    def __init__(self, leaf_size: int = ROOM_MAX_SIZE + 6) -> None:
+        """
+        Args:
+            leaf_size: Tamaño máximo de una hoja antes de dividirla
+        """
+        self.leaf_size = leaf_size
+
+    def generate(self, width: int, height: int, floor: int,
+                 rand: random.Random) -> GeneratedLayout:
+        mask = np.zeros((width, height), dtype=bool)
+        rooms: List[Room] = []
+
+        def split(x: int, y: int, w: int, h: int) -> Optional[Room]:
+            """Divide un rectángulo y devuelve una sala representativa."""
+            can_split_x = w > self.leaf_size
+            can_split_y = h > self.leaf_size
+            if can_split_x or can_split_y:
+                vertical = can_split_x and (not can_split_y or w / h >= 1.25 or
+                                            (h / w < 1.25 and rand.random() < 0.5))
+                size = w if vertical else h
+                cut = rand.randint(size * 2 // 5, size * 3 // 5)
+                if vertical:
+                    first, second = split(x, y, cut, h), split(x + cut, y, w - cut, h)
+                else:
+                    first, second = split(x, y, w, cut), split(x, y + cut, w, h - cut)
+                if first and second:
+                    _carve_tunnel(mask, first.center, second.center, rand.random() < 0.5)
+                return first or second
+
+            # Hoja: una sala dentro (sus paredes caben en la hoja)
+            max_w, max_h = min(ROOM_MAX_SIZE, w - 1), min(ROOM_MAX_SIZE, h - 1)
+            if max_w < ROOM_MIN_SIZE or max_h < ROOM_MIN_SIZE:
+                return None
+            room_w = rand.randint(ROOM_MIN_SIZE, max_w)
+            room_h = rand.randint(ROOM_MIN_SIZE, max_h)
+            room = Room(rand.randint(x, x + w - room_w - 1), rand.randint(y, y + h - room_h - 1),
+                        room_w, room_h)
+            mask[room.inner] = True
+            rooms.append(room)
+            return room
+
+        split(1, 1, width - 2, height - 2)
+        mask[[0, -1], :] = False
+        mask[:, [0, -1]] = False
+        return _with_stairs(mask, rooms)
+
+
+class CaveEngine(GeneratorEngine):
+    """
+    Cuevas por autómata celular.
+
+    Reparte cámaras rectangulares (las salas que usa `_populate`), rellena
+    el resto con ruido, lo suaviza con la regla 4-5 y une las cámaras en
+    cadena con túneles. Las bolsas de cueva que no quedan conectadas a
+    ninguna cámara se rellenan de pared.
+    """
+
+    name = "caves"
+
+    def __init__(self, fill: float = 0.45, iterations: int = 4,
+                 area_per_room: int = 900) -> None:
+        """
+        Args:
+            fill: Proporción inicial de pared en el ruido
+            iterations: Pasadas del autómata
+            area_per_room: Celdas de mapa por cámara
+        """
+        self.fill = fill
+        self.iterations = iterations
+        self.area_per_room = area_per_room
+
+    def _place_rooms(self, width: int, height: int, rand: random.Random) -> List[Room]:
+        """Coloca cámaras sin solaparse (comprobación sobre una máscara)."""
+        occupied = np.zeros((width, height), dtype=bool)
+        target = max(2, width * height // self.area_per_room)
+        rooms: List[Room] = []
+        for _ in range(target * 3):
+            if len(rooms) >= target:
+                break
+            w = rand.randint(ROOM_MIN_SIZE, ROOM_MAX_SIZE)
+            h = rand.randint(ROOM_MIN_SIZE, ROOM_MAX_SIZE)
+            room = Room(rand.randint(1, width - w - 2), rand.randint(1, height - h - 2), w, h)
+            area = (slice(room.x, room.x2 + 1), slice(room.y, room.y2 + 1))
+            if not occupied[area].any():
+                occupied[area] = True
+                rooms.append(room)
+        return rooms
+
+    def _smooth(self, walls):
+        """Una pasada del autómata (pared si ≥5 vecinos pared, o 4 y ya era pared)."""
+        padded = np.pad(walls, 1, constant_values=True).astype(np.uint8)
+        width, height = walls.shape
+        neighbors = sum(
+            padded[1 + dx:1 + dx + width, 1 + dy:1 + dy + height]
+            for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy
+        )
+        return (neighbors >= 5) | ((neighbors == 4) & walls)
+
+    def generate(self, width: int, height: int, floor: int,
+                 rand: random.Random) -> GeneratedLayout:
+        rooms = self._place_rooms(width, height, rand)
+        noise = np.random.default_rng(rand.getrandbits(64))
+        walls = noise.random((width, height)) < self.fill
+
+        rooms_mask = np.zeros((width, height), dtype=bool)
+        interiors = np.zeros((width, height), dtype=bool)
+        for room in rooms:
+            rooms_mask[room.x:room.x2 + 1, room.y:room.y2 + 1] = True
+            interiors[room.inner] = True
+
+        for _ in range(self.iterations):
+            walls = self._smooth(walls)
+
+        # Cámaras: interior libre y anillo de pared (las entradas son los túneles)
+        mask = ~walls & ~rooms_mask
+        mask |= interiors
+        # Cadena por franjas verticales: túneles cortos entre cámaras vecinas
+        rooms.sort(key=lambda room: (room.center[0] // 64, room.center[1]))
+        for previous, room in zip(rooms, rooms[1:]):
+            _carve_tunnel(mask, previous.center, room.center, rand.random() < 0.5)
+        mask[[0, -1], :] = False
+        mask[:, [0, -1]] = False
+
+        # Quedarse con la cueva conectada a las cámaras (dilatación 4-vecinos)
+        reached = interiors & mask
+        while True:
+            grown = reached.copy()
+            grown[1:, :] |= reached[:-1, :]
+            grown[:-1, :] |= reached[1:, :]
+            grown[:, 1:] |= reached[:, :-1]
+            grown[:, :-1] |= reached[:, 1:]
+            grown &= mask
+            if np.array_equal(grown, reached):
+                break
+            reached = grown
+        return _with_stairs(reached, rooms)
+
+
+# Motores registrados (nombre → instancia)
+GENERATOR_ENGINES: Dict[str, GeneratorEngine] = {}
+
+# Motores incluidos que necesitan NumPy (sin él se usa el clásico)
+NUMPY_ENGINES = ("bsp", "caves")
+_warned_fallback: set = set()
+
+
+def register_engine(engine: GeneratorEngine) -> None:
+    """
+    Registra un motor para poder elegirlo por nombre.
+
+    Args:
+        engine: Instancia del motor
+    """
+    GENERATOR_ENGINES[engine.name] = engine
+
+
+def get_engine(name: str) -> Optional[GeneratorEngine]:
+    """
+    Obtiene un motor por nombre.
+
+    Args:
+        name: Nombre del motor ("classic" = algoritmo de Dungeon)
+
+    Returns:
+        El motor, o None si hay que usar el algoritmo clásico (también
+        cuando NumPy no está instalado)
+
+    Raises:
+        ValueError: Si el nombre no corresponde a ningún motor
+    """
+    if name == CLASSIC_ENGINE:
+        return None
+    if np is None and name in NUMPY_ENGINES:
+        if name not in _warned_fallback:
+            _warned_fallback.add(name)
+            print(f"[Generators] NumPy no disponible: '{name}' usa el algoritmo clásico")
+        return None
+    if name not in GENERATOR_ENGINES:
+        raise ValueError(f"Motor de generación desconocido: '{name}'")
+    return GENERATOR_ENGINES[name]
+
+
+if np is not None:
+    register_engine(BSPEngine())
+    register_engine(CaveEngine())
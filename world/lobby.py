@@ -6,7 +6,8 @@ from typing import TYPE_CHECKING, Dict, Any, Tuple, Optional, Set
 import random
 
 from .zone import Zone
-from .tile import Tile, TileType
+from .tile import TileType
+from .prefabs import load_prefab
 from ..config import MAP_WIDTH, MAP_HEIGHT
 
 if TYPE_CHECKING:
@@ -23,6 +24,7 @@ class Lobby(Zone):
     
     Attributes:
         dungeon_entrance: Posición de la entrada a la mazmorra
+        player_start: Posición inicial del jugador (la que devuelve generate)
     """
     
     def __init__(
@@ -39,8 +41,9 @@ class Lobby(Zone):
             height: Alto del mapa
             zone_id: Identificador único del lobby
         """
-        super().__init__(width, height, zone_id, "lobby")
+        super().__init__(width, height, zone_id, "lobby", fill=TileType.VOID)
         self.dungeon_entrance: Optional[Tuple[int, int]] = None
+        self.player_start: Optional[Tuple[int, int]] = None
 
         # Mantener compatibilidad con la interfaz de Dungeon
         self.stairs_down: Optional[Tuple[int, int]] = None
@@ -48,80 +51,36 @@ class Lobby(Zone):
     
     def generate(self) -> Tuple[int, int]:
         """
-        Genera el lobby con una estructura simple.
+        Genera el lobby estampando sus prefabs (ver world/prefabs.py).
         
         El lobby tiene:
-        - Una sala central grande
-        - Una entrada a la mazmorra (escaleras hacia abajo)
+        - Una sala central grande (layouts/lobby.json), con la entrada a la
+          mazmorra, la posición inicial y las ventanas
+        - El mobiliario de layouts/custom_layout.json (sofá, mesa...), en
+          coordenadas absolutas
         - Posiblemente NPCs o puntos de interés
         
         Returns:
-            Posición inicial del jugador (centro del lobby)
+            Posición inicial del jugador (abajo en la sala central)
         """
-        # Primero, convertir todos los tiles a VOID (negro) en lugar de WALL
-        for x in range(self.width):
-            for y in range(self.height):
-                self.tiles[x][y] = Tile(TileType.VOID)
+        # Sala centrada en el mapa (el resto ya es VOID desde __init__)
+        room = load_prefab("lobby")
+        room_x = self.width // 2 - room.width // 2
+        room_y = self.height // 2 - room.height // 2
+        markers = room.stamp(self, room_x, room_y)
         
-        # Crear una sala grande en el centro
-        center_x = self.width // 2
-        center_y = self.height // 2
-        room_width = min(25, self.width - 10)
-        room_height = min(15, self.height - 10)
-        
-        room_x = center_x - room_width // 2
-        room_y = center_y - room_height // 2
-        
-        # Crear las paredes alrededor de la sala
-        # Pared superior e inferior
-        for x in range(room_x - 1, room_x + room_width + 1):
-            if 0 <= x < self.width:
-                # Pared superior
-                if 0 <= room_y - 1 < self.height:
-                    self.tiles[x][room_y - 1] = Tile(TileType.WALL)
-                # Pared inferior
-                if 0 <= room_y + room_height < self.height:
-                    self.tiles[x][room_y + room_height] = Tile(TileType.WALL)
-        
-        # Paredes laterales (izquierda y derecha)
-        for y in range(room_y - 1, room_y + room_height + 1):
-            if 0 <= y < self.height:
-                # Pared izquierda
-                if 0 <= room_x - 1 < self.width:
-                    self.tiles[room_x - 1][y] = Tile(TileType.WALL)
-                # Pared derecha
-                if 0 <= room_x + room_width < self.width:
-                    self.tiles[room_x + room_width][y] = Tile(TileType.WALL)
-        
-        # Crear el suelo de la sala
-        for x in range(room_x, room_x + room_width):
-            for y in range(room_y, room_y + room_height):
-                if 0 <= x < self.width and 0 <= y < self.height:
-                    self.tiles[x][y] = Tile(TileType.FLOOR)
-        
-        # Colocar entrada a la mazmorra (escaleras hacia abajo)
-        # Misma X del centro, pero Y arriba pegada al muro superior de la sala
-        entrance_x = center_x
-        entrance_y = room_y + 1  # Una posición dentro de la sala, cerca del muro superior
-        self.tiles[entrance_x][entrance_y] = Tile(TileType.STAIRS_DOWN)
-        self.dungeon_entrance = (entrance_x, entrance_y)
+        # Entrada a la mazmorra (escaleras hacia abajo), pegada al muro superior
+        self.dungeon_entrance = markers["stairs_down"][0]
         self.stairs_down = self.dungeon_entrance
         
         # Posición inicial del jugador en el lado opuesto (abajo, cerca del muro inferior)
-        start_x = center_x
-        start_y = room_y + room_height - 2  # Cerca del muro inferior de la sala
-        
-        # Asegurar que la posición inicial es transitable
-        if not self.is_walkable(start_x, start_y):
-            start_x = center_x + 1
-            start_y = room_y + room_height - 2
+        start_x, start_y = markers["player_start"][0]
+        self.player_start = (start_x, start_y)
         
-        # Colocar ventanas con efecto de relámpago: luz entrando por la pared derecha
-        # Dos ventanas en columna (una encima de la otra)
-        window_x = room_x + room_width - 3  # En el suelo, cerca de la pared derecha
-        window_y = center_y - 1             # Primera ventana (arriba)
-        self.decorations[(window_x, window_y)] = ("ventanas", 0)
-        self.decorations[(window_x, window_y + 2)] = ("ventanas", 0)  # Segunda ventana (abajo, +2 tiles = 32px)
+        # Mobiliario editable (opcional)
+        furniture = load_prefab("custom_layout", optional=True)
+        if furniture:
+            furniture.stamp(self)
         
         # Spawnear NPCs basándose en configuración de estados
         self.spawn_npcs_from_states()
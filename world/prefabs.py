@@ -0,0 +1,218 @@
+"""
+Prefabs: salas diseñadas a mano en JSON (carpeta layouts/).
+
+Un layout JSON puede tener:
+- "tiles": filas de caracteres (ver TILE_LEGEND; " " deja el tile que
+  ya hubiera, así una sala puede tener forma irregular)
+- "objects": lista de {"type", "x", "y", "category", "metadata"}, con
+  categoría "decoration" (sofa, mesa, ventanas...) o "spawn" (marcadores
+  con nombre, p. ej. "player_start", que el generador interpreta)
+
+Las coordenadas de "tiles" y "objects" son relativas a la esquina donde
+se estampa el prefab (custom_layout.json se estampa en (0, 0), así que
+sus coordenadas son absolutas).
+
+Cada layout se compila una sola vez (`load_prefab` cachea por nombre) a
+tramos verticales de tipos de tile. Estampar es una asignación de slice
+por tramo de columna, sin recorrer la rejilla celda a celda.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+import json
+import os
+
+from .room import Room
+from .tile import Tile, TileType
+
+if TYPE_CHECKING:
+    from .zone import Zone
+
+
+# Carpeta de layouts del paquete
+LAYOUTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "layouts")
+
+# Caracteres de "tiles" → tipo de tile (" " = no tocar)
+TILE_LEGEND: Dict[str, TileType] = {
+    "#": TileType.WALL,
+    ".": TileType.FLOOR,
+    "+": TileType.DOOR,
+    ">": TileType.STAIRS_DOWN,
+    "<": TileType.STAIRS_UP,
+    "_": TileType.VOID,
+}
+KEEP_CHAR = " "
+
+# Marcadores que se generan solos a partir de los tiles
+_STAIRS_MARKERS = {TileType.STAIRS_DOWN: "stairs_down", TileType.STAIRS_UP: "stairs_up"}
+
+
+class Prefab:
+    """
+    Layout compilado, listo para estamparse.
+
+    Attributes:
+        name: Nombre del layout
+        width: Ancho en tiles
+        height: Alto en tiles
+        columns: Por columna, tramos (y inicial, tipos de tile)
+        doors: Puertas (x, y, orientación) relativas
+        decorations: Decoraciones (x, y, tipo, ángulo) relativas
+        markers: Marcadores {nombre: [(x, y), ...]} relativos
+    """
+
+    __slots__ = ("name", "width", "height", "columns", "doors", "decorations", "markers")
+
+    def __init__(self, name: str, data: Dict[str, Any]) -> None:
+        """
+        Compila un layout.
+
+        Args:
+            name: Nombre del layout (para mensajes)
+            data: Contenido del JSON
+
+        Raises:
+            ValueError: Si hay caracteres o categorías desconocidas
+        """
+        self.name = name
+        rows: List[str] = data.get("tiles", [])
+        self.height = len(rows)
+        self.width = max((len(row) for row in rows), default=0)
+        self.columns: List[List[Tuple[int, Tuple[TileType, ...]]]] = []
+        self.doors: List[Tuple[int, int, str]] = []
+        self.decorations: List[Tuple[int, int, str, int]] = []
+        self.markers: Dict[str, List[Tuple[int, int]]] = {}
+
+        def char_at(x: int, y: int) -> str:
+            row = rows[y] if 0 <= y < self.height else ""
+            return row[x] if 0 <= x < len(row) else KEEP_CHAR
+
+        for x in range(self.width):
+            runs: List[Tuple[int, Tuple[TileType, ...]]] = []
+            run_start, run_types = 0, []
+            for y in range(self.height + 1):
+                char = char_at(x, y) if y < self.height else KEEP_CHAR
+                if char == KEEP_CHAR:
+                    if run_types:
+                        runs.append((run_start, tuple(run_types)))
+                    run_start, run_types = y + 1, []
+                    continue
+                if char not in TILE_LEGEND:
+                    raise ValueError(f"Layout '{name}': carácter desconocido '{char}' en ({x}, {y})")
+                tile_type = TILE_LEGEND[char]
+                run_types.append(tile_type)
+                if tile_type == TileType.DOOR:
+                    # Mismo convenio que Dungeon._place_doors: paredes a los lados = horizontal
+                    walls = TILE_LEGEND.get(char_at(x - 1, y)) == TileType.WALL and \
+                        TILE_LEGEND.get(char_at(x + 1, y)) == TileType.WALL
+                    self.doors.append((x, y, "horizontal" if walls else "vertical"))
+                elif tile_type in _STAIRS_MARKERS:
+                    self.markers.setdefault(_STAIRS_MARKERS[tile_type], []).append((x, y))
+            self.columns.append(runs)
+
+        for obj in data.get("objects", []):
+            category = obj.get("category", "decoration")
+            position = (int(obj["x"]), int(obj["y"]))
+            if category == "decoration":
+                angle = int(obj.get("metadata", {}).get("angle", 0))
+                self.decorations.append((*position, obj["type"], angle))
+            elif category == "spawn":
+                self.markers.setdefault(obj["type"], []).append(position)
+            else:
+                raise ValueError(f"Layout '{name}': categoría desconocida '{category}'")
+
+    def stamp(self, zone: 'Zone', x: int = 0, y: int = 0) -> Dict[str, List[Tuple[int, int]]]:
+        """
+        Copia el prefab en una zona (lo que quede fuera del mapa se recorta).
+
+        En una mazmorra se debe estampar durante la generación (antes de
+        `_capture_baseline`): así forma parte del mapa regenerable y no
+        del diff guardado.
+
+        Args:
+            zone: Zona destino (Lobby, Dungeon...)
+            x: Columna de la esquina superior izquierda
+            y: Fila de la esquina superior izquierda
+
+        Returns:
+            Marcadores en coordenadas absolutas {nombre: [(x, y), ...]}
+        """
+        width, height = zone.width, zone.height
+        for dx, runs in enumerate(self.columns):
+            column_x = x + dx
+            if not 0 <= column_x < width:
+                continue
+            column = zone.tiles[column_x]
+            for start, types in runs:
+                first, last = max(0, y + start), min(height, y + start + len(types))
+                if first < last:
+                    offset = first - y - start
+                    column[first:last] = [Tile(t) for t in types[offset:offset + last - first]]
+
+        def inside(cell_x: int, cell_y: int) -> bool:
+            return 0 <= cell_x < width and 0 <= cell_y < height
+
+        door_cells = getattr(zone, "door_cells", None)
+        for dx, dy, orientation in self.doors:
+            cell = (x + dx, y + dy)
+            if inside(*cell):
+                zone.tiles[cell[0]][cell[1]].orientation = orientation
+                if door_cells is not None:
+                    door_cells.add(cell)
+
+        for dx, dy, deco_type, angle in self.decorations:
+            if inside(x + dx, y + dy):
+                zone.decorations[(x + dx, y + dy)] = (deco_type, angle)
+
+        return {
+            marker: [(x + dx, y + dy) for dx, dy in cells if inside(x + dx, y + dy)]
+            for marker, cells in self.markers.items()
+        }
+
+    def room_at(self, x: int, y: int) -> Room:
+        """
+        Sala que ocupa el prefab estampado en (x, y), con las paredes en el
+        borde (mismo convenio que Room), para añadirla a `Dungeon.rooms`.
+
+        Args:
+            x: Columna de la esquina superior izquierda
+            y: Fila de la esquina superior izquierda
+
+        Returns:
+            Sala con los límites del prefab
+        """
+        return Room(x, y, self.width - 1, self.height - 1)
+
+
+# Prefabs ya compilados (nombre → Prefab)
+_prefab_cache: Dict[str, Prefab] = {}
+
+
+def load_prefab(name: str, optional: bool = False) -> Optional[Prefab]:
+    """
+    Carga y compila un layout de la carpeta layouts/ (una vez por nombre).
+
+    Args:
+        name: Nombre del archivo sin ".json"
+        optional: Si True, devuelve None cuando el archivo no existe
+
+    Returns:
+        Prefab compilado (None si falta y es opcional)
+
+    Raises:
+        FileNotFoundError: Si falta y no es opcional
+        ValueError: Si el layout no es válido
+    """
+    if name in _prefab_cache:
+        return _prefab_cache[name]
+    path = os.path.join(LAYOUTS_DIR, f"{name}.json")
+    if optional and not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        prefab = Prefab(name, json.load(f))
+    _prefab_cache[name] = prefab
+    return prefab
+
+
+def clear_prefab_cache() -> None:
+    """Olvida los prefabs compilados (para recargar layouts editados)."""
+    _prefab_cache.clear()
@@ -0,0 +1,202 @@
+"""
+Validación de pisos generados: alcanzabilidad desde la entrada.
+
+Hace un flood fill (BFS) sobre la máscara transitable, con las puertas
+como transitables y las celdas ocupadas por NPCs (que no se mueven) como
+bloqueadas, y comprueba que todas las celdas, salas, objetos y escaleras
+son alcanzables desde la entrada.
+
+Con NumPy el BFS avanza por fronteras sobre índices planos (un paso
+vectorizado por anillo de distancia); sin NumPy se usa un BFS con deque.
+Cuesta ~1ms en un piso normal, así que se ejecuta en cada piso nuevo,
+con sus NPCs ya colocados (ver `Dungeon.validate`).
+"""
+from __future__ import annotations
+from collections import deque
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .tile import TileType, TILE_PROPERTIES
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+if TYPE_CHECKING:
+    from .dungeon import Dungeon
+
+
+# Tipos de tile transitables para la validación (puertas siempre)
+PASSABLE_TYPES = frozenset(
+    tile_type for tile_type in TileType
+    if TILE_PROPERTIES[tile_type].walkable or tile_type == TileType.DOOR
+)
+
+
+def _passable_cells(dungeon: 'Dungeon') -> List[bool]:
+    """
+    Construye la máscara transitable aplanada (índice = x * alto + y).
+
+    Args:
+        dungeon: Piso a validar
+
+    Returns:
+        Lista de booleanos, una por celda
+    """
+    passable = [
+        tile.tile_type in PASSABLE_TYPES
+        for column in dungeon.tiles
+        for tile in column
+    ]
+    # Los NPCs no se apartan: bloquean su celda (los monstruos sí se mueven)
+    height = dungeon.height
+    for entity in dungeon.entities:
+        if entity.blocks and not getattr(entity, "monster_type", None):
+            passable[entity.x * height + entity.y] = False
+    return passable
+
+
+def _bfs_numpy(passable: List[bool], width: int, height: int, start: int) -> Any:
+    """BFS por fronteras vectorizado. Devuelve distancias (-1 = inalcanzable)."""
+    mask = np.array(passable, dtype=bool)
+    # Bordes como pared: así los vecinos ±1 / ±alto nunca salen de la columna
+    grid = mask.reshape(width, height)
+    grid[[0, -1], :] = False
+    grid[:, [0, -1]] = False
+
+    distance = np.full(width * height, -1, dtype=np.int32)
+    # Quita repetidos de la frontera en O(n): cada celda apunta a su última
+    # aparición y solo esa sobrevive (más barato que np.unique, que ordena)
+    last_seen = np.empty(width * height, dtype=np.int64)
+    offsets = np.array([1, -1, height, -height])
+    frontier = np.array([start])
+    distance[start] = 0
+    step = 0
+    while frontier.size:
+        step += 1
+        neighbors = (frontier[:, None] + offsets).ravel()
+        neighbors = neighbors[mask[neighbors] & (distance[neighbors] < 0)]
+        positions = np.arange(neighbors.size)
+        last_seen[neighbors] = positions
+        frontier = neighbors[last_seen[neighbors] == positions]
+        distance[frontier] = step
+    return distance
+
+
+def _bfs_python(passable: List[bool], width: int, height: int, start: int) -> List[int]:
+    """BFS con deque (sin NumPy). Devuelve distancias (-1 = inalcanzable)."""
+    distance = [-1] * (width * height)
+    distance[start] = 0
+    queue = deque([start])
+    while queue:
+        index = queue.popleft()
+        x, y = divmod(index, height)
+        next_distance = distance[index] + 1
+        for neighbor, inside in (
+            (index + 1, y + 1 < height - 1),
+            (index - 1, y - 1 > 0),
+            (index + height, x + 1 < width - 1),
+            (index - height, x - 1 > 0),
+        ):
+            if inside and passable[neighbor] and distance[neighbor] < 0:
+                distance[neighbor] = next_distance
+                queue.append(neighbor)
+    return distance
+
+
+def validate_dungeon(dungeon: 'Dungeon', start: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+    """
+    Comprueba que todo el piso es alcanzable desde la entrada.
+
+    Args:
+        dungeon: Piso generado
+        start: Celda de partida (None = escaleras arriba o centro de la
+            primera sala)
+
+    Returns:
+        Informe: ok, salas, celdas transitables/alcanzables/inalcanzables,
+        salas, objetos y escaleras inalcanzables y longitud del camino
+        entre escaleras (None si falta alguna)
+    """
+    width, height = dungeon.width, dungeon.height
+    passable = _passable_cells(dungeon)
+
+    if start is None:
+        start = dungeon.stairs_up or (dungeon.rooms[0].center if dungeon.rooms else None)
+    report: Dict[str, Any] = {
+        "ok": False,
+        "rooms": len(dungeon.rooms),
+        "passable": sum(passable),
+        "reachable": 0,
+        "unreachable": 0,
+        "unreachable_rooms": [],
+        "unreachable_items": 0,
+        "stairs_reachable": False,
+        "stairs_path": None,
+    }
+    if start is None:
+        return report
+
+    start_index = start[0] * height + start[1]
+    passable[start_index] = True
+    if np is not None:
+        distance = _bfs_numpy(passable, width, height, start_index)
+        reachable = int((distance >= 0).sum())
+    else:
+        distance = _bfs_python(passable, width, height, start_index)
+        reachable = sum(1 for d in distance if d >= 0)
+
+    def reached(cell: Tuple[int, int]) -> bool:
+        return distance[cell[0] * height + cell[1]] >= 0
+
+    report["reachable"] = reachable
+    report["unreachable"] = sum(passable) - reachable
+    report["unreachable_rooms"] = [
+        index for index, room in enumerate(dungeon.rooms) if not reached(room.center)
+    ]
+    report["unreachable_items"] = sum(1 for item in dungeon.items if not reached((item.x, item.y)))
+
+    stairs = [cell for cell in (dungeon.stairs_up, dungeon.stairs_down) if cell]
+    report["stairs_reachable"] = all(reached(cell) for cell in stairs)
+    if dungeon.stairs_up and dungeon.stairs_down and report["stairs_reachable"]:
+        x, y = dungeon.stairs_down
+        report["stairs_path"] = int(distance[x * height + y]) - int(
+            distance[dungeon.stairs_up[0] * height + dungeon.stairs_up[1]]
+        )
+
+    report["ok"] = (
+        report["unreachable"] == 0
+        and not report["unreachable_rooms"]
+        and report["unreachable_items"] == 0
+        and report["stairs_reachable"]
+    )
+    return report
+
+
+def format_validation(report: Dict[str, Any], floor: int) -> List[str]:
+    """
+    Formatea un informe de validate_dungeon().
+
+    Args:
+        report: Informe
+        floor: Número de piso
+
+    Returns:
+        Líneas legibles
+    """
+    status = "✓" if report["ok"] else "⚠"
+    path = report["stairs_path"]
+    lines = [
+        f"{status} Piso {floor}: {report['rooms']} salas, "
+        f"{report['reachable']}/{report['passable']} celdas alcanzables, "
+        f"camino entre escaleras {path if path is not None else '-'}"
+    ]
+    if report["unreachable"]:
+        lines.append(f"  {report['unreachable']} celdas inalcanzables")
+    if report["unreachable_rooms"]:
+        lines.append(f"  Salas inalcanzables: {report['unreachable_rooms']}")
+    if report["unreachable_items"]:
+        lines.append(f"  {report['unreachable_items']} objetos inalcanzables")
+    if not report["stairs_reachable"]:
+        lines.append("  Escaleras inalcanzables")
+    return lines
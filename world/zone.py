@@ -29,6 +29,7 @@ class Zone(ABC):
         entities: Lista de entidades
         items: Lista de items en el suelo
         decorations: Decoraciones del suelo {(x,y): sprite_key}
+        map_version: Contador de cambios de tiles tras la generación
     """
     
     def __init__(
@@ -36,7 +37,8 @@ class Zone(ABC):
         width: int,
         height: int,
         zone_id: str,
-        zone_type: str
+        zone_type: str,
+        fill: TileType = TileType.WALL
     ) -> None:
         """
         Inicializa una zona vacía.
@@ -46,6 +48,7 @@ class Zone(ABC):
             height: Alto del mapa
             zone_id: Identificador único de la zona
             zone_type: Tipo de zona (lobby, dungeon, etc.)
+            fill: Tipo de tile con el que empieza todo el mapa
         """
         self.width = width
         self.height = height
@@ -54,13 +57,16 @@ class Zone(ABC):
         
         # Crear mapa vacío (todo paredes/void)
         self.tiles: List[List[Tile]] = [
-            [Tile(TileType.WALL) for _ in range(height)]
+            [Tile(fill) for _ in range(height)]
             for _ in range(width)
         ]
         
         self.entities: List[Entity] = []
         self.items: List[Item] = []
         self.decorations: Dict[Tuple[int, int], Tuple[str, int]] = {}  # {(x,y): ("blood", angle), ...}
+        
+        # Se incrementa al sustituir tiles tras generar (invalida la capa de terreno)
+        self.map_version: int = 0
     
     @abstractmethod
     def generate(self) -> Tuple[int, int]: